@@ -42,6 +42,7 @@ from engelberg.analysis import (
 from engelberg.monte_carlo import (
     run_monte_carlo_simulation,
     calculate_statistics,
+    calculate_npv_statistics,
 )
 
 __all__ = [
@@ -77,4 +78,5 @@ __all__ = [
     # Monte Carlo functions
     'run_monte_carlo_simulation',
     'calculate_statistics',
+    'calculate_npv_statistics',
 ]
@@ -54,6 +54,7 @@ import os
 import sys
 import json
 import argparse
+from dataclasses import replace
 from typing import Dict, List, Any
 
 # ===========================================================================
@@ -80,7 +81,6 @@ from engelberg.core import (
     export_monte_carlo_sensitivity_to_json,  # Exports MC Sensitivity results to JSON
     
     # Data structures
-    BaseCaseConfig,                 # Main configuration object
     FinancingParams,                # Financing parameters
     LoanTranche,                    # Loan tranche structure
     RentalParams,                   # Rental income parameters
@@ -148,8 +148,9 @@ def save_json(data: Dict, case_name: str, analysis_type: str) -> str:
     os.makedirs(data_dir, exist_ok=True)
     output_path = os.path.join(data_dir, f"{case_name}_{analysis_type}.json")
     
+    # Encode up front and write once; json.dump issues a write() per token
     with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=2, ensure_ascii=False, default=str)
+        f.write(json.dumps(data, indent=2, ensure_ascii=False, default=str))
     
     # Return relative path for compatibility
     return f"website/data/{case_name}_{analysis_type}.json"
@@ -238,20 +239,23 @@ def run_base_case_analysis(json_path: str, case_name: str, verbose: bool = True)
         }
     
     # Step 3: Build by_horizon (projection + IRR + KPIs for each horizon)
+    # A projection's first N years do not depend on how many years follow, so the
+    # longest horizon is projected once and every horizon uses a prefix of it
+    full_projection = compute_15_year_projection(
+        config,
+        start_year=proj_defaults['start_year'],
+        inflation_rate=proj_defaults['inflation_rate'],
+        property_appreciation_rate=proj_defaults['property_appreciation_rate'],
+        projection_years=max(HORIZONS),
+        ramp_up_months=ramp_up_months,
+        renovation_downtime_months=renovation_downtime_months,
+        renovation_frequency_years=renovation_frequency_years
+    )
     by_horizon = {}
     projection_15y = None
     irr_15y = None
     for horizon in HORIZONS:
-        proj = compute_15_year_projection(
-            config,
-            start_year=proj_defaults['start_year'],
-            inflation_rate=proj_defaults['inflation_rate'],
-            property_appreciation_rate=proj_defaults['property_appreciation_rate'],
-            projection_years=horizon,
-            ramp_up_months=ramp_up_months,
-            renovation_downtime_months=renovation_downtime_months,
-            renovation_frequency_years=renovation_frequency_years
-        )
+        proj = full_projection[:horizon]
         final_pv = proj[-1]['property_value']
         final_loan = proj[-1]['remaining_loan_balance']
         irr_out = calculate_irrs_from_projection(
@@ -361,7 +365,7 @@ def run_monte_carlo_analysis(json_path: str, case_name: str,
     
     # Run simulations
     # This returns a DataFrame with one row per simulation
-    df = run_monte_carlo_simulation(config, num_simulations=n_simulations)
+    df = run_monte_carlo_simulation(config, num_simulations=n_simulations, verbose=verbose)
     
     # Calculate summary statistics
     stats = calculate_statistics(df)
@@ -393,21 +397,10 @@ def _clone_financing_with_tranches(
     saron_base_rate: float,
 ) -> FinancingParams:
     """Clone financing terms while replacing loan tranches."""
-    return FinancingParams(
-        purchase_price=base_financing.purchase_price,
-        ltv=base_financing.ltv,
-        interest_rate=base_financing.interest_rate,
-        amortization_rate=base_financing.amortization_rate,
-        num_owners=base_financing.num_owners,
-        notary_fee_rate=base_financing.notary_fee_rate,
-        legal_doc_fee_rate=base_financing.legal_doc_fee_rate,
-        agency_fee_rate_buyer=base_financing.agency_fee_rate_buyer,
-        inspection_chf=base_financing.inspection_chf,
-        interior_designer_chf=base_financing.interior_designer_chf,
-        furniture_chf=base_financing.furniture_chf,
+    return replace(
+        base_financing,
         loan_tranches=loan_tranches,
         saron_base_rate=saron_base_rate,
-        stress=base_financing.stress,
     )
 
 
@@ -628,12 +621,7 @@ def run_loan_structure_sensitivity_analysis(
             loan_tranches=scenario["loan_tranches"],
             saron_base_rate=saron_base_rate,
         )
-        scenario_config = BaseCaseConfig(
-            financing=scenario_financing,
-            rental=base_config.rental,
-            expenses=base_config.expenses,
-            projection=base_config.projection,
-        )
+        scenario_config = replace(base_config, financing=scenario_financing)
 
         year1_results = compute_annual_cash_flows(
             scenario_config,
@@ -648,6 +636,7 @@ def run_loan_structure_sensitivity_analysis(
             ramp_up_months=ramp_up_months,
             renovation_downtime_months=renovation_downtime_months,
             renovation_frequency_years=renovation_frequency_years,
+            include_stress_results=False,
         )
         irr_results = calculate_irrs_from_projection(
             projection=projection,
@@ -966,10 +955,17 @@ Examples:
         # Sensitivity Analysis (Equity IRR)
         if args.analysis in ['all', 'sensitivity']:
             results['sensitivity'] = run_sensitivity_analysis(json_path, case_name, verbose)
+            # Cash-on-Cash and Monthly NCF are both derived from the Year 1 cash flow
+            # per owner, so the two runs share it instead of projecting it twice
+            year1_cache = {}
             # Also run Cash-on-Cash sensitivity
-            results['sensitivity_coc'] = run_cash_on_cash_sensitivity_analysis(json_path, case_name, verbose)
+            results['sensitivity_coc'] = run_cash_on_cash_sensitivity_analysis(
+                json_path, case_name, verbose, year1_cache=year1_cache
+            )
             # Also run Monthly NCF sensitivity
-            results['sensitivity_ncf'] = run_monthly_ncf_sensitivity_analysis(json_path, case_name, verbose)
+            results['sensitivity_ncf'] = run_monthly_ncf_sensitivity_analysis(
+                json_path, case_name, verbose, year1_cache=year1_cache
+            )
         
         # Monte Carlo Simulation
         if args.analysis in ['all', 'monte_carlo']:
@@ -3,8 +3,9 @@ Real Estate Investment Simulation for Engelberg Property
 Refined version with comprehensive financial modeling
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from typing import Dict, List, Optional, Any, Tuple
+import numpy as np
 import pandas as pd
 from datetime import datetime
 import json
@@ -18,6 +19,12 @@ import os
 # Supported time horizons (years) for projections. Used by base case and sensitivity; Monte Carlo stays at 15.
 HORIZONS = [5, 10, 15, 20, 25, 30, 35, 40]
 
+# Default exit costs at sale, shared by the scalar IRR functions and the batch Monte Carlo engine.
+# Selling costs and transfer tax apply to the sale price, capital gains tax to the gain over purchase.
+SELLING_COSTS_RATE = 0.078
+CAPITAL_GAINS_TAX_RATE = 0.02
+PROPERTY_TRANSFER_TAX_SALE_RATE = 0.015
+
 
 # -----------------------------
 # Path Resolution Utilities
@@ -287,7 +294,7 @@ class ProjectionParams:
     ramp_up_months: int = 3  # Pre-operational period before starting rentals
     renovation_downtime_months: int = 3  # No-revenue downtime during renovation windows
     renovation_frequency_years: int = 5  # Renovation downtime repeats every N years
-    selling_costs_rate: float = 0.078
+    selling_costs_rate: float = SELLING_COSTS_RATE
 
 
 @dataclass
@@ -583,6 +590,39 @@ def load_assumptions_from_json(json_path: str = "assumptions.json") -> Dict:
     return assumptions
 
 
+# Projection defaults per resolved assumptions path, stored with the file signature
+# they were read under (sensitivity runs request them once per evaluated point)
+_PROJECTION_DEFAULTS_CACHE: Dict[str, Tuple[Tuple, Dict[str, Any]]] = {}
+
+
+def _assumptions_signature(json_path: str) -> Optional[Tuple]:
+    """
+    Modification time and size of an assumptions file and the base files it may be merged with.
+    
+    Args:
+        json_path: Resolved path to the assumptions JSON file
+    
+    Returns:
+        Tuple identifying the current file contents, or None if the file cannot be stat'ed
+    """
+    project_root = get_project_root()
+    paths = [
+        json_path,
+        os.path.join(project_root, "assumptions.json"),
+        os.path.join(project_root, "assumptions", "assumptions.json"),
+    ]
+    signature = []
+    for path in paths:
+        try:
+            st = os.stat(path)
+        except OSError:
+            if path == json_path:
+                return None
+            continue
+        signature.append((path, st.st_mtime_ns, st.st_size))
+    return tuple(signature)
+
+
 def get_projection_defaults(json_path: str = "assumptions.json") -> Dict[str, Any]:
     """
     Get projection default values from JSON.
@@ -590,6 +630,9 @@ def get_projection_defaults(json_path: str = "assumptions.json") -> Dict[str, An
     This helper function allows analysis scripts to use the same projection defaults
     as defined in the assumptions.json file, ensuring consistency.
     
+    Results are cached per file and reused until the file (or the base
+    assumptions it is merged with) changes on disk; each call returns a copy.
+    
     Args:
         json_path: Path to the assumptions JSON file (default: "assumptions.json")
                    Can be relative to project root or absolute path
@@ -597,6 +640,20 @@ def get_projection_defaults(json_path: str = "assumptions.json") -> Dict[str, An
     Returns:
         Dictionary with projection parameters including rates, years, and selling costs
     """
+    resolved_path = json_path if os.path.isabs(json_path) else resolve_path(json_path)
+    signature = _assumptions_signature(resolved_path)
+    cached = _PROJECTION_DEFAULTS_CACHE.get(resolved_path)
+    if signature is not None and cached is not None and cached[0] == signature:
+        defaults = cached[1]
+    else:
+        defaults = _read_projection_defaults(resolved_path)
+        if signature is not None:
+            _PROJECTION_DEFAULTS_CACHE[resolved_path] = (signature, defaults)
+    return {**defaults, 'saron_shocks_bps': list(defaults['saron_shocks_bps'])}
+
+
+def _read_projection_defaults(json_path: str) -> Dict[str, Any]:
+    """Load the assumptions file and extract projection defaults (uncached)."""
     assumptions = load_assumptions_from_json(json_path)
     projection = assumptions['projection']
     financing = assumptions.get('financing', {})
@@ -1238,7 +1295,8 @@ def compute_15_year_projection(config: BaseCaseConfig, start_year: int = 2026,
                                appreciation_series: Optional[List[float]] = None,
                                maintenance_events: Optional[List[Tuple[int, float]]] = None,
                                market_shocks: Optional[Dict[int, Dict[str, float]]] = None,
-                               refinancing_events: Optional[Dict[int, Dict[str, float]]] = None) -> List[Dict[str, any]]:
+                               refinancing_events: Optional[Dict[int, Dict[str, float]]] = None,
+                               include_stress_results: bool = True) -> List[Dict[str, any]]:
     """
     Compute multi-year projection of cash flows and financial metrics.
     
@@ -1257,6 +1315,10 @@ def compute_15_year_projection(config: BaseCaseConfig, start_year: int = 2026,
         ramp_up_months: Pre-operational period in months (default 0 for backward compatibility)
         renovation_downtime_months: No-revenue months in renovation years
         renovation_frequency_years: Renovation cycle frequency in years (e.g., 5 = every 5 years)
+        include_stress_results: Whether to run the SARON shock stress tests for every year
+                                (default True). Callers that only consume cash flows and the
+                                final-year values (IRR, sensitivities) pass False; each year's
+                                'stress_results' is then None
     
     Returns a list of dictionaries, one for each year.
     """
@@ -1340,6 +1402,17 @@ def compute_15_year_projection(config: BaseCaseConfig, start_year: int = 2026,
     renovation_downtime_months = max(0, int(renovation_downtime_months))
     renovation_frequency_years = max(0, int(renovation_frequency_years))
     
+    # Loop invariants: bind config attributes to locals once instead of per year
+    financing = config.financing
+    has_tranches = bool(financing.loan_tranches)
+    purchase_price = financing.purchase_price
+    num_owners = financing.num_owners
+    amortization_payment = initial_loan_amount * financing.amortization_rate  # Use stored initial loan amount
+    property_management_fee_rate = config.expenses.property_management_fee_rate
+    tourist_tax_per_person_per_night = config.expenses.tourist_tax_per_person_per_night
+    vat_rate_on_gross_rental = config.expenses.vat_rate_on_gross_rental
+    maintenance_rate = config.expenses.maintenance_rate
+    
     for year_num in range(1, projection_years + 1):
         # Apply inflation and appreciation (using pre-calculated factors)
         inflation_factor = inflation_factors[year_num - 1]
@@ -1388,7 +1461,7 @@ def compute_15_year_projection(config: BaseCaseConfig, start_year: int = 2026,
         if refinancing_events and year_num in refinancing_events:
             refi = refinancing_events[year_num]
             if refi.get('refinance', False):
-                if config.financing.loan_tranches:
+                if has_tranches:
                     current_saron_base_rate = float(refi['new_rate'])
                 else:
                     current_interest_rate = float(refi['new_rate'])
@@ -1424,14 +1497,14 @@ def compute_15_year_projection(config: BaseCaseConfig, start_year: int = 2026,
         
         # Property management on revenue AFTER platform fees AND cleaning fees
         revenue_after_platform_and_cleaning = net_rental_income - cleaning_cost
-        property_management_cost = revenue_after_platform_and_cleaning * config.expenses.property_management_fee_rate
+        property_management_cost = revenue_after_platform_and_cleaning * property_management_fee_rate
         
         # Tourist tax: recalculate based on actual rented_nights and avg_guests for this year
         # Tourist tax = rented_nights x avg_guests_per_night x tourist_tax_per_person_per_night
-        tourist_tax = rented_nights * avg_guests * config.expenses.tourist_tax_per_person_per_night
+        tourist_tax = rented_nights * avg_guests * tourist_tax_per_person_per_night
         
         # VAT on gross short-term rental revenue
-        vat_cost = gross_rental_income * config.expenses.vat_rate_on_gross_rental
+        vat_cost = gross_rental_income * vat_rate_on_gross_rental
         
         # Fixed expenses (insurance, nubbing costs) inflate and paid for full year (even during ramp-up)
         insurance = base_insurance * inflation_factor
@@ -1445,8 +1518,8 @@ def compute_15_year_projection(config: BaseCaseConfig, start_year: int = 2026,
         
         # Maintenance reserve based on appreciated property value (1% of current property value)
         # Apply market shock to property value
-        current_property_value = config.financing.purchase_price * appreciation_factor * shock_multiplier_value
-        maintenance_reserve = current_property_value * config.expenses.maintenance_rate
+        current_property_value = purchase_price * appreciation_factor * shock_multiplier_value
+        maintenance_reserve = current_property_value * maintenance_rate
         
         # Major maintenance events (one-time expenses)
         major_maintenance_cost = 0.0
@@ -1479,23 +1552,22 @@ def compute_15_year_projection(config: BaseCaseConfig, start_year: int = 2026,
         net_operating_income = net_rental_income - total_operating_expenses
         
         # Calculate debt service based on current loan balance (tranche-aware)
-        rate_input = current_saron_base_rate if config.financing.loan_tranches else current_interest_rate
+        rate_input = current_saron_base_rate if has_tranches else current_interest_rate
         interest_payment, blended_interest_rate, annual_interest_by_tranche = _compute_interest_for_balance(
-            financing=config.financing,
+            financing=financing,
             loan_balance=current_loan,
             current_saron_base_rate=rate_input,
         )
-        amortization_payment = initial_loan_amount * config.financing.amortization_rate  # Use stored initial loan amount
         debt_service = interest_payment + amortization_payment
         
         cash_flow_after_debt_service = net_operating_income - debt_service
-        cash_flow_per_owner = cash_flow_after_debt_service / config.financing.num_owners
+        cash_flow_per_owner = cash_flow_after_debt_service / num_owners
         
         # Tax Calculations (same logic as annual) - use provided tax rate
         taxable_income = net_operating_income - interest_payment  # Only interest deductible
         tax_liability = max(0.0, taxable_income) * tax_rate
         tax_savings_total = interest_payment * tax_rate
-        tax_savings_per_owner = tax_savings_total / config.financing.num_owners
+        tax_savings_per_owner = tax_savings_total / num_owners
         
         # After-Tax Cash Flow
         after_tax_cash_flow_total = cash_flow_after_debt_service + tax_savings_total
@@ -1508,7 +1580,7 @@ def compute_15_year_projection(config: BaseCaseConfig, start_year: int = 2026,
         debt_coverage_ratio = net_operating_income / debt_service if debt_service > 0 else 0
         cap_rate = (net_operating_income / current_property_value) * 100
         stress_results = _compute_stress_results(
-            financing=config.financing,
+            financing=financing,
             net_operating_income=net_operating_income,
             loan_balance=current_loan,
             amortization_payment=amortization_payment,
@@ -1516,7 +1588,7 @@ def compute_15_year_projection(config: BaseCaseConfig, start_year: int = 2026,
             base_debt_service=debt_service,
             base_blended_interest_rate=blended_interest_rate,
             current_saron_base_rate=rate_input,
-        )
+        ) if include_stress_results else None
         
         # Update loan balance after calculating debt service for this year
         # (loan balance at start of year is used for interest calculation)
@@ -1564,10 +1636,456 @@ def compute_15_year_projection(config: BaseCaseConfig, start_year: int = 2026,
     return projection
 
 
+# -----------------------------
+# Vectorized (batch) calculation kernels
+# -----------------------------
+# Array twins of compute_annual_cash_flows / compute_15_year_projection used by
+# the Monte Carlo engine. Per-simulation inputs are 1-D arrays of length N (or
+# scalars, which broadcast); projection outputs are (N, projection_years)
+# arrays. The arithmetic mirrors the scalar functions term for term.
+
+def _compute_interest_for_balance_vec(
+    financing: FinancingParams,
+    loan_balance: Any,
+    current_rate: Any,
+) -> Tuple[Any, Any]:
+    """
+    Array version of _compute_interest_for_balance (without the per-tranche breakdown).
+
+    Args:
+        financing: Financing parameters (tranche structure)
+        loan_balance: Loan balance(s), broadcastable against current_rate
+        current_rate: SARON base rate (tranche mode) or single interest rate
+
+    Returns:
+        interest_payment, blended_interest_rate
+    """
+    loan_balance = np.maximum(0.0, loan_balance)
+
+    if not financing.loan_tranches:
+        return loan_balance * current_rate, current_rate
+
+    interest_payment = 0.0
+    blended_interest_rate = 0.0
+    for tranche in financing.loan_tranches:
+        tranche_balance = loan_balance * tranche.share_of_loan
+        if tranche.rate_type == 'fixed':
+            tranche_rate = float(tranche.fixed_rate or 0.0)
+        else:
+            tranche_rate = current_rate + float(tranche.saron_margin or 0.0)
+        interest_payment = interest_payment + tranche_balance * tranche_rate
+        blended_interest_rate = blended_interest_rate + tranche.share_of_loan * tranche_rate
+
+    return interest_payment, blended_interest_rate
+
+
+def compute_annual_cash_flows_vec(config: BaseCaseConfig,
+                                  gross_rental_income: Optional[np.ndarray] = None,
+                                  rented_nights: Optional[np.ndarray] = None,
+                                  operational_months: int = 12,
+                                  ota_booking_percentage: Optional[np.ndarray] = None,
+                                  ota_fee_rate: Optional[np.ndarray] = None,
+                                  average_length_of_stay: Optional[np.ndarray] = None,
+                                  avg_guests_per_night: Optional[np.ndarray] = None,
+                                  cleaning_cost_per_stay: Optional[np.ndarray] = None,
+                                  marginal_tax_rate: Optional[np.ndarray] = None,
+                                  electricity_internet_annual: Optional[np.ndarray] = None,
+                                  maintenance_rate: Optional[np.ndarray] = None) -> Dict[str, np.ndarray]:
+    """
+    Batch version of compute_annual_cash_flows for N parameter draws at once.
+
+    Args:
+        config: Configuration supplying every parameter not overridden below
+        gross_rental_income: Full-year gross rental income per draw (default: from config.rental)
+        rented_nights: Full-year rented nights per draw (default: from config.rental)
+        operational_months: Number of months the property is operational (default: 12)
+        ota_booking_percentage .. marginal_tax_rate: As in compute_annual_cash_flows, per draw
+        electricity_internet_annual: Annual electricity/internet cost per draw (default: from config)
+        maintenance_rate: Maintenance rate per draw (default: from config)
+
+    Returns:
+        Dictionary of per-draw arrays (revenue, expenses, NOI, debt service, cash flow, tax).
+        KPIs, stress results and the seasonal breakdown are not included.
+    """
+    f = config.financing
+    r = config.rental
+    e = config.expenses
+
+    operational_fraction = operational_months / 12.0
+    ramp_up_fraction = (12 - operational_months) / 12.0
+
+    gross_rental_income = np.asarray(
+        gross_rental_income if gross_rental_income is not None else r.gross_rental_income, dtype=float
+    ) * operational_fraction
+    rented_nights = np.asarray(
+        rented_nights if rented_nights is not None else r.rented_nights, dtype=float
+    ) * operational_fraction
+
+    ota_booking_percentage = ota_booking_percentage if ota_booking_percentage is not None else 0.5
+    ota_fee_rate = ota_fee_rate if ota_fee_rate is not None else 0.3
+    effective_ota_fee_rate = ota_booking_percentage * ota_fee_rate
+    ota_fees_total = gross_rental_income * effective_ota_fee_rate
+    net_rental_income = gross_rental_income - ota_fees_total
+
+    avg_stay = average_length_of_stay if average_length_of_stay is not None else e.average_length_of_stay
+    avg_guests = avg_guests_per_night if avg_guests_per_night is not None else e.avg_guests_per_night
+    cleaning_cost_val = cleaning_cost_per_stay if cleaning_cost_per_stay is not None else e.cleaning_cost_per_stay
+    cleaning_cost = np.where(cleaning_cost_val > 0, rented_nights / avg_stay * cleaning_cost_val, 0.0)
+
+    property_management_cost = (net_rental_income - cleaning_cost) * e.property_management_fee_rate
+    tourist_tax = rented_nights * avg_guests * e.tourist_tax_per_person_per_night
+    vat_cost = gross_rental_income * e.vat_rate_on_gross_rental
+
+    insurance = e.insurance_annual
+    nubbing_costs = e.nubbing_costs_annual
+    maintenance_reserve = e.property_value * (maintenance_rate if maintenance_rate is not None else e.maintenance_rate)
+    electricity_annual = electricity_internet_annual if electricity_internet_annual is not None else e.electricity_internet_annual
+    electricity_internet = (ramp_up_fraction * electricity_annual * 0.25 +
+                            operational_fraction * electricity_annual)
+
+    total_operating_expenses = (
+        property_management_cost
+        + cleaning_cost
+        + tourist_tax
+        + vat_cost
+        + insurance
+        + nubbing_costs
+        + electricity_internet
+        + maintenance_reserve
+    )
+    net_operating_income = net_rental_income - total_operating_expenses
+
+    # Debt service does not depend on the draw: reuse the scalar tranche logic
+    base_saron_rate = f.effective_saron_base_rate if f.loan_tranches else f.interest_rate
+    interest_payment, blended_interest_rate, _ = _compute_interest_for_balance(
+        financing=f,
+        loan_balance=f.loan_amount,
+        current_saron_base_rate=base_saron_rate,
+    )
+    amortization_payment = f.annual_amortization
+    debt_service = interest_payment + amortization_payment
+
+    cash_flow_after_debt_service = net_operating_income - debt_service
+    cash_flow_per_owner = cash_flow_after_debt_service / f.num_owners
+
+    tax_rate = marginal_tax_rate if marginal_tax_rate is not None else 0.30
+    taxable_income = net_operating_income - interest_payment
+    tax_liability = np.maximum(0.0, taxable_income) * tax_rate
+    tax_savings_total = interest_payment * tax_rate
+    tax_savings_per_owner = tax_savings_total / f.num_owners
+
+    result = {
+        "gross_rental_income": gross_rental_income,
+        "ota_fees_total": ota_fees_total,
+        "net_rental_income": net_rental_income,
+        "rented_nights": rented_nights,
+        "property_management_cost": property_management_cost,
+        "cleaning_cost": cleaning_cost,
+        "tourist_tax": tourist_tax,
+        "vat_on_rental": vat_cost,
+        "electricity_internet": electricity_internet,
+        "maintenance_reserve": maintenance_reserve,
+        "total_operating_expenses": total_operating_expenses,
+        "net_operating_income": net_operating_income,
+        "blended_interest_rate": blended_interest_rate,
+        "interest_payment": interest_payment,
+        "amortization_payment": amortization_payment,
+        "debt_service": debt_service,
+        "cash_flow_after_debt_service": cash_flow_after_debt_service,
+        "cash_flow_per_owner": cash_flow_per_owner,
+        "taxable_income": taxable_income,
+        "tax_liability": tax_liability,
+        "tax_savings_total": tax_savings_total,
+        "after_tax_cash_flow_total": cash_flow_after_debt_service + tax_savings_total,
+        "after_tax_cash_flow_per_owner": cash_flow_per_owner + tax_savings_per_owner,
+    }
+    # Inputs left at their config defaults are scalars: broadcast to the draw shape
+    shape = np.broadcast_shapes(*(np.shape(value) for value in result.values()))
+    return {key: np.broadcast_to(value, shape) for key, value in result.items()}
+
+
+def compute_15_year_projection_vec(config: BaseCaseConfig,
+                                   inflation_factors: np.ndarray,
+                                   appreciation_factors: np.ndarray,
+                                   gross_rental_income: Optional[np.ndarray] = None,
+                                   rented_nights: Optional[np.ndarray] = None,
+                                   ramp_up_months: int = 0,
+                                   renovation_downtime_months: int = 0,
+                                   renovation_frequency_years: int = 0,
+                                   ota_booking_percentage: Optional[np.ndarray] = None,
+                                   ota_fee_rate: Optional[np.ndarray] = None,
+                                   average_length_of_stay: Optional[np.ndarray] = None,
+                                   avg_guests_per_night: Optional[np.ndarray] = None,
+                                   cleaning_cost_per_stay: Optional[np.ndarray] = None,
+                                   marginal_tax_rate: Optional[np.ndarray] = None,
+                                   electricity_internet_annual: Optional[np.ndarray] = None,
+                                   maintenance_rate: Optional[np.ndarray] = None,
+                                   maintenance_costs: Optional[np.ndarray] = None,
+                                   occupancy_multipliers: Optional[np.ndarray] = None,
+                                   rate_multipliers: Optional[np.ndarray] = None,
+                                   value_multipliers: Optional[np.ndarray] = None,
+                                   interest_rate_paths: Optional[np.ndarray] = None,
+                                   refinancing_costs: Optional[np.ndarray] = None) -> Dict[str, np.ndarray]:
+    """
+    Batch version of compute_15_year_projection for N parameter draws at once.
+
+    Stochastic events are passed already resolved into (N, years) arrays, so the
+    projection itself has no per-draw state: every year is a broadcast over N.
+
+    Args:
+        config: Configuration supplying every parameter not overridden below
+        inflation_factors: Cumulative inflation factor per draw and year, (N, years); year 1 = 1.0
+        appreciation_factors: Cumulative appreciation factor per draw and year, (N, years)
+        gross_rental_income, rented_nights: Full-year base revenue/nights per draw, (N,)
+        ramp_up_months: As in the scalar projection, or a per-draw (N,) array of months
+        renovation_downtime_months, renovation_frequency_years: As in the scalar projection
+        ota_booking_percentage .. maintenance_rate: Per-draw overrides, (N,)
+        maintenance_costs: One-time major maintenance cost per draw and year, (N, years)
+        occupancy_multipliers, rate_multipliers, value_multipliers: Market shock multipliers, (N, years)
+        interest_rate_paths: SARON base rate (tranche mode) or interest rate per draw and year, (N, years)
+        refinancing_costs: One-time refinancing cost per draw and year, (N, years)
+
+    Returns:
+        Dictionary of (N, years) arrays; 'amortization_payment' and
+        'remaining_loan_balance' do not depend on the draw and are (years,) arrays,
+        as is 'operational_months' unless ramp_up_months is given per draw.
+    """
+    f = config.financing
+    e = config.expenses
+    inflation_factors = np.asarray(inflation_factors, dtype=float)
+    appreciation_factors = np.asarray(appreciation_factors, dtype=float)
+    projection_years = inflation_factors.shape[-1]
+
+    base = compute_annual_cash_flows_vec(
+        config,
+        gross_rental_income=gross_rental_income,
+        rented_nights=rented_nights,
+        operational_months=12,
+        ota_booking_percentage=ota_booking_percentage,
+        ota_fee_rate=ota_fee_rate,
+        average_length_of_stay=average_length_of_stay,
+        avg_guests_per_night=avg_guests_per_night,
+        cleaning_cost_per_stay=cleaning_cost_per_stay,
+        marginal_tax_rate=marginal_tax_rate,
+        electricity_internet_annual=electricity_internet_annual,
+        maintenance_rate=maintenance_rate,
+    )
+    # Per-draw base values as (N, 1) columns so they broadcast across years
+    base_gross_income = np.asarray(base['gross_rental_income'])[..., None]
+    base_rented_nights = np.asarray(base['rented_nights'])[..., None]
+    base_electricity_internet = np.asarray(base['electricity_internet'])[..., None]
+
+    def _per_draw(value, default):
+        return np.asarray(value if value is not None else default, dtype=float)[..., None]
+
+    effective_ota_fee_rate = (_per_draw(ota_booking_percentage, 0.5) * _per_draw(ota_fee_rate, 0.3))
+    avg_stay = _per_draw(average_length_of_stay, e.average_length_of_stay)
+    avg_guests = _per_draw(avg_guests_per_night, e.avg_guests_per_night)
+    cleaning_cost_val = _per_draw(cleaning_cost_per_stay, e.cleaning_cost_per_stay)
+    tax_rate = _per_draw(marginal_tax_rate, 0.30)
+    maint_rate = _per_draw(maintenance_rate, e.maintenance_rate)
+
+    # Operational months per year: one schedule per distinct ramp-up period,
+    # gathered per draw when ramp_up_months is an (N,) array.
+    # Amortization is a fixed payment, so the balance path is a closed-form ramp.
+    ramp_up = np.maximum(0, np.asarray(ramp_up_months).astype(np.int64))
+    distinct_ramp_ups, ramp_up_index = np.unique(ramp_up, return_inverse=True)
+    operational_schedules = np.array([
+        [
+            _get_operational_months_for_year(
+                year_num=year_num,
+                ramp_up_months=int(ramp_up_value),
+                renovation_downtime_months=max(0, int(renovation_downtime_months)),
+                renovation_frequency_years=max(0, int(renovation_frequency_years)),
+            )[0]
+            for year_num in range(1, projection_years + 1)
+        ]
+        for ramp_up_value in distinct_ramp_ups
+    ], dtype=float)
+    if ramp_up.ndim == 0:
+        operational_months = operational_schedules[0]
+    else:
+        operational_months = operational_schedules[ramp_up_index.reshape(ramp_up.shape)]
+    amortization_payment = f.loan_amount * f.amortization_rate
+    loan_balance_start = f.loan_amount - amortization_payment * np.arange(projection_years, dtype=float)
+    remaining_loan_balance = loan_balance_start - amortization_payment
+    operational_fraction = operational_months / 12.0
+    non_operational_fraction = (12 - operational_months) / 12.0
+
+    occ_mult = occupancy_multipliers if occupancy_multipliers is not None else 1.0
+    rate_mult = rate_multipliers if rate_multipliers is not None else 1.0
+    value_mult = value_multipliers if value_multipliers is not None else 1.0
+
+    rented_nights_y = base_rented_nights * inflation_factors * occ_mult * operational_fraction
+    gross_income_y = base_gross_income * inflation_factors * occ_mult * rate_mult * operational_fraction
+    ota_fees_y = gross_income_y * effective_ota_fee_rate
+    net_rental_income_y = gross_income_y - ota_fees_y
+
+    cleaning_cost_y = np.where(cleaning_cost_val > 0, rented_nights_y / avg_stay * cleaning_cost_val, 0.0)
+    property_management_y = (net_rental_income_y - cleaning_cost_y) * e.property_management_fee_rate
+    tourist_tax_y = rented_nights_y * avg_guests * e.tourist_tax_per_person_per_night
+    vat_y = gross_income_y * e.vat_rate_on_gross_rental
+    insurance_y = e.insurance_annual * inflation_factors
+    nubbing_y = e.nubbing_costs_annual * inflation_factors
+    electricity_y = (non_operational_fraction * base_electricity_internet * 0.25 +
+                     operational_fraction * base_electricity_internet) * inflation_factors
+    property_value_y = f.purchase_price * appreciation_factors * value_mult
+    maintenance_reserve_y = property_value_y * maint_rate
+
+    total_operating_expenses_y = (
+        property_management_y +
+        cleaning_cost_y +
+        tourist_tax_y +
+        vat_y +
+        insurance_y +
+        nubbing_y +
+        electricity_y +
+        maintenance_reserve_y +
+        (maintenance_costs if maintenance_costs is not None else 0.0) +
+        (refinancing_costs if refinancing_costs is not None else 0.0)
+    )
+    net_operating_income_y = net_rental_income_y - total_operating_expenses_y
+
+    if interest_rate_paths is None:
+        interest_rate_paths = f.effective_saron_base_rate if f.loan_tranches else f.interest_rate
+    interest_y, blended_rate_y = _compute_interest_for_balance_vec(f, loan_balance_start, interest_rate_paths)
+    debt_service_y = interest_y + amortization_payment
+
+    cash_flow_after_debt_service_y = net_operating_income_y - debt_service_y
+    cash_flow_per_owner_y = cash_flow_after_debt_service_y / f.num_owners
+    tax_savings_total_y = interest_y * tax_rate
+
+    return {
+        'operational_months': operational_months,
+        'inflation_factor': inflation_factors,
+        'appreciation_factor': appreciation_factors,
+        'property_value': property_value_y,
+        'rented_nights': rented_nights_y,
+        'gross_rental_income': gross_income_y,
+        'ota_fees_total': ota_fees_y,
+        'net_rental_income': net_rental_income_y,
+        'total_operating_expenses': total_operating_expenses_y,
+        'net_operating_income': net_operating_income_y,
+        'blended_interest_rate': blended_rate_y,
+        'interest_payment': interest_y,
+        'amortization_payment': np.full(projection_years, amortization_payment),
+        'debt_service': debt_service_y,
+        'cash_flow_after_debt_service': cash_flow_after_debt_service_y,
+        'cash_flow_per_owner': cash_flow_per_owner_y,
+        'cumulative_cash_flow_per_owner': np.cumsum(cash_flow_per_owner_y, axis=-1),
+        'taxable_income': net_operating_income_y - interest_y,
+        'tax_liability': np.maximum(0.0, net_operating_income_y - interest_y) * tax_rate,
+        'tax_savings_total': tax_savings_total_y,
+        'after_tax_cash_flow_per_owner': cash_flow_per_owner_y + tax_savings_total_y / f.num_owners,
+        'remaining_loan_balance': remaining_loan_balance,
+    }
+
+
+def calculate_npv(cash_flows, initial_investment, discount_rate, sale_proceeds=0):
+    """
+    Calculate Net Present Value with a precomputed discount-factor vector.
+
+    Annual cash flows are discounted from year 1; sale proceeds are discounted
+    with the final-year factor. Works on a single path (1-D cash flows, scalar
+    rate) or on a batch of paths ((N, years) cash flows with scalar or (N,)
+    rates and investments), replacing the per-year Python discount loop with
+    one dot product per path. Leading dimensions broadcast like a ufunc, so
+    (R, 1) rates against (S, years) cash flows evaluate an (R, S) grid of
+    rates x scenarios in one call.
+
+    Args:
+        cash_flows: Annual cash flows, shape (..., years)
+        initial_investment: Initial investment (positive), scalar or broadcastable
+        discount_rate: Annual discount rate, scalar or broadcastable
+        sale_proceeds: Sale proceeds received at the end of the final year, scalar or broadcastable
+
+    Returns:
+        NPV as a float for a single path, or an array of the broadcast shape
+    """
+    cash_flows = np.asarray(cash_flows, dtype=np.float64)
+    num_years = cash_flows.shape[-1]
+    if num_years == 0:
+        return -initial_investment + sale_proceeds
+
+    # Discount factors (1 + r)^-t for t = 1..years; one row per path when rates vary
+    periods = np.arange(1, num_years + 1, dtype=np.float64)
+    base = 1.0 + np.asarray(discount_rate, dtype=np.float64)
+    discount_factors = base[..., None] ** -periods
+
+    npv = (
+        -np.asarray(initial_investment, dtype=np.float64)
+        + np.einsum('...t,...t->...', cash_flows, discount_factors)
+        + np.asarray(sale_proceeds, dtype=np.float64) * discount_factors[..., -1]
+    )
+    return float(npv) if npv.ndim == 0 else npv
+
+
+# Newton-Raphson IRR: start at 8% and stop once the rate step drops below the tolerance
+_IRR_NEWTON_GUESS = 0.08
+_IRR_NEWTON_TOLERANCE = 1e-10
+_IRR_NEWTON_MAX_ITERATIONS = 50
+
+
+def _is_conventional_cash_flow(cf_array: List[float]) -> bool:
+    """
+    Check for an investment-style series: outflows first, then inflows only.
+    
+    With a single sign change (zeros ignored) NPV has exactly one root above
+    -100% (Descartes' rule of signs in v = 1 / (1 + r)).
+    """
+    if cf_array[0] >= 0:
+        return False
+    inflow_seen = False
+    for cf in cf_array:
+        if cf > 0:
+            inflow_seen = True
+        elif cf < 0 and inflow_seen:
+            return False
+    return inflow_seen
+
+
+def _irr_newton(cf_array: List[float]) -> Optional[float]:
+    """
+    Newton-Raphson IRR for a conventional cash-flow series.
+    
+    NPV and its derivative are evaluated together in one Horner pass over
+    v = 1 / (1 + r), so each step is a single loop over the cash flows.
+    
+    Args:
+        cf_array: Cash flows from year 0 (investment, negative) to the final year
+    
+    Returns:
+        IRR as a decimal, or None if the iteration leaves (-99%, 999%) or does not converge
+    """
+    rate = _IRR_NEWTON_GUESS
+    for _ in range(_IRR_NEWTON_MAX_ITERATIONS):
+        v = 1.0 / (1.0 + rate)
+        npv = 0.0
+        npv_dv = 0.0
+        for cf in reversed(cf_array):
+            npv_dv = npv_dv * v + npv
+            npv = npv * v + cf
+        # dNPV/dr = dNPV/dv * dv/dr, with dv/dr = -v^2
+        slope = -npv_dv * v * v
+        if slope == 0.0:
+            return None
+        step = npv / slope
+        rate -= step
+        if not -0.99 < rate < 9.99:
+            return None
+        if abs(step) < _IRR_NEWTON_TOLERANCE:
+            return rate
+    return None
+
+
 def calculate_irr(cash_flows: List[float], initial_investment: float, sale_proceeds: float = 0) -> float:
     """
     Calculate Internal Rate of Return (IRR) using iterative method.
     
+    Conventional series (outflows first, then inflows) are solved with
+    Newton-Raphson; anything else, or a Newton run that does not converge,
+    falls back to bisection on [-99%, 999%].
+    
     Args:
         cash_flows: List of annual cash flows (positive for returns)
         initial_investment: Initial equity investment (positive)
@@ -1581,12 +2099,14 @@ def calculate_irr(cash_flows: List[float], initial_investment: float, sale_proce
     if sale_proceeds > 0:
         cf_array[-1] += sale_proceeds
     
-    # Define NPV function (optimized with pre-calculated discount factors)
+    # Define NPV function (Horner's rule in v = 1 / (1 + r), as in calculate_irr_vec)
     def npv(rate):
         try:
-            # Pre-calculate discount factors for efficiency
-            discount_factors = [(1 + rate) ** i for i in range(len(cf_array))]
-            return sum(cf / df for cf, df in zip(cf_array, discount_factors))
+            v = 1.0 / (1.0 + rate)
+            total = 0.0
+            for cf in reversed(cf_array):
+                total = total * v + cf
+            return total
         except (ZeroDivisionError, OverflowError, ValueError):
             # Handle mathematical errors (e.g., division by zero, overflow)
             return float('inf')
@@ -1595,6 +2115,12 @@ def calculate_irr(cash_flows: List[float], initial_investment: float, sale_proce
     npv_low = npv(-0.99)  # -99%
     npv_high = npv(9.99)  # 999%
     
+    # Conventional series with a root in range: solve directly, typically in 4-6 Newton steps
+    if npv_low > 0 > npv_high and _is_conventional_cash_flow(cf_array):
+        rate = _irr_newton(cf_array)
+        if rate is not None:
+            return rate
+    
     # If both are positive or both negative, no IRR exists
     if (npv_low > 0 and npv_high > 0) or (npv_low < 0 and npv_high < 0):
         # Try to find a reasonable rate
@@ -1628,13 +2154,205 @@ def calculate_irr(cash_flows: List[float], initial_investment: float, sale_proce
     return final_rate if abs(npv(final_rate)) < abs(initial_investment) * 0.1 else 0.0
 
 
+def calculate_irr_vec(cash_flows: np.ndarray, initial_investment: Any, sale_proceeds: Any = 0) -> np.ndarray:
+    """
+    Batch version of calculate_irr for N cash-flow paths at once.
+
+    Runs the same search as calculate_irr (Newton-Raphson on conventional
+    paths, then sign-change check, fallback test rates, bisection on
+    [-99%, 999%] and final plausibility check for the rest) with every path
+    advancing in lockstep, so each iteration is one array operation over the
+    (N, years + 1) cash-flow matrix instead of N Python-level searches.
+    Paths leave the search as soon as they converge.
+
+    Args:
+        cash_flows: Annual cash flows per path, shape (N, years)
+        initial_investment: Initial equity investment (positive), scalar or (N,)
+        sale_proceeds: Sale proceeds added to the final year when positive, scalar or (N,)
+
+    Returns:
+        IRR per path as decimals, shape (N,)
+    """
+    cash_flows = np.asarray(cash_flows, dtype=np.float64)
+    n, num_years = cash_flows.shape
+    investment = np.broadcast_to(np.asarray(initial_investment, dtype=np.float64), (n,))
+    sale = np.broadcast_to(np.asarray(sale_proceeds, dtype=np.float64), (n,))
+
+    # Cash-flow matrix: year 0 investment, years 1..T flows, sale added to year T.
+    # Stored year-major (T + 1, N) so each Horner step reads one contiguous row.
+    cf_matrix = np.empty((num_years + 1, n))
+    cf_matrix[0] = -investment
+    cf_matrix[1:] = cash_flows.T
+    cf_matrix[-1] += np.where(sale > 0, sale, 0.0)
+
+    def npv(rate, rows=slice(None), cf=None):
+        # Horner's rule in v = 1 / (1 + r): sum_t cf_t v^t with one multiply-add
+        # per year instead of an (N, T) matrix of powers
+        v = 1.0 / (1.0 + rate)
+        if cf is None:
+            cf = cf_matrix[:, rows]
+        total = cf[-1].copy()
+        for t in range(num_years - 1, -1, -1):
+            total *= v
+            total += cf[t]
+        return total
+
+    irr = np.zeros(n)
+    abs_investment = np.abs(investment)
+    pending = np.ones(n, dtype=bool)
+
+    # Sign check between -99% and 999%
+    npv_low = npv(np.full(n, -0.99))
+    npv_high = npv(np.full(n, 9.99))
+    no_sign_change = ((npv_low > 0) & (npv_high > 0)) | ((npv_low < 0) & (npv_high < 0))
+
+    # Conventional paths (outflows first, then inflows only) with a root in range
+    # have exactly one root: Newton-Raphson with NPV and its slope from one
+    # Horner pass per step
+    inflow_seen = np.logical_or.accumulate(cf_matrix > 0, axis=0)
+    conventional = (cf_matrix[0] < 0) & inflow_seen[-1] & ~((cf_matrix < 0) & inflow_seen).any(axis=0)
+    rows = np.flatnonzero(conventional & (npv_low > 0) & (npv_high < 0))
+    active_cf = cf_matrix[:, rows]
+    rate = np.full(rows.size, _IRR_NEWTON_GUESS)
+    with np.errstate(all='ignore'):
+        for iteration in range(_IRR_NEWTON_MAX_ITERATIONS):
+            if rows.size == 0:
+                break
+            v = 1.0 / (1.0 + rate)
+            # The first two Horner steps from zero leave total_dv = cf_T and
+            # total = cf_T * v + cf_(T-1); start there instead of from zeros
+            total_dv = active_cf[num_years].copy()
+            total = active_cf[num_years] * v
+            total += active_cf[num_years - 1]
+            for t in range(num_years - 2, -1, -1):
+                total_dv *= v
+                total_dv += total
+                total *= v
+                total += active_cf[t]
+            step = total / (-total_dv * v * v)
+            rate = rate - step
+
+            # Converged paths are done; paths leaving (-99%, 999%) go to the bisection
+            in_range = (rate > -0.99) & (rate < 9.99)
+            converged = in_range & (np.abs(step) < _IRR_NEWTON_TOLERANCE)
+            irr[rows[converged]] = rate[converged]
+            pending[rows[converged]] = False
+
+            keep = in_range & ~converged
+            if not keep.all():
+                rows, rate = rows[keep], rate[keep]
+                active_cf = active_cf[:, keep]
+
+    # Paths without a sign change: try fixed test rates. Paths without any
+    # inflow have NPV <= -investment at every rate and can never hit, so they
+    # keep an IRR of 0 without evaluating the test rates
+    testable = no_sign_change & inflow_seen[-1]
+    if testable.any():
+        rows = np.flatnonzero(testable)
+        test_rates = np.array([-0.5, -0.2, -0.1, 0.0, 0.05, 0.1, 0.2, 0.5, 1.0, 2.0])
+        hits = np.column_stack([
+            np.abs(npv(np.full(rows.size, rate), rows)) < abs_investment[rows] * 0.01
+            for rate in test_rates
+        ])
+        found = hits.any(axis=1)
+        irr[rows[found]] = test_rates[hits[found].argmax(axis=1)]
+
+    # Bisection for IRR (where NPV = 0) on the remaining paths
+    rows = np.flatnonzero(~no_sign_change & pending)
+    low = np.full(rows.size, -0.99)
+    high = np.full(rows.size, 9.99)
+    tolerance = 1e-8
+    max_iterations = 200
+    # Cash flows of the paths still searching; re-gathered only when paths
+    # leave the search instead of fancy-indexing the full matrix every step
+    active_cf = cf_matrix[:, rows]
+
+    for iteration in range(max_iterations):
+        if rows.size == 0:
+            break
+        mid = (low + high) / 2
+        npv_mid = npv(mid, cf=active_cf)
+
+        converged = np.abs(npv_mid) < tolerance
+        irr[rows[converged]] = mid[converged]
+
+        positive = npv_mid > 0
+        low = np.where(positive, mid, low)
+        high = np.where(positive, high, mid)
+
+        # Bracket collapsed: finish with the midpoint plausibility check below
+        collapsed = ~converged & (np.abs(high - low) < tolerance)
+        if collapsed.any():
+            final_rows = rows[collapsed]
+            final_rate = (low[collapsed] + high[collapsed]) / 2
+            plausible = np.abs(npv(final_rate, final_rows)) < abs_investment[final_rows] * 0.1
+            irr[final_rows] = np.where(plausible, final_rate, 0.0)
+
+        keep = ~(converged | collapsed)
+        if not keep.all():
+            rows, low, high = rows[keep], low[keep], high[keep]
+            active_cf = active_cf[:, keep]
+
+    # Paths still bracketing after max_iterations
+    if rows.size:
+        final_rate = (low + high) / 2
+        plausible = np.abs(npv(final_rate, cf=active_cf)) < abs_investment[rows] * 0.1
+        irr[rows] = np.where(plausible, final_rate, 0.0)
+
+    return irr
+
+
+def _sale_breakdown(final_property_value: float, purchase_price: Optional[float],
+                    selling_costs_rate: float, capital_gains_tax_rate: float,
+                    property_transfer_tax_sale_rate: float) -> Tuple[float, float, float, float]:
+    """
+    Selling costs, capital gains tax, transfer tax and net sale price at exit.
+    
+    Returns:
+        (selling_costs_total, capital_gains_tax_total, property_transfer_tax_sale_total, net_sale_price)
+    """
+    selling_costs_total = final_property_value * selling_costs_rate
+    capital_gain = max(0.0, final_property_value - (purchase_price if purchase_price is not None else final_property_value))
+    capital_gains_tax_total = capital_gain * capital_gains_tax_rate
+    property_transfer_tax_sale_total = final_property_value * property_transfer_tax_sale_rate
+    net_sale_price = final_property_value - selling_costs_total - capital_gains_tax_total - property_transfer_tax_sale_total
+    return selling_costs_total, capital_gains_tax_total, property_transfer_tax_sale_total, net_sale_price
+
+
+def calculate_equity_irr_with_sale(projection: List[Dict], initial_equity: float,
+                                   final_property_value: float, final_loan_balance: float,
+                                   num_owners: int = 4, purchase_price: float = None,
+                                   selling_costs_rate: float = SELLING_COSTS_RATE,
+                                   capital_gains_tax_rate: float = CAPITAL_GAINS_TAX_RATE,
+                                   property_transfer_tax_sale_rate: float = PROPERTY_TRANSFER_TAX_SALE_RATE) -> float:
+    """
+    Equity IRR with sale only (the 'equity_irr_with_sale_pct' of calculate_irrs_from_projection).
+    
+    For callers that need just this one metric per projection (e.g. sensitivity
+    analysis): solves a single IRR instead of four IRRs plus NPV, MOIC and payback.
+    
+    Args:
+        Same as calculate_irrs_from_projection (without discount_rate)
+    
+    Returns:
+        Equity IRR with sale as percentage (e.g., 4.5 means 4.5%)
+    """
+    equity_cash_flows = [year['cash_flow_per_owner'] for year in projection]
+    net_sale_price = _sale_breakdown(
+        final_property_value, purchase_price, selling_costs_rate,
+        capital_gains_tax_rate, property_transfer_tax_sale_rate,
+    )[3]
+    sale_proceeds_per_owner = (net_sale_price - final_loan_balance) / num_owners
+    return calculate_irr(equity_cash_flows, initial_equity, sale_proceeds_per_owner) * 100
+
+
 def calculate_irrs_from_projection(projection: List[Dict], initial_equity: float, 
                                    final_property_value: float, final_loan_balance: float,
                                    num_owners: int = 4, purchase_price: float = None,
-                                   selling_costs_rate: float = 0.078,
+                                   selling_costs_rate: float = SELLING_COSTS_RATE,
                                    discount_rate: float = 0.05,
-                                   capital_gains_tax_rate: float = 0.02,
-                                   property_transfer_tax_sale_rate: float = 0.015) -> Dict[str, float]:
+                                   capital_gains_tax_rate: float = CAPITAL_GAINS_TAX_RATE,
+                                   property_transfer_tax_sale_rate: float = PROPERTY_TRANSFER_TAX_SALE_RATE) -> Dict[str, float]:
     """
     Calculate multiple IRRs with selling costs:
     1. Equity IRR with sale (levered, includes debt service and selling costs)
@@ -1672,11 +2390,11 @@ def calculate_irrs_from_projection(projection: List[Dict], initial_equity: float
     unlevered_cash_flows = [year['net_operating_income'] / num_owners for year in projection]
     
     # Calculate selling costs
-    selling_costs_total = final_property_value * selling_costs_rate
-    capital_gain = max(0.0, final_property_value - (purchase_price if purchase_price is not None else final_property_value))
-    capital_gains_tax_total = capital_gain * capital_gains_tax_rate
-    property_transfer_tax_sale_total = final_property_value * property_transfer_tax_sale_rate
-    net_sale_price = final_property_value - selling_costs_total - capital_gains_tax_total - property_transfer_tax_sale_total
+    (selling_costs_total, capital_gains_tax_total,
+     property_transfer_tax_sale_total, net_sale_price) = _sale_breakdown(
+        final_property_value, purchase_price, selling_costs_rate,
+        capital_gains_tax_rate, property_transfer_tax_sale_rate,
+    )
     
     # Calculate sale proceeds per owner (net of loan payoff and selling costs for levered)
     sale_proceeds_per_owner = (net_sale_price - final_loan_balance) / num_owners
@@ -1700,10 +2418,7 @@ def calculate_irrs_from_projection(projection: List[Dict], initial_equity: float
         project_irr_without_sale = 0.0
     
     # Calculate NPV using provided discount rate
-    npv = -initial_equity
-    for i, cash_flow in enumerate(equity_cash_flows, 1):
-        npv += cash_flow / ((1 + discount_rate) ** i)
-    npv += sale_proceeds_per_owner / ((1 + discount_rate) ** len(equity_cash_flows))
+    npv = calculate_npv(equity_cash_flows, initial_equity, discount_rate, sale_proceeds_per_owner)
     
     # Calculate MOIC (Multiple on Invested Capital)
     total_cash_returned = sum(equity_cash_flows) + sale_proceeds_per_owner
@@ -1872,17 +2587,7 @@ def apply_sensitivity(
     # Clone tranche definitions for safe modification
     new_loan_tranches = None
     if f.loan_tranches:
-        new_loan_tranches = [
-            LoanTranche(
-                name=t.name,
-                share_of_loan=t.share_of_loan,
-                rate_type=t.rate_type,
-                fixed_rate=t.fixed_rate,
-                saron_margin=t.saron_margin,
-                term_years=t.term_years,
-            )
-            for t in f.loan_tranches
-        ]
+        new_loan_tranches = [replace(t) for t in f.loan_tranches]
 
         # Override SARON margin if requested
         if saron_margin is not None:
@@ -1959,18 +2664,13 @@ def apply_sensitivity(
     else:
         new_saron_base_rate = f.saron_base_rate
 
-    new_financing = FinancingParams(
+    # Only overridden fields are listed; everything else is copied from the base
+    new_financing = replace(
+        f,
         purchase_price=purchase_price if purchase_price is not None else f.purchase_price,
         ltv=ltv if ltv is not None else f.ltv,
         interest_rate=new_interest_rate,
         amortization_rate=amortization_rate if amortization_rate is not None else f.amortization_rate,
-        num_owners=f.num_owners,
-        notary_fee_rate=f.notary_fee_rate,
-        legal_doc_fee_rate=f.legal_doc_fee_rate,
-        agency_fee_rate_buyer=f.agency_fee_rate_buyer,
-        inspection_chf=f.inspection_chf,
-        interior_designer_chf=f.interior_designer_chf,
-        furniture_chf=f.furniture_chf,
         loan_tranches=new_loan_tranches,
         saron_base_rate=new_saron_base_rate,
         stress=_normalize_financing_stress(f.stress),
@@ -1979,6 +2679,14 @@ def apply_sensitivity(
     # Handle seasonal model - preserve seasons if they exist
     base_rental = base_config.rental
     if base_rental.seasons:
+        # Rate multiplier based on weighted average of base case; the same for every
+        # season, so it is computed once (rented_nights/gross income sum over seasons)
+        multiplier = None
+        if daily_rate is not None:
+            base_rented_nights = base_rental.rented_nights
+            base_avg_rate = base_rental.gross_rental_income / base_rented_nights if base_rented_nights > 0 else base_rental.average_daily_rate
+            multiplier = daily_rate / base_avg_rate
+        
         # Adjust seasonal parameters proportionally
         seasons = []
         for season in base_rental.seasons:
@@ -1986,38 +2694,29 @@ def apply_sensitivity(
             new_occupancy = occupancy if occupancy is not None else season.occupancy_rate
             
             # Adjust daily rate if provided (proportional to base rate)
-            if daily_rate is not None:
-                # Calculate multiplier based on weighted average of base case
-                base_avg_rate = base_config.rental.gross_rental_income / base_config.rental.rented_nights if base_config.rental.rented_nights > 0 else base_config.rental.average_daily_rate
-                multiplier = daily_rate / base_avg_rate
+            if multiplier is not None:
                 new_rate = season.average_daily_rate * multiplier
             else:
                 new_rate = season.average_daily_rate
             
-            seasons.append(SeasonalParams(
-                name=season.name,
-                months=season.months,
+            seasons.append(replace(
+                season,
                 occupancy_rate=new_occupancy,
                 average_daily_rate=new_rate,
-                nights_in_season=season.nights_in_season
             ))
         
-        new_rental = RentalParams(
-            owner_nights_per_person=base_rental.owner_nights_per_person,
-            num_owners=base_rental.num_owners,
+        new_rental = replace(
+            base_rental,
             occupancy_rate=occupancy if occupancy is not None else base_rental.occupancy_rate,
             average_daily_rate=daily_rate if daily_rate is not None else base_rental.average_daily_rate,
-            days_per_year=base_rental.days_per_year,
             seasons=seasons  # Preserve seasonal structure
         )
     else:
         # Non-seasonal model
-        new_rental = RentalParams(
-            owner_nights_per_person=base_rental.owner_nights_per_person,
-            num_owners=base_rental.num_owners,
+        new_rental = replace(
+            base_rental,
             occupancy_rate=occupancy if occupancy is not None else base_rental.occupancy_rate,
             average_daily_rate=daily_rate if daily_rate is not None else base_rental.average_daily_rate,
-            days_per_year=base_rental.days_per_year
         )
 
     # Update property_value if purchase_price changed (for maintenance calculations)
@@ -2029,25 +2728,21 @@ def apply_sensitivity(
     else:
         new_insurance_annual = base_config.expenses.insurance_annual
     
-    new_expenses = ExpenseParams(
+    new_expenses = replace(
+        base_config.expenses,
         property_management_fee_rate=management_fee if management_fee is not None else base_config.expenses.property_management_fee_rate,
         cleaning_cost_per_stay=cleaning_cost_per_stay if cleaning_cost_per_stay is not None else base_config.expenses.cleaning_cost_per_stay,
         average_length_of_stay=average_length_of_stay if average_length_of_stay is not None else base_config.expenses.average_length_of_stay,
-        tourist_tax_per_person_per_night=base_config.expenses.tourist_tax_per_person_per_night,
-        avg_guests_per_night=base_config.expenses.avg_guests_per_night,
         insurance_annual=new_insurance_annual,
-        nubbing_costs_annual=base_config.expenses.nubbing_costs_annual,
-        electricity_internet_annual=base_config.expenses.electricity_internet_annual,
         maintenance_rate=maintenance_rate if maintenance_rate is not None else base_config.expenses.maintenance_rate,
         property_value=new_property_value,
-        vat_rate_on_gross_rental=base_config.expenses.vat_rate_on_gross_rental
     )
 
-    return BaseCaseConfig(
+    return replace(
+        base_config,
         financing=new_financing,
         rental=new_rental,
         expenses=new_expenses,
-        projection=base_config.projection
     )
 
 
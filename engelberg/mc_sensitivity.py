@@ -25,7 +25,7 @@ from engelberg.core import (
 
 from engelberg.monte_carlo import (
     run_monte_carlo_simulation,
-    calculate_statistics,
+    calculate_npv_statistics,
 )
 
 from engelberg.mc_sensitivity_ranges import (
@@ -53,8 +53,9 @@ def save_json(data: Dict, case_name: str, analysis_type: str) -> str:
     os.makedirs(data_dir, exist_ok=True)
     output_path = os.path.join(data_dir, f"{case_name}_{analysis_type}.json")
     
+    # Encode up front and write once; json.dump issues a write() per token
     with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=2, ensure_ascii=False, default=str)
+        f.write(json.dumps(data, indent=2, ensure_ascii=False, default=str))
     
     # Return relative path for compatibility
     return f"website/data/{case_name}_{analysis_type}.json"
@@ -152,14 +153,16 @@ def run_mc_with_convergence(base_config: BaseCaseConfig, param_key: str, param_v
         # would cause "daemonic processes are not allowed to have children" errors.
         # The outer parallelization (processing multiple parameter values simultaneously) provides
         # the main speedup, so disabling inner parallelization here is the correct approach.
-        df = run_monte_carlo_simulation(
+        results = run_monte_carlo_simulation(
             modified_config,
             num_simulations=current_batch,
             use_lhs=True,
-            use_parallel=False  # Disabled to avoid nested multiprocessing issues
+            use_parallel=False,  # Disabled to avoid nested multiprocessing issues
+            verbose=False,
+            return_dataframe=False  # Only the NPV column is needed
         )
-        stats = calculate_statistics(df)
-        current_prob = stats['npv']['positive_prob']
+        stats = calculate_npv_statistics(results['npv'])
+        current_prob = stats['positive_prob']
         prob_history.append(current_prob)
         total_simulations += current_batch
         
@@ -223,14 +226,16 @@ def run_single_parameter_value_mc(args: Tuple) -> Dict:
         # would cause "daemonic processes are not allowed to have children" errors.
         # The outer parallelization (processing multiple parameter values simultaneously) provides
         # the main speedup, so disabling inner parallelization here is the correct approach.
-        df = run_monte_carlo_simulation(
+        results = run_monte_carlo_simulation(
             modified_config, 
             num_simulations=num_simulations,
             use_lhs=True,  # Latin Hypercube Sampling provides equivalent accuracy with fewer sims
-            use_parallel=False  # Disabled to avoid nested multiprocessing issues
+            use_parallel=False,  # Disabled to avoid nested multiprocessing issues
+            verbose=False,
+            return_dataframe=False  # Only the NPV column is needed
         )
-        stats = calculate_statistics(df)
-        npv_prob = stats['npv']['positive_prob']
+        stats = calculate_npv_statistics(results['npv'])
+        npv_prob = stats['positive_prob']
     
     return {
         'param_key': param_key,
@@ -303,14 +308,16 @@ def run_monte_carlo_sensitivity_analysis(json_path: str, case_name: str,
     # Only the parameter-value combinations run in parallel workers, and those disable inner parallelization.
     if verbose:
         print("[*] Running base case Monte Carlo simulation...")
-    df_base = run_monte_carlo_simulation(
+    results_base = run_monte_carlo_simulation(
         base_config, 
         num_simulations=num_simulations,
         use_lhs=True,  # Latin Hypercube Sampling provides equivalent accuracy with fewer sims
-        use_parallel=True  # Safe to use parallel here - not called from a worker process
+        use_parallel=True,  # Safe to use parallel here - not called from a worker process
+        verbose=verbose,
+        return_dataframe=False  # Only the NPV column is needed
     )
-    stats_base = calculate_statistics(df_base)
-    base_npv_prob = stats_base['npv']['positive_prob']
+    stats_base = calculate_npv_statistics(results_base['npv'])
+    base_npv_prob = stats_base['positive_prob']
     
     if verbose:
         print(f"  Base Case NPV > 0 Probability: {base_npv_prob * 100:.1f}%")
@@ -377,20 +384,19 @@ def run_monte_carlo_sensitivity_analysis(json_path: str, case_name: str,
             if result is not None:
                 results.append(result)
     
-    # Group results by parameter
+    # Group results by parameter (single pass over all results)
     if verbose:
         print()
     
+    results_by_param = {param_key: [] for param_key in param_info}
+    for r in results:
+        results_by_param[r['param_key']].append({'value': r['value'], 'npv_probability': r['npv_probability']})
+    
     for param_key, info in param_info.items():
         if verbose:
             print(f"[*] Processing results for {info['parameter_name']}...")
         
-        # Filter results for this parameter
-        param_results = [
-            {'value': r['value'], 'npv_probability': r['npv_probability']}
-            for r in results
-            if r['param_key'] == param_key
-        ]
+        param_results = results_by_param[param_key]
         
         # Sort by parameter value to ensure correct order
         param_results.sort(key=lambda x: x['value'])
@@ -19,7 +19,7 @@ from engelberg.core import (
     get_projection_defaults,
     compute_annual_cash_flows,
     compute_15_year_projection,
-    calculate_irrs_from_projection,
+    calculate_equity_irr_with_sale,
     apply_sensitivity,
     resolve_path,
     BaseCaseConfig,
@@ -51,8 +51,9 @@ def save_json(data: Dict, case_name: str, analysis_type: str) -> str:
     os.makedirs(data_dir, exist_ok=True)
     output_path = os.path.join(data_dir, f"{case_name}_{analysis_type}.json")
     
+    # Encode up front and write once; json.dump issues a write() per token
     with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=2, ensure_ascii=False, default=str)
+        f.write(json.dumps(data, indent=2, ensure_ascii=False, default=str))
     
     # Return relative path for compatibility
     return f"website/data/{case_name}_{analysis_type}.json"
@@ -287,10 +288,66 @@ def modify_ramp_up_months(cfg: BaseCaseConfig, value: float, json_path: str) ->
 # Functions that calculate specific financial metrics for sensitivity analysis
 # ═══════════════════════════════════════════════════════════════════════════
 
+def projection_prefix(projection_cache: Optional[Dict], cache_key, years: int,
+                      project: Callable[[int], List[Dict]]) -> List[Dict]:
+    """
+    First `years` years of a projection, shared across horizons.
+    
+    A projection's first N years do not depend on how many years follow, so
+    with a cache the projection is computed once at the longest horizon in
+    HORIZONS and every shorter horizon is a slice of it.
+    
+    Args:
+        projection_cache: Dict shared by the runs that reuse projections (None: no caching)
+        cache_key: Identifies the configuration/inputs of the projection within the cache
+        years: Horizon needed
+        project: Function computing the projection for a given number of years
+    
+    Returns:
+        List of yearly projection dicts of length `years`
+    """
+    if projection_cache is None:
+        return project(years)
+    full = projection_cache.get(cache_key)
+    if full is None or len(full) < years:
+        full = projection_cache[cache_key] = project(max(years, max(HORIZONS)))
+    return full[:years]
+
+
+def equity_irr_from_projection(config: BaseCaseConfig, projection: List[Dict], proj_defaults: Dict,
+                               selling_costs_rate: Optional[float] = None) -> float:
+    """
+    Equity IRR (with sale, in %) of a projection, exiting at its final year.
+    
+    Args:
+        config: Configuration the projection was computed from
+        projection: Yearly projection dicts
+        proj_defaults: Projection defaults of the assumptions file
+        selling_costs_rate: Override selling costs rate (for sensitivity)
+    
+    Returns:
+        Equity IRR as percentage (e.g., 4.5 means 4.5%)
+    """
+    # Only the equity IRR with sale is reported, so skip the other IRRs, NPV and MOIC
+    return calculate_equity_irr_with_sale(
+        projection,
+        config.financing.total_initial_investment_per_owner,  # Includes acquisition costs
+        projection[-1]['property_value'],
+        projection[-1]['remaining_loan_balance'],
+        config.financing.num_owners,
+        config.financing.purchase_price,
+        selling_costs_rate if selling_costs_rate is not None else proj_defaults['selling_costs_rate'],
+        proj_defaults.get('capital_gains_tax_rate', 0.02),
+        proj_defaults.get('property_transfer_tax_sale_rate', 0.015)
+    )
+
+
 def calculate_equity_irr(config: BaseCaseConfig, json_path: str,
                          property_appreciation_rate: float = None, 
                          projection_years: Optional[int] = None,
-                         ramp_up_months: Optional[int] = None) -> float:
+                         ramp_up_months: Optional[int] = None,
+                         projection_cache: Optional[Dict] = None,
+                         cache_key=None) -> float:
     """
     Calculate Equity IRR (levered) for any configuration.
     
@@ -305,6 +362,8 @@ def calculate_equity_irr(config: BaseCaseConfig, json_path: str,
         property_appreciation_rate: Override appreciation rate (for sensitivity)
         projection_years: Horizon in years; if None, use proj_defaults['projection_years'] or 15
         ramp_up_months: Override ramp-up period; if None, use proj_defaults['ramp_up_months'] or 0
+        projection_cache: Optional dict to reuse the projection across horizons (see projection_prefix)
+        cache_key: Key of this configuration/override combination in projection_cache
     
     Returns:
         Equity IRR as percentage (e.g., 4.5 means 4.5%)
@@ -318,33 +377,19 @@ def calculate_equity_irr(config: BaseCaseConfig, json_path: str,
     renovation_frequency_years = int(proj_defaults.get('renovation_frequency_years', 0))
     
     # Calculate results
-    results = compute_annual_cash_flows(config)
-    projection = compute_15_year_projection(
+    projection = projection_prefix(projection_cache, cache_key, years, lambda n: compute_15_year_projection(
         config,
         start_year=proj_defaults['start_year'],
         inflation_rate=proj_defaults['inflation_rate'],
         property_appreciation_rate=appreciation_rate,
-        projection_years=years,
+        projection_years=n,
         ramp_up_months=ramp_up,
         renovation_downtime_months=renovation_downtime_months,
-        renovation_frequency_years=renovation_frequency_years
-    )
+        renovation_frequency_years=renovation_frequency_years,
+        include_stress_results=False
+    ))
     
-    # Get IRR
-    irr_results = calculate_irrs_from_projection(
-        projection,
-        config.financing.total_initial_investment_per_owner,  # Includes acquisition costs
-        projection[-1]['property_value'],
-        projection[-1]['remaining_loan_balance'],
-        config.financing.num_owners,
-        config.financing.purchase_price,
-        proj_defaults['selling_costs_rate'],
-        proj_defaults['discount_rate'],
-        proj_defaults.get('capital_gains_tax_rate', 0.02),
-        proj_defaults.get('property_transfer_tax_sale_rate', 0.015)
-    )
-    
-    return irr_results['equity_irr_with_sale_pct']
+    return equity_irr_from_projection(config, projection, proj_defaults)
 
 
 def calculate_after_tax_cash_flow_per_person(
@@ -409,6 +454,7 @@ def calculate_after_tax_cash_flow_per_person(
             ramp_up_months=ramp_up,
             renovation_downtime_months=renovation_months,
             renovation_frequency_years=renovation_frequency,
+            include_stress_results=False,
         )
         annual_cash_flow = projection[0].get("after_tax_cash_flow_per_owner", 0.0)
     else:
@@ -419,26 +465,27 @@ def calculate_after_tax_cash_flow_per_person(
     return annual_cash_flow / 12.0
 
 
-def calculate_cash_on_cash(config: BaseCaseConfig, json_path: str, 
-                           property_appreciation_rate: float = None,
-                           projection_years: Optional[int] = None, **kwargs) -> float:
+def year1_cash_flow_per_owner(config: BaseCaseConfig, json_path: str,
+                              year1_cache: Optional[Dict] = None, cache_key=None, **kwargs) -> float:
     """
-    Calculate Cash-on-Cash return for any configuration.
+    Year 1 pre-tax cash flow per owner (after debt service), shared by the Year 1 metrics.
     
-    Cash-on-Cash = Annual Cash Flow / Initial Equity Investment
-    
-    This is a simple yield metric that shows the annual cash return
-    as a percentage of the equity invested. Unlike IRR, it doesn't
-    consider appreciation or time value of money - just Year 1 cash yield.
+    Cash-on-Cash and Monthly NCF are both derived from this value, so runs of the
+    two analyses on the same assumptions file can share it through year1_cache.
     
     Args:
         config: Configuration to test
         json_path: Path to assumptions (for projection defaults)
-        property_appreciation_rate: Not used for CoC but kept for consistency
+        year1_cache: Optional dict shared between Year 1 metric runs (None: no caching)
+        cache_key: Key of this configuration/override combination in year1_cache
+        **kwargs: Optional ramp_up_months, renovation_downtime_months, renovation_frequency_years overrides
     
     Returns:
-        Cash-on-Cash return as percentage (e.g., 5.5 means 5.5%)
+        Annual cash flow per owner in Year 1 (CHF)
     """
+    if year1_cache is not None and cache_key in year1_cache:
+        return year1_cache[cache_key]
+    
     proj_defaults = get_projection_defaults(json_path)
     ramp_up = int(kwargs.get('ramp_up_months', proj_defaults.get('ramp_up_months', 0)))
     renovation_months = int(kwargs.get('renovation_downtime_months', proj_defaults.get('renovation_downtime_months', 0)))
@@ -453,11 +500,39 @@ def calculate_cash_on_cash(config: BaseCaseConfig, json_path: str,
         ramp_up_months=ramp_up,
         renovation_downtime_months=renovation_months,
         renovation_frequency_years=renovation_frequency,
+        include_stress_results=False,
     )
+    cash_flow_per_owner = year1_projection[0].get('cash_flow_per_owner', 0.0)
+    
+    if year1_cache is not None:
+        year1_cache[cache_key] = cash_flow_per_owner
+    return cash_flow_per_owner
+
+
+def calculate_cash_on_cash(config: BaseCaseConfig, json_path: str, 
+                           property_appreciation_rate: float = None,
+                           projection_years: Optional[int] = None, **kwargs) -> float:
+    """
+    Calculate Cash-on-Cash return for any configuration.
+    
+    Cash-on-Cash = Annual Cash Flow / Initial Equity Investment
+    
+    This is a simple yield metric that shows the annual cash return
+    as a percentage of the equity invested. Unlike IRR, it doesn't
+    consider appreciation or time value of money - just Year 1 cash yield.
+    
+    Args:
+        config: Configuration to test
+        json_path: Path to assumptions (for projection defaults)
+        property_appreciation_rate: Not used for CoC but kept for consistency
+        **kwargs: Ramp-up/renovation overrides and year1_cache/cache_key (see year1_cash_flow_per_owner)
     
+    Returns:
+        Cash-on-Cash return as percentage (e.g., 5.5 means 5.5%)
+    """
     # Cash-on-Cash = Annual Cash Flow per Owner / Equity per Owner * 100
     equity_per_owner = config.financing.equity_per_owner
-    annual_cash_flow_per_owner = year1_projection[0].get('cash_flow_per_owner', 0.0)
+    annual_cash_flow_per_owner = year1_cash_flow_per_owner(config, json_path, **kwargs)
     
     if equity_per_owner == 0:
         return 0.0
@@ -485,28 +560,13 @@ def calculate_monthly_ncf(config: BaseCaseConfig, json_path: str,
         config: Configuration to test
         json_path: Path to assumptions (for projection defaults)
         property_appreciation_rate: Not used but kept for consistency
+        **kwargs: Ramp-up/renovation overrides and year1_cache/cache_key (see year1_cash_flow_per_owner)
     
     Returns:
         Monthly net cash flow per owner in CHF (can be negative!)
     """
-    proj_defaults = get_projection_defaults(json_path)
-    ramp_up = int(kwargs.get('ramp_up_months', proj_defaults.get('ramp_up_months', 0)))
-    renovation_months = int(kwargs.get('renovation_downtime_months', proj_defaults.get('renovation_downtime_months', 0)))
-    renovation_frequency = int(kwargs.get('renovation_frequency_years', proj_defaults.get('renovation_frequency_years', 0)))
-
-    year1_projection = compute_15_year_projection(
-        config=config,
-        start_year=proj_defaults.get('start_year', 2026),
-        projection_years=1,
-        inflation_rate=proj_defaults.get('inflation_rate', 0.01),
-        property_appreciation_rate=proj_defaults.get('property_appreciation_rate', 0.025),
-        ramp_up_months=ramp_up,
-        renovation_downtime_months=renovation_months,
-        renovation_frequency_years=renovation_frequency,
-    )
-
     # Monthly cash flow = Annual cash flow per owner / 12
-    annual_cash_flow_per_owner = year1_projection[0].get('cash_flow_per_owner', 0.0)
+    annual_cash_flow_per_owner = year1_cash_flow_per_owner(config, json_path, **kwargs)
     monthly_ncf = annual_cash_flow_per_owner / 12
     
     return monthly_ncf
@@ -523,7 +583,11 @@ def run_unified_sensitivity_analysis(
     metric_name: str,
     verbose: bool = True,
     include_atcf: bool = False,
-    projection_years: Optional[int] = None
+    projection_years: Optional[int] = None,
+    atcf_cache: Optional[Dict] = None,
+    projection_cache: Optional[Dict] = None,
+    year1_cache: Optional[Dict] = None,
+    config_cache: Optional[Dict] = None
 ) -> Dict:
     """
     Unified sensitivity analysis function that tests all parameters for any metric.
@@ -539,6 +603,17 @@ def run_unified_sensitivity_analysis(
         verbose: Whether to print detailed output
         include_atcf: Whether to also calculate after-tax cash flow per person (for dual metrics)
         projection_years: Horizon in years for projection-based metrics; if None, use defaults (15)
+        atcf_cache: Optional dict shared between runs on the same assumptions file. After-tax
+            cash flow is a Year 1 metric, so per-horizon runs reuse its base/low/high values
+            (keyed by parameter and side) instead of recomputing them
+        projection_cache: Optional dict shared between horizon runs on the same assumptions
+            file. Equity IRR projections are computed once at the longest horizon per
+            parameter and side, and each horizon uses a prefix (see projection_prefix)
+        year1_cache: Optional dict shared between the Cash-on-Cash and Monthly NCF runs on the
+            same assumptions file; both metrics derive from the same Year 1 cash flow per owner
+        config_cache: Optional dict shared between horizon runs on the same assumptions file.
+            The low/high configuration of each parameter does not depend on the horizon, so
+            it is built once (keyed by parameter and side) and reused by every horizon
     
     Returns:
         Dictionary with all sensitivity results
@@ -553,11 +628,35 @@ def run_unified_sensitivity_analysis(
     proj_defaults = get_projection_defaults(json_path)
     years = projection_years if projection_years is not None else proj_defaults.get('projection_years', 15)
     
+    def cache_args(key):
+        # Projection reuse across horizons applies to the Equity IRR calculator,
+        # Year 1 cash flow reuse to the Year 1 metrics
+        if projection_cache is not None and metric_calculator is calculate_equity_irr:
+            return {'projection_cache': projection_cache, 'cache_key': key}
+        if year1_cache is not None and metric_calculator in (calculate_cash_on_cash, calculate_monthly_ncf):
+            return {'year1_cache': year1_cache, 'cache_key': key}
+        return {}
+    
     # Calculate base metric (pass projection_years for horizon; CoC/NCF accept via **kwargs)
-    base_metric = metric_calculator(base_config, json_path, projection_years=years)
+    base_metric = metric_calculator(base_config, json_path, projection_years=years, **cache_args('base'))
+    
+    def cached_atcf(key, config, **kwargs):
+        if atcf_cache is None:
+            return calculate_after_tax_cash_flow_per_person(config, json_path, **kwargs)
+        if key not in atcf_cache:
+            atcf_cache[key] = calculate_after_tax_cash_flow_per_person(config, json_path, **kwargs)
+        return atcf_cache[key]
+    
+    def scenario_config(key, modifier, value):
+        if config_cache is None:
+            return modifier(base_config, value)
+        if key not in config_cache:
+            config_cache[key] = modifier(base_config, value)
+        return config_cache[key]
+    
     base_atcf = None
     if include_atcf:
-        base_atcf = calculate_after_tax_cash_flow_per_person(base_config, json_path)
+        base_atcf = cached_atcf('base', base_config)
     
     if verbose:
         print(f"  Base Case {metric_name}: {base_metric:.2f}")
@@ -565,6 +664,9 @@ def run_unified_sensitivity_analysis(
             print(f"  Base Case After-Tax Cash Flow per Person (monthly): CHF {base_atcf:,.2f}")
     
     sensitivities = []
+    # Loop invariants for the special (projection) parameters below
+    is_irr_metric = metric_name in ('Equity IRR', 'Project IRR')
+    ramp_up = proj_defaults.get('ramp_up_months', 0)
     
     # Test all parameters from MODEL_SENSITIVITY_PARAMETER_CONFIG
     for param_key, param_config in MODEL_SENSITIVITY_PARAMETER_CONFIG.items():
@@ -594,15 +696,19 @@ def run_unified_sensitivity_analysis(
         try:
             if param_key == 'ramp_up_months':
                 # For ramp-up, pass as parameter to metric calculator
-                low_metric_val = metric_calculator(base_config, json_path, projection_years=years, ramp_up_months=int(low_value))
-                high_metric_val = metric_calculator(base_config, json_path, projection_years=years, ramp_up_months=int(high_value))
+                low_metric_val = metric_calculator(base_config, json_path, projection_years=years, ramp_up_months=int(low_value),
+                                                   **cache_args((param_key, 'low')))
+                high_metric_val = metric_calculator(base_config, json_path, projection_years=years, ramp_up_months=int(high_value),
+                                                    **cache_args((param_key, 'high')))
                 low_config = base_config  # No config change
                 high_config = base_config
             else:
-                low_config = modifier(base_config, low_value)
-                low_metric_val = metric_calculator(low_config, json_path, projection_years=years)
-                high_config = modifier(base_config, high_value)
-                high_metric_val = metric_calculator(high_config, json_path, projection_years=years)
+                low_config = scenario_config((param_key, 'low'), modifier, low_value)
+                low_metric_val = metric_calculator(low_config, json_path, projection_years=years,
+                                                   **cache_args((param_key, 'low')))
+                high_config = scenario_config((param_key, 'high'), modifier, high_value)
+                high_metric_val = metric_calculator(high_config, json_path, projection_years=years,
+                                                    **cache_args((param_key, 'high')))
         except Exception as e:
             if verbose:
                 print(f"  Warning: Error testing {param_config['parameter_name']}: {e}")
@@ -616,11 +722,11 @@ def run_unified_sensitivity_analysis(
             try:
                 if param_key == 'ramp_up_months':
                     # For ramp-up, pass as parameter to ATCF calculator
-                    low_atcf_val = calculate_after_tax_cash_flow_per_person(base_config, json_path, ramp_up_months=int(low_value))
-                    high_atcf_val = calculate_after_tax_cash_flow_per_person(base_config, json_path, ramp_up_months=int(high_value))
+                    low_atcf_val = cached_atcf((param_key, 'low'), base_config, ramp_up_months=int(low_value))
+                    high_atcf_val = cached_atcf((param_key, 'high'), base_config, ramp_up_months=int(high_value))
                 else:
-                    low_atcf_val = calculate_after_tax_cash_flow_per_person(low_config, json_path)
-                    high_atcf_val = calculate_after_tax_cash_flow_per_person(high_config, json_path)
+                    low_atcf_val = cached_atcf((param_key, 'low'), low_config)
+                    high_atcf_val = cached_atcf((param_key, 'high'), high_config)
             except (ValueError, KeyError, TypeError) as e:
                 # If ATCF calculation fails (missing data, invalid config), use base value
                 print(f"Warning: ATCF calculation failed for {param_config['parameter_name']}: {e}")
@@ -658,10 +764,16 @@ def run_unified_sensitivity_analysis(
     
     # For metrics that use projection (like IRR), test with different appreciation rates
     # For Year 1 metrics (like CoC, NCF), appreciation has no effect
-    if metric_name in ['Equity IRR', 'Project IRR']:
-        base_irr_appr = calculate_equity_irr(base_config, json_path, base_appr, projection_years=years)
-        low_irr_appr = calculate_equity_irr(base_config, json_path, low_appr, projection_years=years)
-        high_irr_appr = calculate_equity_irr(base_config, json_path, high_appr, projection_years=years)
+    if is_irr_metric:
+        # At the base appreciation rate this is the base metric already computed above
+        if metric_calculator is calculate_equity_irr:
+            base_irr_appr = base_metric
+        else:
+            base_irr_appr = calculate_equity_irr(base_config, json_path, base_appr, projection_years=years)
+        low_irr_appr = calculate_equity_irr(base_config, json_path, low_appr, projection_years=years,
+                                            projection_cache=projection_cache, cache_key=('property_appreciation', 'low'))
+        high_irr_appr = calculate_equity_irr(base_config, json_path, high_appr, projection_years=years,
+                                             projection_cache=projection_cache, cache_key=('property_appreciation', 'high'))
         
         # ATCF doesn't change with appreciation (Year 1 metric)
         base_atcf_appr = base_atcf if include_atcf else None
@@ -706,38 +818,25 @@ def run_unified_sensitivity_analysis(
         clamp_min=0.0
     )
     
-    if metric_name in ['Equity IRR', 'Project IRR']:
+    if is_irr_metric:
         # Test inflation sensitivity for IRR (affects projection)
-        def test_inflation_sensitivity(base_cfg, inflation_rate, ramp_up_months):
-            compute_annual_cash_flows(base_cfg)
-            projection = compute_15_year_projection(
+        def test_inflation_sensitivity(base_cfg, inflation_rate, ramp_up_months, side):
+            projection = projection_prefix(projection_cache, ('inflation', side), years, lambda n: compute_15_year_projection(
                 base_cfg,
                 start_year=proj_defaults['start_year'],
                 inflation_rate=inflation_rate,
                 property_appreciation_rate=proj_defaults['property_appreciation_rate'],
-                projection_years=years,
+                projection_years=n,
                 ramp_up_months=ramp_up_months,
                 renovation_downtime_months=proj_defaults.get('renovation_downtime_months', 0),
-                renovation_frequency_years=proj_defaults.get('renovation_frequency_years', 0)
-            )
-            irr_results = calculate_irrs_from_projection(
-                projection,
-                base_cfg.financing.total_initial_investment_per_owner,
-                projection[-1]['property_value'],
-                projection[-1]['remaining_loan_balance'],
-                base_cfg.financing.num_owners,
-                base_cfg.financing.purchase_price,
-                proj_defaults['selling_costs_rate'],
-                proj_defaults['discount_rate'],
-                proj_defaults.get('capital_gains_tax_rate', 0.02),
-                proj_defaults.get('property_transfer_tax_sale_rate', 0.015)
-            )
-            return irr_results['equity_irr_with_sale_pct']
+                renovation_frequency_years=proj_defaults.get('renovation_frequency_years', 0),
+                include_stress_results=False
+            ))
+            return equity_irr_from_projection(base_cfg, projection, proj_defaults)
         
-        ramp_up = proj_defaults.get('ramp_up_months', 0)
         base_irr_inflation = base_metric
-        low_irr_inflation = test_inflation_sensitivity(base_config, low_inflation, ramp_up)
-        high_irr_inflation = test_inflation_sensitivity(base_config, high_inflation, ramp_up)
+        low_irr_inflation = test_inflation_sensitivity(base_config, low_inflation, ramp_up, 'low')
+        high_irr_inflation = test_inflation_sensitivity(base_config, high_inflation, ramp_up, 'high')
         
         sensitivities.append(create_sensitivity_result(
             'Inflation Rate',
@@ -771,35 +870,23 @@ def run_unified_sensitivity_analysis(
         clamp_min=0.05
     )
     
-    if metric_name in ['Equity IRR', 'Project IRR']:
+    if is_irr_metric:
         # Test selling costs sensitivity for IRR (affects exit value)
         def test_selling_costs_irr(base_cfg, selling_rate, ramp_up_months):
-            compute_annual_cash_flows(base_cfg)
-            projection = compute_15_year_projection(
+            # The selling rate only enters at exit, so low and high share one projection
+            projection = projection_prefix(projection_cache, 'selling_costs', years, lambda n: compute_15_year_projection(
                 base_cfg,
                 start_year=proj_defaults['start_year'],
                 inflation_rate=proj_defaults['inflation_rate'],
                 property_appreciation_rate=proj_defaults['property_appreciation_rate'],
-                projection_years=years,
+                projection_years=n,
                 ramp_up_months=ramp_up_months,
                 renovation_downtime_months=proj_defaults.get('renovation_downtime_months', 0),
-                renovation_frequency_years=proj_defaults.get('renovation_frequency_years', 0)
-            )
-            irr_results = calculate_irrs_from_projection(
-                projection,
-                base_cfg.financing.total_initial_investment_per_owner,
-                projection[-1]['property_value'],
-                projection[-1]['remaining_loan_balance'],
-                base_cfg.financing.num_owners,
-                base_cfg.financing.purchase_price,
-                selling_rate,
-                proj_defaults['discount_rate'],
-                proj_defaults.get('capital_gains_tax_rate', 0.02),
-                proj_defaults.get('property_transfer_tax_sale_rate', 0.015)
-            )
-            return irr_results['equity_irr_with_sale_pct']
+                renovation_frequency_years=proj_defaults.get('renovation_frequency_years', 0),
+                include_stress_results=False
+            ))
+            return equity_irr_from_projection(base_cfg, projection, proj_defaults, selling_rate)
         
-        ramp_up = proj_defaults.get('ramp_up_months', 0)
         base_irr_selling = base_metric
         low_irr_selling = test_selling_costs_irr(base_config, low_selling, ramp_up)
         high_irr_selling = test_selling_costs_irr(base_config, high_selling, ramp_up)
@@ -913,6 +1000,9 @@ def run_sensitivity_analysis(json_path: str, case_name: str, verbose: bool = Tru
     """
     by_horizon = {}
     output_data_15 = None
+    atcf_cache = {}  # Year 1 cash flows do not depend on the horizon
+    projection_cache = {}  # Shorter horizons are prefixes of the longest projection
+    config_cache = {}  # Low/high parameter configurations do not depend on the horizon
     for horizon in HORIZONS:
         out = run_unified_sensitivity_analysis(
             json_path=json_path,
@@ -921,7 +1011,10 @@ def run_sensitivity_analysis(json_path: str, case_name: str, verbose: bool = Tru
             metric_name='Equity IRR',
             verbose=verbose if horizon == 15 else False,
             include_atcf=True,
-            projection_years=horizon
+            projection_years=horizon,
+            atcf_cache=atcf_cache,
+            projection_cache=projection_cache,
+            config_cache=config_cache
         )
         by_horizon[str(horizon)] = {
             'sensitivities': out.get('sensitivities', []),
@@ -942,7 +1035,8 @@ def run_sensitivity_analysis(json_path: str, case_name: str, verbose: bool = Tru
     return output_data
 
 
-def run_cash_on_cash_sensitivity_analysis(json_path: str, case_name: str, verbose: bool = True) -> Dict:
+def run_cash_on_cash_sensitivity_analysis(json_path: str, case_name: str, verbose: bool = True,
+                                          year1_cache: Optional[Dict] = None) -> Dict:
     """
     Run Model Sensitivity analysis on Cash-on-Cash return for all 15 parameters.
     
@@ -963,6 +1057,8 @@ def run_cash_on_cash_sensitivity_analysis(json_path: str, case_name: str, verbos
         json_path: Path to assumptions JSON file
         case_name: Name of the case
         verbose: Whether to print detailed output
+        year1_cache: Optional dict shared with the other Year 1 metric run on the same
+            assumptions file (see run_unified_sensitivity_analysis)
     
     Returns:
         Dictionary with all sensitivity results
@@ -974,7 +1070,8 @@ def run_cash_on_cash_sensitivity_analysis(json_path: str, case_name: str, verbos
         metric_calculator=calculate_cash_on_cash,
         metric_name='Cash-on-Cash',
         verbose=verbose,
-        include_atcf=False
+        include_atcf=False,
+        year1_cache=year1_cache
     )
     # Duplicate same result under each horizon for uniform UI (by_horizon[horizon]).
     # CoC is a Year-1 metric and does not vary by time horizon; the UI hides the horizon
@@ -990,7 +1087,8 @@ def run_cash_on_cash_sensitivity_analysis(json_path: str, case_name: str, verbos
     return output_data
 
 
-def run_monthly_ncf_sensitivity_analysis(json_path: str, case_name: str, verbose: bool = True) -> Dict:
+def run_monthly_ncf_sensitivity_analysis(json_path: str, case_name: str, verbose: bool = True,
+                                         year1_cache: Optional[Dict] = None) -> Dict:
     """
     Run Model Sensitivity analysis on Monthly Net Cash Flow per Owner.
     
@@ -1008,6 +1106,8 @@ def run_monthly_ncf_sensitivity_analysis(json_path: str, case_name: str, verbose
         json_path: Path to assumptions JSON file
         case_name: Name of the case
         verbose: Whether to print detailed output
+        year1_cache: Optional dict shared with the other Year 1 metric run on the same
+            assumptions file (see run_unified_sensitivity_analysis)
     
     Returns:
         Dictionary with all sensitivity results
@@ -1019,7 +1119,8 @@ def run_monthly_ncf_sensitivity_analysis(json_path: str, case_name: str, verbose
         metric_calculator=calculate_monthly_ncf,
         metric_name='Monthly NCF',
         verbose=verbose,
-        include_atcf=False
+        include_atcf=False,
+        year1_cache=year1_cache
     )
     # Duplicate same result under each horizon for uniform UI (by_horizon[horizon]).
     # Monthly NCF is a Year-1 metric and does not vary by time horizon; the UI hides the
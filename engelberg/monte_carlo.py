@@ -12,11 +12,11 @@ ACCURACY IMPROVEMENTS:
 - Correlation support: Realistic parameter relationships via Gaussian copula
 
 EFFICIENCY IMPROVEMENTS:
-- Parallel processing: Utilizes multiple CPU cores (default: CPU count - 1)
-  - Significant speedup for large simulations (typically 4-8x faster)
-  - Automatic fallback to sequential if parallel fails
-- Vectorized sampling: All parameters sampled at once before simulation loop
-- Optimized chunking: Efficient batch processing for parallel execution
+- Vectorized simulation: All paths evaluated at once as (N, 15) NumPy arrays
+  (compute_annual_cash_flows_vec / compute_15_year_projection_vec) instead of
+  one Python-level projection per simulation
+- Parallel processing: Large runs sharded across CPU cores (multiprocessing.Pool)
+- Vectorized sampling: All parameters sampled at once before simulation
 
 FEATURES:
 - Expanded stochastic inputs (seasonality, expenses, inflation)
@@ -24,25 +24,40 @@ FEATURES:
 - Comprehensive output with all sampled parameters and results
 """
 
+import os
+import zlib
+from itertools import chain
+from operator import itemgetter
 import numpy as np
 import pandas as pd
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
-from scipy.stats import beta, lognorm, triang, norm
-from scipy.linalg import cholesky
+from scipy.special import betaincinv, ndtr, ndtri
+from scipy.linalg import cho_factor
 from engelberg.core import (
     create_base_case_config,
     BaseCaseConfig,
     compute_annual_cash_flows,
     compute_15_year_projection,
     calculate_irrs_from_projection,
+    SELLING_COSTS_RATE,
+    CAPITAL_GAINS_TAX_RATE,
+    PROPERTY_TRANSFER_TAX_SALE_RATE,
+    compute_annual_cash_flows_vec,
+    compute_15_year_projection_vec,
+    calculate_irr_vec,
+    calculate_npv,
     apply_sensitivity  # Use the centralized sensitivity function
 )
 from datetime import datetime
-from typing import Dict, List, Optional, Tuple
-from dataclasses import dataclass
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Tuple, Union
+from dataclasses import dataclass, replace
+from functools import lru_cache
 from multiprocessing import Pool, cpu_count
 
+# Plotly is only needed to build and render the report charts; it is imported
+# where it is used so simulation-only callers do not pay for it at import time
+if TYPE_CHECKING:
+    import plotly.graph_objects as go
+
 # Import shared layout functions
 try:
     from analysis_sensitivity import (
@@ -75,6 +90,43 @@ CHART_COLORS = {
 # Distribution Types
 # -----------------------------
 
+def _sample_uniform(params: Dict[str, float], size: int) -> np.ndarray:
+    return np.random.uniform(params['min'], params['max'], size)
+
+
+def _sample_normal(params: Dict[str, float], size: int) -> np.ndarray:
+    return np.random.normal(params['mean'], params['std'], size)
+
+
+# Direct samplers draw from the global NumPy RandomState (seeded via
+# np.random.seed), like the rest of the simulation, without scipy.stats'
+# per-call distribution dispatch and argument validation
+def _sample_triangular(params: Dict[str, float], size: int) -> np.ndarray:
+    return np.random.triangular(params['min'], params['mode'], params['max'], size)
+
+
+def _sample_beta(params: Dict[str, float], size: int) -> np.ndarray:
+    # Beta distribution: alpha and beta shape parameters
+    # Scale to [min, max] range
+    low = params.get('min', 0)
+    return low + (params.get('max', 1) - low) * np.random.beta(params['alpha'], params['beta'], size)
+
+
+def _sample_lognormal(params: Dict[str, float], size: int) -> np.ndarray:
+    # Lognormal: mean and std of underlying normal distribution
+    return np.random.lognormal(params['mean'], params['std'], size)
+
+
+# Sampler dispatch table: dist_type -> sampler(params, size)
+_SAMPLERS: Dict[str, Callable[[Dict[str, float], int], np.ndarray]] = {
+    'uniform': _sample_uniform,
+    'normal': _sample_normal,
+    'triangular': _sample_triangular,
+    'beta': _sample_beta,
+    'lognormal': _sample_lognormal,
+}
+
+
 @dataclass
 class DistributionConfig:
     """Configuration for a random variable distribution."""
@@ -84,36 +136,10 @@ class DistributionConfig:
     
     def sample(self, size: int = 1) -> np.ndarray:
         """Sample from the distribution."""
-        if self.dist_type == 'uniform':
-            samples = np.random.uniform(self.params['min'], self.params['max'], size)
-        elif self.dist_type == 'normal':
-            samples = np.random.normal(self.params['mean'], self.params['std'], size)
-        elif self.dist_type == 'triangular':
-            samples = triang.rvs(
-                c=(self.params['mode'] - self.params['min']) / (self.params['max'] - self.params['min']),
-                loc=self.params['min'],
-                scale=self.params['max'] - self.params['min'],
-                size=size
-            )
-        elif self.dist_type == 'beta':
-            # Beta distribution: alpha and beta shape parameters
-            # Scale to [min, max] range
-            samples = beta.rvs(
-                self.params['alpha'],
-                self.params['beta'],
-                loc=self.params.get('min', 0),
-                scale=self.params.get('max', 1) - self.params.get('min', 0),
-                size=size
-            )
-        elif self.dist_type == 'lognormal':
-            # Lognormal: mean and std of underlying normal distribution
-            samples = lognorm.rvs(
-                s=self.params['std'],
-                scale=np.exp(self.params['mean']),
-                size=size
-            )
-        else:
+        sampler = _SAMPLERS.get(self.dist_type)
+        if sampler is None:
             raise ValueError(f"Unknown distribution type: {self.dist_type}")
+        samples = sampler(self.params, size)
         
         # Clip to bounds if provided
         if self.bounds:
@@ -122,6 +148,105 @@ class DistributionConfig:
         return samples
 
 
+def _triangular_ppf(u: np.ndarray, params: Dict[str, float]) -> np.ndarray:
+    """
+    Inverse CDF of the triangular distribution.
+    
+    Selects the left or right branch argument first and takes a single sqrt
+    over the whole array, instead of evaluating both branches' sqrt terms.
+    """
+    lo, mode, hi = params['min'], params['mode'], params['max']
+    width = hi - lo
+    left = u < (mode - lo) / width
+    root = np.where(left, u * width * (mode - lo), (1 - u) * width * (hi - mode))
+    np.sqrt(root, out=root)
+    return np.where(left, lo + root, hi - root)
+
+
+def _correlation_cholesky(correlation_matrix: np.ndarray) -> np.ndarray:
+    """
+    Lower-triangular Cholesky factor of a correlation matrix.
+    
+    The matrix is only regularized if the plain factorization fails: the
+    diagonal of a private copy is then bumped in place by escalating jitter
+    (1e-9, 1e-7, 1e-5) until the factorization succeeds.
+    
+    Args:
+        correlation_matrix: Symmetric correlation matrix
+    
+    Returns:
+        Lower-triangular matrix L with L @ L.T == correlation_matrix (up to jitter)
+    """
+    try:
+        c, _ = cho_factor(correlation_matrix, lower=True, check_finite=False)
+        return np.tril(c)
+    except np.linalg.LinAlgError:
+        pass
+    
+    corr = np.array(correlation_matrix, dtype=float)
+    for jitter in (1e-9, 1e-7, 1e-5):
+        np.fill_diagonal(corr, corr.diagonal() + jitter)
+        try:
+            c, _ = cho_factor(corr, lower=True, check_finite=False)
+            return np.tril(c)
+        except np.linalg.LinAlgError:
+            continue
+    
+    raise np.linalg.LinAlgError(
+        "Correlation matrix is not positive definite, even after diagonal regularization"
+    )
+
+
+def _inverse_transform_block(distributions: Dict[str, DistributionConfig],
+                             U: np.ndarray) -> Dict[str, np.ndarray]:
+    """
+    Map uniform draws to the target distributions via their inverse CDFs.
+    
+    All variables are written into one contiguous (n_vars, size) block so the
+    returned dict values are stride-1 row views rather than separate arrays.
+    
+    Args:
+        distributions: Dictionary mapping variable names to DistributionConfig
+        U: Uniform [0, 1] draws, shape (n_vars, size), one row per variable in
+           the order of ``distributions``
+    
+    Returns:
+        Dictionary mapping variable names to sampled arrays
+    """
+    var_names = list(distributions.keys())
+    size = U.shape[1]
+    block = np.empty((len(var_names), size), dtype=np.float64, order='C')
+    for i, var_name in enumerate(var_names):
+        dist = distributions[var_name]
+        u = U[i]
+        
+        # Use inverse CDF (PPF) for each distribution type
+        if dist.dist_type == 'uniform':
+            block[i] = dist.params['min'] + u * (dist.params['max'] - dist.params['min'])
+        elif dist.dist_type == 'normal':
+            block[i] = dist.params['mean'] + dist.params['std'] * ndtri(u)
+        elif dist.dist_type == 'triangular':
+            block[i] = _triangular_ppf(u, dist.params)
+        elif dist.dist_type == 'beta':
+            # beta(a, b, loc, scale).ppf(u) == loc + scale * betaincinv(a, b, u)
+            lo = dist.params.get('min', 0)
+            block[i] = lo + (dist.params.get('max', 1) - lo) * betaincinv(
+                dist.params['alpha'], dist.params['beta'], u
+            )
+        elif dist.dist_type == 'lognormal':
+            # lognorm(s, scale=exp(mean)).ppf(u) == exp(mean + s * ndtri(u))
+            block[i] = np.exp(dist.params['mean'] + dist.params['std'] * ndtri(u))
+        else:
+            # Fallback: sample independently
+            block[i] = dist.sample(size)
+        
+        # Clip to bounds if provided
+        if dist.bounds:
+            np.clip(block[i], dist.bounds[0], dist.bounds[1], out=block[i])
+    
+    return {var_name: block[i] for i, var_name in enumerate(var_names)}
+
+
 def sample_correlated_variables(
     distributions: Dict[str, DistributionConfig],
     correlation_matrix: np.ndarray,
@@ -139,10 +264,10 @@ def sample_correlated_variables(
         size: Number of samples to generate
     
     Returns:
-        Dictionary mapping variable names to sampled arrays
+        Dictionary mapping variable names to sampled arrays (row views into a
+        single contiguous (n_vars, size) array)
     """
-    var_names = list(distributions.keys())
-    n_vars = len(var_names)
+    n_vars = len(distributions)
     
     # Validate correlation matrix
     if correlation_matrix.shape != (n_vars, n_vars):
@@ -152,69 +277,19 @@ def sample_correlated_variables(
     if not np.allclose(correlation_matrix, correlation_matrix.T):
         raise ValueError("Correlation matrix must be symmetric")
     
-    # Generate independent standard normal samples
-    Z = np.random.normal(0, 1, size=(size, n_vars))
+    # Generate independent standard normal samples, one row per variable
+    Z = np.random.normal(0, 1, size=(n_vars, size))
     
     # Cholesky decomposition of correlation matrix
-    try:
-        L = cholesky(correlation_matrix, lower=True)
-    except np.linalg.LinAlgError:
-        # If not positive definite, use nearest positive definite matrix
-        # Simple approach: add small value to diagonal
-        correlation_matrix = correlation_matrix + np.eye(n_vars) * 1e-6
-        L = cholesky(correlation_matrix, lower=True)
+    L = _correlation_cholesky(correlation_matrix)
     
     # Transform to correlated standard normals
-    X = Z @ L.T
-    
-    # Transform to uniform [0, 1] using CDF of standard normal
-    from scipy.stats import norm
-    U = norm.cdf(X)
+    X = L @ Z
     
-    # Sample from each distribution using inverse transform sampling
-    results = {}
-    for i, var_name in enumerate(var_names):
-        dist = distributions[var_name]
-        
-        # Use inverse CDF (PPF) for each distribution type
-        if dist.dist_type == 'uniform':
-            samples = dist.params['min'] + U[:, i] * (dist.params['max'] - dist.params['min'])
-        elif dist.dist_type == 'normal':
-            samples = norm.ppf(U[:, i], loc=dist.params['mean'], scale=dist.params['std'])
-        elif dist.dist_type == 'triangular':
-            # Manual inverse CDF for triangular
-            c = (dist.params['mode'] - dist.params['min']) / (dist.params['max'] - dist.params['min'])
-            u = U[:, i]
-            samples = np.where(
-                u < c,
-                dist.params['min'] + np.sqrt(u * (dist.params['max'] - dist.params['min']) * (dist.params['mode'] - dist.params['min'])),
-                dist.params['max'] - np.sqrt((1 - u) * (dist.params['max'] - dist.params['min']) * (dist.params['max'] - dist.params['mode']))
-            )
-        elif dist.dist_type == 'beta':
-            samples = beta.ppf(
-                U[:, i],
-                dist.params['alpha'],
-                dist.params['beta'],
-                loc=dist.params.get('min', 0),
-                scale=dist.params.get('max', 1) - dist.params.get('min', 0)
-            )
-        elif dist.dist_type == 'lognormal':
-            samples = lognorm.ppf(
-                U[:, i],
-                s=dist.params['std'],
-                scale=np.exp(dist.params['mean'])
-            )
-        else:
-            # Fallback: sample independently
-            samples = dist.sample(size)
-        
-        # Clip to bounds if provided
-        if dist.bounds:
-            samples = np.clip(samples, dist.bounds[0], dist.bounds[1])
-        
-        results[var_name] = samples
+    # Transform to uniform [0, 1] using CDF of standard normal (in place)
+    U = ndtr(X, out=X)
     
-    return results
+    return _inverse_transform_block(distributions, U)
 
 
 def latin_hypercube_sample(distributions: Dict[str, DistributionConfig],
@@ -232,93 +307,32 @@ def latin_hypercube_sample(distributions: Dict[str, DistributionConfig],
         size: Number of samples to generate
     
     Returns:
-        Dictionary mapping variable names to sampled arrays
+        Dictionary mapping variable names to sampled arrays (row views into a
+        single contiguous (n_vars, size) array)
     """
-    var_names = list(distributions.keys())
-    n_vars = len(var_names)
+    n_vars = len(distributions)
+    
+    # Generate LHS samples in [0, 1]^n: each variable gets one uniform draw in
+    # each of the `size` equal strata, in an independent random order
+    # (argsort of uniform noise is a uniformly random permutation per row)
+    strata = np.argsort(np.random.random((n_vars, size)), axis=1)
+    lhs_samples = (strata + np.random.random((n_vars, size))) / size
     
     if correlation_matrix is not None and n_vars > 1:
-        # For correlated variables, use LHS on uniform space then transform
-        # Generate LHS samples in [0, 1]^n
-        lhs_samples = np.zeros((size, n_vars))
-        for i in range(n_vars):
-            # Create LHS intervals
-            intervals = np.linspace(0, 1, size + 1)
-            for j in range(size):
-                lhs_samples[j, i] = np.random.uniform(intervals[j], intervals[j + 1])
-        
-        # Randomly permute each column to break correlations
-        for i in range(n_vars):
-            np.random.shuffle(lhs_samples[:, i])
-        
         # Transform to correlated uniform space using Gaussian copula
-        Z = norm.ppf(lhs_samples)
+        Z = ndtri(lhs_samples, out=lhs_samples)
         
         # Apply correlation
-        try:
-            L = cholesky(correlation_matrix, lower=True)
-            X = Z @ L.T
-        except np.linalg.LinAlgError:
-            # Fallback if correlation matrix not positive definite
-            correlation_matrix = correlation_matrix + np.eye(n_vars) * 1e-6
-            L = cholesky(correlation_matrix, lower=True)
-            X = Z @ L.T
+        L = _correlation_cholesky(correlation_matrix)
+        X = L @ Z
         
         # Transform back to uniform
-        U = norm.cdf(X)
+        U = ndtr(X, out=X)
     else:
         # Independent LHS sampling
-        lhs_samples = np.zeros((size, n_vars))
-        for i in range(n_vars):
-            intervals = np.linspace(0, 1, size + 1)
-            for j in range(size):
-                lhs_samples[j, i] = np.random.uniform(intervals[j], intervals[j + 1])
-            np.random.shuffle(lhs_samples[:, i])
         U = lhs_samples
     
-    # Transform uniform samples to target distributions
-    results = {}
-    for i, var_name in enumerate(var_names):
-        dist = distributions[var_name]
-        
-        # Use inverse CDF (PPF) for each distribution type
-        if dist.dist_type == 'uniform':
-            samples = dist.params['min'] + U[:, i] * (dist.params['max'] - dist.params['min'])
-        elif dist.dist_type == 'normal':
-            samples = norm.ppf(U[:, i], loc=dist.params['mean'], scale=dist.params['std'])
-        elif dist.dist_type == 'triangular':
-            c = (dist.params['mode'] - dist.params['min']) / (dist.params['max'] - dist.params['min'])
-            u = U[:, i]
-            samples = np.where(
-                u < c,
-                dist.params['min'] + np.sqrt(u * (dist.params['max'] - dist.params['min']) * (dist.params['mode'] - dist.params['min'])),
-                dist.params['max'] - np.sqrt((1 - u) * (dist.params['max'] - dist.params['min']) * (dist.params['max'] - dist.params['mode']))
-            )
-        elif dist.dist_type == 'beta':
-            samples = beta.ppf(
-                U[:, i],
-                dist.params['alpha'],
-                dist.params['beta'],
-                loc=dist.params.get('min', 0),
-                scale=dist.params.get('max', 1) - dist.params.get('min', 0)
-            )
-        elif dist.dist_type == 'lognormal':
-            samples = lognorm.ppf(
-                U[:, i],
-                s=dist.params['std'],
-                scale=np.exp(dist.params['mean'])
-            )
-        else:
-            # Fallback: sample independently
-            samples = dist.sample(size)
-        
-        # Clip to bounds if provided
-        if dist.bounds:
-            samples = np.clip(samples, dist.bounds[0], dist.bounds[1])
-        
-        results[var_name] = samples
-    
-    return results
+    return _inverse_transform_block(distributions, U)
 
 
 def generate_time_series(base_value: float, mean_reversion: float, innovation_std: float, 
@@ -363,17 +377,11 @@ def generate_maintenance_events(num_years: int = 15,
     Returns:
         List of (year, cost) tuples for maintenance events
     """
-    events = []
-    for year in range(1, num_years + 1):
-        # Poisson process: probability of event in this year
-        if np.random.poisson(lambda_rate) > 0:
-            # Sample maintenance cost (lognormal distribution)
-            # Mean CHF 15,000, std 0.5 (on log scale)
-            cost = np.random.lognormal(mean=np.log(15000), sigma=0.5)
-            cost = np.clip(cost, 5000, 50000)  # Bound between 5k and 50k CHF
-            events.append((year, cost))
-    
-    return events
+    # One path of the batch sampler: all years drawn at once instead of one
+    # Poisson and one lognormal draw per year (costs are >= 5k CHF, so a
+    # non-zero cost marks an event year)
+    costs = _generate_maintenance_costs_batch(1, num_years, lambda_rate)[0]
+    return [(year, cost) for year, cost in enumerate(costs.tolist(), start=1) if cost > 0]
 
 
 def evaluate_refinancing(current_loan_balance: float, current_rate: float, 
@@ -444,11 +452,147 @@ def apply_market_shock(year: int, base_occupancy: float, base_rate: float,
         }
 
 
+def _generate_time_series_batch(base_values: np.ndarray, mean_reversion: float, innovation_std: float,
+                                num_years: int = 15,
+                                bounds: Optional[Tuple[float, float]] = None) -> np.ndarray:
+    """
+    Batch version of generate_time_series: one AR(1) path per base value.
+    
+    Returns:
+        (N, num_years) array; column 0 is the base value itself
+    """
+    base_values = np.asarray(base_values, dtype=float)
+    series = np.empty((base_values.size, num_years))
+    series[:, 0] = base_values
+    innovations = np.random.normal(0, innovation_std, size=(base_values.size, num_years - 1))
+    for t in range(1, num_years):
+        series[:, t] = base_values + mean_reversion * (series[:, t - 1] - base_values) + innovations[:, t - 1]
+        if bounds:
+            np.clip(series[:, t], bounds[0], bounds[1], out=series[:, t])
+    return series
+
+
+def _generate_maintenance_costs_batch(size: int, num_years: int = 15,
+                                      lambda_rate: float = 0.15) -> np.ndarray:
+    """
+    Batch version of generate_maintenance_events.
+    
+    Returns:
+        (size, num_years) array of major maintenance costs (0.0 in years without an event)
+    """
+    occurred = np.random.poisson(lambda_rate, size=(size, num_years)) > 0
+    costs = np.clip(np.random.lognormal(mean=np.log(15000), sigma=0.5, size=(size, num_years)), 5000, 50000)
+    return np.where(occurred, costs, 0.0)
+
+
+def _resolve_market_shocks(occurred: np.ndarray, occupancy_multiplier: np.ndarray,
+                           rate_multiplier: np.ndarray, value_multiplier: np.ndarray,
+                           recovery_years: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Replay shock draws through the recovery schedule of compute_15_year_projection.
+    
+    In a shock year the shock multipliers apply; afterwards the multipliers move
+    linearly back to 1.0 over recovery_years, then the shock is cleared.
+    
+    Args:
+        occurred: Boolean (N, years) array, True where a shock starts
+        occupancy_multiplier, rate_multiplier, value_multiplier: Shock multipliers, (N, years)
+        recovery_years: Recovery period of each shock, (N, years)
+    
+    Returns:
+        (occupancy, rate, value) multipliers in effect per path and year, each (N, years)
+    """
+    size, num_years = occurred.shape
+    occ_mult = np.ones((size, num_years))
+    rate_mult = np.ones((size, num_years))
+    value_mult = np.ones((size, num_years))
+    
+    # Per-path recovery state (mirrors active_shock / shock_recovery_progress)
+    active = np.zeros(size, dtype=bool)
+    progress = np.zeros(size, dtype=np.int64)
+    recovery = np.ones(size, dtype=np.int64)
+    active_occ = np.ones(size)
+    active_rate = np.ones(size)
+    active_value = np.ones(size)
+    
+    for t in range(num_years):
+        hit = occurred[:, t]
+        recovering = ~hit & active & (progress < recovery)
+        ending = ~hit & active & ~recovering
+        
+        fraction = progress / recovery
+        occ_mult[:, t] = np.where(hit, occupancy_multiplier[:, t],
+                                  np.where(recovering, active_occ + (1.0 - active_occ) * fraction, 1.0))
+        rate_mult[:, t] = np.where(hit, rate_multiplier[:, t],
+                                   np.where(recovering, active_rate + (1.0 - active_rate) * fraction, 1.0))
+        value_mult[:, t] = np.where(hit, value_multiplier[:, t],
+                                    np.where(recovering, active_value + (1.0 - active_value) * fraction, 1.0))
+        
+        active = (active | hit) & ~ending
+        progress = np.where(hit | ending, 0, progress + recovering)
+        recovery = np.where(hit, recovery_years[:, t], recovery)
+        active_occ = np.where(hit, occupancy_multiplier[:, t], active_occ)
+        active_rate = np.where(hit, rate_multiplier[:, t], active_rate)
+        active_value = np.where(hit, value_multiplier[:, t], active_value)
+    
+    return occ_mult, rate_mult, value_mult
+
+
+def _generate_market_shock_multipliers_batch(size: int, num_years: int = 15,
+                                             shock_probability: float = 0.03) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Batch version of apply_market_shock, resolved into per-year multipliers.
+    
+    Returns:
+        (occupancy, rate, value) multiplier arrays, each (size, num_years)
+    """
+    occurred = np.random.random((size, num_years)) < shock_probability
+    return _resolve_market_shocks(
+        occurred,
+        1.0 + np.random.uniform(-0.50, -0.30, (size, num_years)),
+        1.0 + np.random.uniform(-0.30, -0.20, (size, num_years)),
+        1.0 + np.random.uniform(-0.20, -0.10, (size, num_years)),
+        np.random.randint(1, 4, (size, num_years))
+    )
+
+
+def _generate_refinancing_batch(size: int, initial_rate: float, current_rate: float,
+                                loan_amount: float, amortization_rate: float,
+                                num_years: int = 15,
+                                refinancing_cost_rate: float = 0.015) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Batch version of the refinancing checks in run_single_simulation.
+    
+    Every third year a market rate is drawn; refinancing happens as in
+    evaluate_refinancing and the new rate applies from that year onward.
+    
+    Args:
+        size: Number of paths
+        initial_rate: Rate the projection starts from (SARON base in tranche mode)
+        current_rate: Contract rate the market rate is compared against
+        loan_amount: Initial loan amount
+        amortization_rate: Annual amortization rate (for the approximate balance)
+    
+    Returns:
+        (rate_paths, refinancing_costs), each (size, num_years)
+    """
+    rate_paths = np.full((size, num_years), float(initial_rate))
+    refinancing_costs = np.zeros((size, num_years))
+    for year in range(3, num_years + 1, 3):
+        market_rate = np.maximum(0.005, current_rate + np.random.normal(0, 0.005, size))
+        approx_loan_balance = loan_amount * (1 - (year - 1) * amortization_rate)
+        refinance = ((current_rate - market_rate) > 0.005) & (np.random.random(size) < 0.7)
+        rate_paths[:, year - 1:] = np.where(refinance[:, None], market_rate[:, None], rate_paths[:, year - 1:])
+        refinancing_costs[:, year - 1] = np.where(refinance, approx_loan_balance * refinancing_cost_rate, 0.0)
+    return rate_paths, refinancing_costs
+
+
 def run_single_simulation(args: Tuple) -> Dict:
     """
     Run a single Monte Carlo simulation.
     
-    This function is designed to be called in parallel for efficiency.
+    Scalar reference implementation of one path; run_monte_carlo_simulation
+    evaluates all paths at once through _simulate_batch.
     
     Args:
         args: Tuple containing (simulation_index, sampled_values, base_config, 
@@ -610,7 +754,8 @@ def run_single_simulation(args: Tuple) -> Dict:
         appreciation_series=appreciation_series.tolist(),
         maintenance_events=maintenance_events,
         market_shocks=market_shocks,
-        refinancing_events=refinancing_events
+        refinancing_events=refinancing_events,
+        include_stress_results=False
     )
     
     # Get final values
@@ -632,10 +777,7 @@ def run_single_simulation(args: Tuple) -> Dict:
     cash_flows = [year['cash_flow_per_owner'] for year in projection]
     sale_proceeds_per_owner = (final_property_value - final_loan_balance) / config.financing.num_owners
     
-    npv = -total_initial_investment
-    for j, cf in enumerate(cash_flows):
-        npv += cf / ((1 + discount_rate) ** (j + 1))
-    npv += sale_proceeds_per_owner / ((1 + discount_rate) ** len(cash_flows))
+    npv = calculate_npv(cash_flows, total_initial_investment, discount_rate, sale_proceeds_per_owner)
     
     # Build result row
     result_row = {
@@ -690,9 +832,310 @@ def run_single_simulation(args: Tuple) -> Dict:
     return result_row
 
 
+# Season names in the assumptions files mapped to the sampled seasonal variables
+_SEASON_SAMPLE_KEYS = {
+    'Winter Peak (Ski Season)': ('winter_occupancy', 'winter_rate'),
+    'Summer Peak (Hiking Season)': ('summer_occupancy', 'summer_rate'),
+    'Off-Peak (Shoulder Seasons)': ('offpeak_occupancy', 'offpeak_rate'),
+}
+
+
+def _rental_income_batch(rental, samples_dict: Dict[str, np.ndarray],
+                         use_seasonality: bool) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Full-year gross rental income and rented nights for every sampled path.
+    
+    Reproduces what apply_enhanced_sensitivity does to the rental parameters:
+    seasonal draws replace matching seasons; otherwise the overall occupancy is
+    applied to every season and seasonal rates are scaled to the sampled ADR.
+    """
+    occupancy = np.asarray(samples_dict['occupancy_rate'], dtype=float)
+    daily_rate = np.asarray(samples_dict['daily_rate'], dtype=float)
+    
+    if not rental.seasons:
+        rented_nights = rental.rentable_nights * (rental.occupancy_rate if use_seasonality else occupancy)
+        gross_rental_income = rented_nights * (rental.average_daily_rate if use_seasonality else daily_rate)
+        return np.broadcast_to(gross_rental_income, occupancy.shape), np.broadcast_to(rented_nights, occupancy.shape)
+    
+    if not use_seasonality:
+        base_avg_rate = rental.gross_rental_income / rental.rented_nights if rental.rented_nights > 0 else rental.average_daily_rate
+        rate_multiplier = daily_rate / base_avg_rate
+    
+    gross_rental_income = 0.0
+    rented_nights = 0.0
+    for season in rental.seasons:
+        if use_seasonality:
+            occ_key, rate_key = _SEASON_SAMPLE_KEYS.get(season.name, (None, None))
+            season_occupancy = samples_dict[occ_key] if occ_key else season.occupancy_rate
+            season_rate = samples_dict[rate_key] if rate_key else season.average_daily_rate
+        else:
+            season_occupancy = occupancy
+            season_rate = season.average_daily_rate * rate_multiplier
+        season_nights = season.nights_in_season * season_occupancy
+        rented_nights = rented_nights + season_nights
+        gross_rental_income = gross_rental_income + season_nights * season_rate
+    
+    return (np.broadcast_to(gross_rental_income, occupancy.shape),
+            np.broadcast_to(rented_nights, occupancy.shape))
+
+
+def _simulate_batch(samples_dict: Dict[str, np.ndarray], base_config: BaseCaseConfig,
+                    use_seasonality: bool, use_expense_variation: bool,
+                    num_years: int = 15) -> Dict[str, np.ndarray]:
+    """
+    Run every sampled path at once through the vectorized cash-flow kernels.
+    
+    Batch equivalent of calling run_single_simulation for each index: the same
+    stochastic events (AR(1) inflation/appreciation, maintenance events, market
+    shocks, refinancing) are drawn as (N, num_years) arrays and the projection,
+    NPV and IRRs are evaluated across all N paths with array operations.
+    
+    Args:
+        samples_dict: Sampled parameter arrays, each of length N
+        base_config: Base case configuration
+        use_seasonality: Whether seasonal occupancy/rates were sampled
+        use_expense_variation: Whether expense parameters were sampled
+    
+    Returns:
+        Dictionary of result columns (same columns as run_single_simulation rows)
+    """
+    n = len(samples_dict['occupancy_rate'])
+    
+    # Fixed parameters (use base config values)
+    interest_rate = base_config.financing.interest_rate
+    management_fee = base_config.expenses.property_management_fee_rate
+    owner_nights = base_config.rental.owner_nights_per_person
+    nubbing_costs_annual = base_config.expenses.nubbing_costs_annual
+    
+    if getattr(base_config, 'projection', None) is not None:
+        ramp_up_months = int(getattr(base_config.projection, 'ramp_up_months', 3))
+        renovation_downtime_months = int(getattr(base_config.projection, 'renovation_downtime_months', 0))
+        renovation_frequency_years = int(getattr(base_config.projection, 'renovation_frequency_years', 0))
+    else:
+        ramp_up_months = 3
+        renovation_downtime_months = 0
+        renovation_frequency_years = 0
+    if 'ramp_up_months' in samples_dict:
+        # Sampled ramp-up period, rounded to whole months as in run_single_simulation
+        ramp_up_months = np.rint(np.asarray(samples_dict['ramp_up_months'], dtype=float)).astype(np.int64)
+    
+    # Configuration shared by all paths; per-path overrides are passed as arrays
+    config = apply_enhanced_sensitivity(
+        base_config,
+        interest_rate=interest_rate,
+        management_fee=management_fee,
+        owner_nights=owner_nights,
+        nubbing_costs_annual=nubbing_costs_annual
+    )
+    financing = config.financing
+    
+    gross_rental_income, rented_nights = _rental_income_batch(config.rental, samples_dict, use_seasonality)
+    electricity_internet_annual = samples_dict['electricity_internet_annual'] if use_expense_variation else None
+    maintenance_rate = samples_dict['maintenance_rate'] if use_expense_variation else None
+    
+    operating_inputs = dict(
+        gross_rental_income=gross_rental_income,
+        rented_nights=rented_nights,
+        ota_booking_percentage=samples_dict['ota_booking_percentage'],
+        ota_fee_rate=samples_dict['ota_fee_rate'],
+        average_length_of_stay=samples_dict['average_length_of_stay'],
+        avg_guests_per_night=samples_dict['avg_guests_per_night'],
+        cleaning_cost_per_stay=samples_dict['cleaning_cost_per_stay'],
+        marginal_tax_rate=samples_dict['marginal_tax_rate'],
+        electricity_internet_annual=electricity_internet_annual,
+        maintenance_rate=maintenance_rate,
+    )
+    annual_result = compute_annual_cash_flows_vec(config, **operating_inputs)
+    
+    # Time-varying inflation and appreciation (AR(1), same calibration as run_single_simulation)
+    base_inflation = np.asarray(samples_dict['inflation_rate'], dtype=float)
+    base_appreciation = np.asarray(samples_dict['property_appreciation'], dtype=float)
+    inflation_series = _generate_time_series_batch(base_inflation, 0.8, 0.005, num_years, bounds=(0.0, 0.03))
+    appreciation_series = _generate_time_series_batch(base_appreciation, 0.75, 0.015, num_years, bounds=(-0.02, 0.09))
+    inflation_factors = np.ones((n, num_years))
+    appreciation_factors = np.ones((n, num_years))
+    inflation_factors[:, 1:] = np.cumprod(1 + inflation_series[:, :-1], axis=1)
+    appreciation_factors[:, 1:] = np.cumprod(1 + appreciation_series[:, :-1], axis=1)
+    
+    # Discrete events
+    maintenance_costs = _generate_maintenance_costs_batch(n, num_years, lambda_rate=0.15)
+    occ_mult, rate_mult, value_mult = _generate_market_shock_multipliers_batch(n, num_years, shock_probability=0.03)
+    rate_paths, refinancing_costs = _generate_refinancing_batch(
+        n,
+        initial_rate=financing.effective_saron_base_rate if financing.loan_tranches else financing.interest_rate,
+        current_rate=base_config.financing.interest_rate,
+        loan_amount=financing.loan_amount,
+        amortization_rate=financing.amortization_rate,
+        num_years=num_years
+    )
+    
+    projection = compute_15_year_projection_vec(
+        config,
+        inflation_factors=inflation_factors,
+        appreciation_factors=appreciation_factors,
+        ramp_up_months=ramp_up_months,
+        renovation_downtime_months=renovation_downtime_months,
+        renovation_frequency_years=renovation_frequency_years,
+        maintenance_costs=maintenance_costs,
+        occupancy_multipliers=occ_mult,
+        rate_multipliers=rate_mult,
+        value_multipliers=value_mult,
+        interest_rate_paths=rate_paths,
+        refinancing_costs=refinancing_costs,
+        **operating_inputs
+    )
+    
+    final_property_value = projection['property_value'][:, -1]
+    final_loan_balance = projection['remaining_loan_balance'][-1]
+    total_initial_investment = financing.total_initial_investment_per_owner
+    num_owners = financing.num_owners
+    cash_flows = projection['cash_flow_per_owner']
+    
+    # Equity IRRs: sale net of selling costs, capital gains and transfer tax
+    # (the calculate_irrs_from_projection defaults used by run_single_simulation)
+    net_sale_price = (final_property_value
+                      - final_property_value * SELLING_COSTS_RATE
+                      - np.maximum(0.0, final_property_value - financing.purchase_price) * CAPITAL_GAINS_TAX_RATE
+                      - final_property_value * PROPERTY_TRANSFER_TAX_SALE_RATE)
+    irr_sale_proceeds = (net_sale_price - final_loan_balance) / num_owners
+    irr_with_sale = calculate_irr_vec(cash_flows, total_initial_investment, irr_sale_proceeds) * 100
+    irr_without_sale = calculate_irr_vec(cash_flows, total_initial_investment, 0) * 100
+    
+    # NPV using sampled discount rate
+    discount_rate = np.asarray(samples_dict['discount_rate'], dtype=float)
+    sale_proceeds_per_owner = (final_property_value - final_loan_balance) / num_owners
+    npv = calculate_npv(cash_flows, total_initial_investment, discount_rate, sale_proceeds_per_owner)
+    
+    columns = {
+        'simulation': np.arange(1, n + 1, dtype=np.int64),
+        'occupancy_rate': samples_dict['occupancy_rate'],
+        'daily_rate': samples_dict['daily_rate'],
+        'interest_rate': np.full(n, interest_rate),
+        'management_fee_rate': np.full(n, management_fee),
+        'ota_booking_percentage': samples_dict['ota_booking_percentage'],
+        'ota_fee_rate': samples_dict['ota_fee_rate'],
+        'average_length_of_stay': samples_dict['average_length_of_stay'],
+        'avg_guests_per_night': samples_dict['avg_guests_per_night'],
+        'cleaning_cost_per_stay': samples_dict['cleaning_cost_per_stay'],
+        'marginal_tax_rate': samples_dict['marginal_tax_rate'],
+        'discount_rate': discount_rate,
+        'ramp_up_months': np.broadcast_to(ramp_up_months, (n,)).copy(),
+        'renovation_downtime_months': np.full(n, renovation_downtime_months),
+        'renovation_frequency_years': np.full(n, renovation_frequency_years),
+        'inflation_rate': base_inflation,
+        'property_appreciation': base_appreciation,
+        'annual_cash_flow': annual_result['cash_flow_after_debt_service'],
+        'cash_flow_per_owner': annual_result['cash_flow_per_owner'],
+        'gross_rental_income': annual_result['gross_rental_income'],
+        'net_operating_income': annual_result['net_operating_income'],
+        'npv': npv,
+        'irr_with_sale': irr_with_sale,
+        'irr_without_sale': irr_without_sale,
+        'final_property_value': final_property_value,
+        'sale_proceeds_per_owner': sale_proceeds_per_owner,
+    }
+    
+    if use_seasonality:
+        for var_name in ('winter_occupancy', 'winter_rate', 'summer_occupancy',
+                         'summer_rate', 'offpeak_occupancy', 'offpeak_rate'):
+            columns[var_name] = samples_dict[var_name]
+    
+    if use_expense_variation:
+        columns['owner_nights'] = np.full(n, owner_nights)
+        columns['nubbing_costs_annual'] = np.full(n, nubbing_costs_annual)
+        columns['electricity_internet_annual'] = samples_dict['electricity_internet_annual']
+        columns['maintenance_rate'] = samples_dict['maintenance_rate']
+    
+    return columns
+
+
+# Minimum batch size before sharding across processes; below this the pool
+# start-up and pickling cost more than the vectorized batch itself.
+_PARALLEL_MIN_SIMULATIONS = 20000
+
+
+def _simulate_chunk(args: Tuple) -> Dict[str, np.ndarray]:
+    """
+    Worker entry point: run _simulate_batch on one contiguous slice of the samples.
+    
+    Each chunk reseeds NumPy's global generator so forked workers do not
+    replay identical event streams (maintenance, shocks, refinancing).
+    
+    Args:
+        args: Tuple of (seed_words, samples_slice, base_config, use_seasonality,
+              use_expense_variation); seed_words is the uint32 state of the
+              chunk's spawned SeedSequence
+    
+    Returns:
+        Dictionary of result columns for the slice
+    """
+    seed_words, samples_slice, base_config, use_seasonality, use_expense_variation = args
+    np.random.seed(seed_words)
+    return _simulate_batch(samples_slice, base_config, use_seasonality, use_expense_variation)
+
+
+def _simulate_parallel(samples_dict: Dict[str, np.ndarray], base_config: BaseCaseConfig,
+                       use_seasonality: bool, use_expense_variation: bool,
+                       num_workers: int, verbose: bool = False) -> Dict[str, np.ndarray]:
+    """
+    Shard the samples into contiguous slices and run them across a process pool.
+    
+    Paths share no state, so each worker evaluates its slice with _simulate_batch
+    and the per-chunk columns are written in order into the output arrays.
+    
+    Args:
+        samples_dict: Sampled parameter arrays, each of length N
+        base_config: Base case configuration (read-only in workers)
+        use_seasonality: Whether seasonal occupancy/rates were sampled
+        use_expense_variation: Whether expense parameters were sampled
+        num_workers: Number of worker processes (one slice per worker)
+        verbose: Whether to print progress as each slice completes
+    
+    Returns:
+        Dictionary of result columns for all N paths
+    """
+    n = len(samples_dict['occupancy_rate'])
+    bounds = np.linspace(0, n, num_workers + 1).astype(int)
+    # Independent per-chunk streams: children spawned from one SeedSequence
+    # rather than raw integer seeds, with the root entropy drawn from the global
+    # generator so np.random.seed still makes the whole run reproducible
+    root = np.random.SeedSequence(np.random.randint(0, 2**32, size=4, dtype=np.uint32))
+    seed_words = [child.generate_state(4) for child in root.spawn(num_workers)]
+    chunk_args = [
+        (seed_words[k],
+         {name: values[bounds[k]:bounds[k + 1]] for name, values in samples_dict.items()},
+         base_config, use_seasonality, use_expense_variation)
+        for k in range(num_workers)
+    ]
+    
+    # Copy each chunk into preallocated output columns as it arrives, so peak
+    # memory is the final columns plus one in-flight chunk rather than every
+    # chunk plus a concatenated copy
+    columns = None
+    with Pool(processes=num_workers) as pool:
+        for k, chunk in enumerate(pool.imap(_simulate_chunk, chunk_args)):
+            if columns is None:
+                columns = {name: np.empty(n, dtype=values.dtype) for name, values in chunk.items()}
+            for name, values in chunk.items():
+                columns[name][bounds[k]:bounds[k + 1]] = values
+            del chunk
+            if verbose:
+                completed = int(bounds[k + 1])
+                print(f"  Progress: {completed:,} / {n:,} simulations ({100 * completed / n:.1f}%)")
+    
+    columns['simulation'] = np.arange(1, n + 1, dtype=np.int64)
+    return columns
+
+
 # Professional chart template
+@lru_cache(maxsize=1)
 def get_chart_template():
-    """Returns a professional chart template configuration."""
+    """
+    Returns a professional chart template configuration.
+    
+    The template is built once and shared; callers must copy it
+    (e.g. ``{**template, ...}``) rather than modify it in place.
+    """
     return {
         'font': {
             'family': '-apple-system, BlinkMacSystemFont, "Segoe UI", Roboto, "Helvetica Neue", Arial, sans-serif',
@@ -776,70 +1219,32 @@ def apply_enhanced_sensitivity(
         interest_rate=interest_rate
     )
     
-    # Handle seasonal variations if provided
-    if seasonal_occupancy or seasonal_rates:
-        from engelberg.core import SeasonalParams, RentalParams
-        new_seasons = []
-        for season in config.rental.seasons:
-            new_occ = seasonal_occupancy.get(season.name, season.occupancy_rate) if seasonal_occupancy else season.occupancy_rate
-            new_rate = seasonal_rates.get(season.name, season.average_daily_rate) if seasonal_rates else season.average_daily_rate
-            
-            new_seasons.append(SeasonalParams(
-                name=season.name,
-                months=season.months,
-                occupancy_rate=new_occ,
-                average_daily_rate=new_rate,
-                nights_in_season=season.nights_in_season
-            ))
-        
-        config.rental = RentalParams(
-            owner_nights_per_person=owner_nights if owner_nights is not None else config.rental.owner_nights_per_person,
-            num_owners=config.rental.num_owners,
-            occupancy_rate=config.rental.occupancy_rate,
-            average_daily_rate=config.rental.average_daily_rate,
-            days_per_year=config.rental.days_per_year,
-            seasons=new_seasons
-        )
-    
-    # Handle owner nights (if not already handled in seasonal section)
-    if owner_nights is not None and not (seasonal_occupancy or seasonal_rates):
-        from engelberg.core import RentalParams
-        config.rental = RentalParams(
-            owner_nights_per_person=owner_nights,
-            num_owners=config.rental.num_owners,
-            occupancy_rate=config.rental.occupancy_rate,
-            average_daily_rate=config.rental.average_daily_rate,
-            days_per_year=config.rental.days_per_year,
-            seasons=config.rental.seasons
-        )
-    elif owner_nights is not None:
-        # Update owner nights in existing rental config
-        from engelberg.core import RentalParams
-        config.rental = RentalParams(
-            owner_nights_per_person=owner_nights,
-            num_owners=config.rental.num_owners,
-            occupancy_rate=config.rental.occupancy_rate,
-            average_daily_rate=config.rental.average_daily_rate,
-            days_per_year=config.rental.days_per_year,
-            seasons=config.rental.seasons
-        )
+    # Rental overrides (seasons and owner nights) in a single rebuild
+    rental_updates = {}
+    if (seasonal_occupancy or seasonal_rates) and config.rental.seasons:
+        rental_updates['seasons'] = [
+            replace(
+                season,
+                occupancy_rate=seasonal_occupancy.get(season.name, season.occupancy_rate) if seasonal_occupancy else season.occupancy_rate,
+                average_daily_rate=seasonal_rates.get(season.name, season.average_daily_rate) if seasonal_rates else season.average_daily_rate,
+            )
+            for season in config.rental.seasons
+        ]
+    if owner_nights is not None:
+        rental_updates['owner_nights_per_person'] = owner_nights
+    if rental_updates:
+        config.rental = replace(config.rental, **rental_updates)
     
     # Handle expense parameters
-    if nubbing_costs_annual is not None or electricity_internet_annual is not None or maintenance_rate is not None:
-        from engelberg.core import ExpenseParams
-        config.expenses = ExpenseParams(
-            property_management_fee_rate=config.expenses.property_management_fee_rate,
-            cleaning_cost_per_stay=config.expenses.cleaning_cost_per_stay,
-            average_length_of_stay=config.expenses.average_length_of_stay,
-            tourist_tax_per_person_per_night=config.expenses.tourist_tax_per_person_per_night,
-            avg_guests_per_night=config.expenses.avg_guests_per_night,
-            insurance_annual=config.expenses.insurance_annual,
-            nubbing_costs_annual=nubbing_costs_annual if nubbing_costs_annual is not None else config.expenses.nubbing_costs_annual,
-            electricity_internet_annual=electricity_internet_annual if electricity_internet_annual is not None else config.expenses.electricity_internet_annual,
-            maintenance_rate=maintenance_rate if maintenance_rate is not None else config.expenses.maintenance_rate,
-            property_value=config.expenses.property_value,
-            vat_rate_on_gross_rental=config.expenses.vat_rate_on_gross_rental
-        )
+    expense_updates = {
+        name: value for name, value in (
+            ('nubbing_costs_annual', nubbing_costs_annual),
+            ('electricity_internet_annual', electricity_internet_annual),
+            ('maintenance_rate', maintenance_rate),
+        ) if value is not None
+    }
+    if expense_updates:
+        config.expenses = replace(config.expenses, **expense_updates)
     
     return config
 
@@ -1079,7 +1484,9 @@ def run_monte_carlo_simulation(base_config: BaseCaseConfig,
                                 use_lhs: bool = True,  # Use Latin Hypercube Sampling for better accuracy
                                 use_parallel: bool = True,  # Use parallel processing for efficiency
                                 num_workers: Optional[int] = None,
-                                check_convergence: bool = False) -> pd.DataFrame:
+                                check_convergence: bool = False,
+                                verbose: bool = True,
+                                return_dataframe: bool = True) -> Union[pd.DataFrame, Dict[str, np.ndarray]]:
     """
     Run enhanced Monte Carlo simulation with expanded stochastic inputs and correlations.
     
@@ -1089,9 +1496,9 @@ def run_monte_carlo_simulation(base_config: BaseCaseConfig,
     - Default 10,000 simulations: Increased from 1,000 for better statistical accuracy
     
     EFFICIENCY IMPROVEMENTS:
-    - Parallel processing: Utilizes multiple CPU cores for faster execution
-    - Vectorized sampling: All parameters sampled at once before simulation loop
-    - Optimized chunking: Efficient batch processing for parallel execution
+    - Vectorized simulation: All paths run through the batch cash-flow kernels at once
+    - Parallel processing: Large runs are split into contiguous slices across CPU cores
+    - Vectorized sampling: All parameters sampled at once before simulation
     
     Args:
         base_config: Base case configuration
@@ -1100,19 +1507,25 @@ def run_monte_carlo_simulation(base_config: BaseCaseConfig,
         use_seasonality: Whether to vary seasonal parameters independently
         use_expense_variation: Whether to vary expense parameters
         use_lhs: Whether to use Latin Hypercube Sampling (default: True, improves accuracy)
-        use_parallel: Whether to use parallel processing (default: True, improves efficiency)
+        use_parallel: Whether to shard large runs across processes (default: True, used from 20,000 simulations)
         num_workers: Number of parallel workers (default: CPU count - 1)
         check_convergence: Whether to check for convergence (default: False, monitors NPV statistics)
+        verbose: Whether to print run settings and progress (default: True; pass False when used as a library)
+        return_dataframe: Whether to wrap the results in a DataFrame (default: True). Pass False
+                          to get the raw dict of result arrays when only a few columns are needed
     
     Returns:
-        DataFrame with simulation results including all sampled parameters
+        DataFrame with simulation results including all sampled parameters, or the same
+        columns as a dict of NumPy arrays when return_dataframe is False
     """
-    print(f"[*] Running {num_simulations:,} Monte Carlo simulations...")
-    print(f"    - Sampling Method: {'Latin Hypercube (LHS)' if use_lhs else 'Random Sampling'}")
-    print(f"    - Parallel Processing: {'Enabled' if use_parallel else 'Disabled'}")
-    print(f"    - Correlations: {'Enabled' if use_correlations else 'Disabled'}")
-    print(f"    - Seasonality: {'Enabled' if use_seasonality else 'Disabled'}")
-    print(f"    - Expense Variation: {'Enabled' if use_expense_variation else 'Disabled'}")
+    if verbose:
+        print(f"[*] Running {num_simulations:,} Monte Carlo simulations...")
+        print(f"    - Sampling Method: {'Latin Hypercube (LHS)' if use_lhs else 'Random Sampling'}")
+        print("    - Engine: Vectorized (NumPy batch)")
+        print(f"    - Parallel Processing: {'Enabled' if use_parallel and num_simulations >= _PARALLEL_MIN_SIMULATIONS else 'Disabled'}")
+        print(f"    - Correlations: {'Enabled' if use_correlations else 'Disabled'}")
+        print(f"    - Seasonality: {'Enabled' if use_seasonality else 'Disabled'}")
+        print(f"    - Expense Variation: {'Enabled' if use_expense_variation else 'Disabled'}")
     
     # Get distribution configurations
     all_distributions = get_default_distributions()
@@ -1191,92 +1604,152 @@ def run_monte_carlo_simulation(base_config: BaseCaseConfig,
             for var_name in var_order:
                 samples[var_name] = active_distributions[var_name].sample(num_simulations)
     
-    # Prepare arguments for parallel processing
-    if use_parallel and num_simulations > 100:  # Only use parallel for larger simulations
+    # Evaluate paths with the vectorized cash-flow kernels; large runs are
+    # additionally sharded across worker processes
+    columns = None
+    if use_parallel and num_simulations >= _PARALLEL_MIN_SIMULATIONS:
         if num_workers is None:
             num_workers = max(1, cpu_count() - 1)  # Leave one core free
-        
-        print(f"    - Workers: {num_workers}")
-        
-        try:
-            # Prepare arguments for each simulation
-            # Note: discount_rate is now sampled, not passed as parameter
-            simulation_args = [
-                (i, samples, base_config, use_seasonality, use_expense_variation)
-                for i in range(num_simulations)
-            ]
-            
-            # Run simulations in parallel
-            with Pool(processes=num_workers) as pool:
-                # Use imap for progress tracking
-                results = []
-                completed = 0
-                chunksize = max(1, num_simulations // (num_workers * 4))
-                
-                # Convergence tracking (if enabled)
-                convergence_stats = {'npv_mean': [], 'npv_std': [], 'npv_p10': [], 'npv_p90': []}
-                convergence_check_interval = max(500, num_simulations // 20)  # Check every 5% or 500 sims
-                
-                for result in pool.imap(run_single_simulation, simulation_args, chunksize=chunksize):
-                    results.append(result)
-                    completed += 1
-                    
-                    # Convergence checking
-                    if check_convergence and completed >= 1000 and completed % convergence_check_interval == 0:
-                        df_temp = pd.DataFrame(results)
-                        convergence_stats['npv_mean'].append(df_temp['npv'].mean())
-                        convergence_stats['npv_std'].append(df_temp['npv'].std())
-                        convergence_stats['npv_p10'].append(df_temp['npv'].quantile(0.10))
-                        convergence_stats['npv_p90'].append(df_temp['npv'].quantile(0.90))
-                        
-                        # Check if statistics have stabilized (coefficient of variation < 0.01 for last 3 checks)
-                        if len(convergence_stats['npv_mean']) >= 3:
-                            recent_means = convergence_stats['npv_mean'][-3:]
-                            cv = np.std(recent_means) / (abs(np.mean(recent_means)) + 1e-6)
-                            if cv < 0.01:  # 1% coefficient of variation threshold
-                                print(f"  Convergence detected at {completed:,} simulations (CV={cv:.4f})")
-                                # Continue to num_simulations but note convergence
-                    
-                    if completed % max(100, num_simulations // 10) == 0:
-                        print(f"  Progress: {completed:,} / {num_simulations:,} simulations ({100 * completed / num_simulations:.1f}%)")
-        except Exception as e:
-            # Fallback to sequential if parallel processing fails
-            print(f"    Warning: Parallel processing failed ({e}), falling back to sequential")
-            use_parallel = False
-    
-    if not use_parallel or num_simulations <= 100:
-        # Sequential processing (for small simulations or when parallel is disabled)
-        results = []
+        if num_workers > 1:
+            if verbose:
+                print(f"    - Workers: {num_workers}")
+            try:
+                columns = _simulate_parallel(samples, base_config, use_seasonality,
+                                             use_expense_variation, num_workers, verbose)
+            except Exception as e:
+                # Fallback to a single in-process batch if parallel processing fails
+                print(f"    Warning: Parallel processing failed ({e}), falling back to sequential")
+    if columns is None:
+        columns = _simulate_batch(samples, base_config, use_seasonality, use_expense_variation)
+    
+    # Convergence checking on growing prefixes of the NPV column
+    if check_convergence:
         convergence_check_interval = max(500, num_simulations // 20)  # Check every 5% or 500 sims
-        convergence_stats = {'npv_mean': [], 'npv_std': [], 'npv_p10': [], 'npv_p90': []}
-        
-        for i in range(num_simulations):
-            result = run_single_simulation((
-                i, samples, base_config, use_seasonality, use_expense_variation
-            ))
-            results.append(result)
-            
-            # Convergence checking
-            if check_convergence and (i + 1) >= 1000 and (i + 1) % convergence_check_interval == 0:
-                df_temp = pd.DataFrame(results)
-                convergence_stats['npv_mean'].append(df_temp['npv'].mean())
-                convergence_stats['npv_std'].append(df_temp['npv'].std())
-                convergence_stats['npv_p10'].append(df_temp['npv'].quantile(0.10))
-                convergence_stats['npv_p90'].append(df_temp['npv'].quantile(0.90))
-                
-                # Check if statistics have stabilized
-                if len(convergence_stats['npv_mean']) >= 3:
-                    recent_means = convergence_stats['npv_mean'][-3:]
-                    cv = np.std(recent_means) / (abs(np.mean(recent_means)) + 1e-6)
-                    if cv < 0.01:  # 1% coefficient of variation threshold
-                        print(f"  Convergence detected at {i + 1:,} simulations (CV={cv:.4f})")
-            
-            if (i + 1) % max(100, num_simulations // 10) == 0:
-                print(f"  Progress: {i + 1:,} / {num_simulations:,} simulations ({100 * (i + 1) / num_simulations:.1f}%)")
+        checkpoints = np.arange(convergence_check_interval, num_simulations + 1, convergence_check_interval)
+        checkpoints = checkpoints[checkpoints >= 1000]
+        # Mean of every checked prefix from one cumulative sum, instead of re-averaging each prefix
+        npv_means = np.cumsum(columns['npv'])[checkpoints - 1] / checkpoints
+        for i in range(2, len(checkpoints)):
+            # Check if statistics have stabilized (coefficient of variation < 0.01 for last 3 checks)
+            recent_means = npv_means[i - 2:i + 1]
+            cv = np.std(recent_means) / (abs(np.mean(recent_means)) + 1e-6)
+            if cv < 0.01 and verbose:  # 1% coefficient of variation threshold
+                print(f"  Convergence detected at {checkpoints[i]:,} simulations (CV={cv:.4f})")
+    
+    if verbose:
+        print(f"[+] Completed {num_simulations:,} simulations")
+    
+    if not return_dataframe:
+        return columns
+    
+    # Columns are already one contiguous array each; wrap them without copying
+    return pd.DataFrame(columns, copy=False)
+
+
+_STAT_KEYS = ('mean', 'median', 'std', 'min', 'max', 'p5', 'p10', 'p25', 'p75', 'p90', 'p95')
+_PERCENTILE_POINTS = [50, 5, 10, 25, 75, 90, 95]  # median, p5 ... p95
+
+
+def _array_stats(values: np.ndarray) -> dict:
+    """
+    Summary statistics of one result column.
+    
+    Mean and std are taken on the column as given; everything else comes
+    from one sorted copy: min/max are its ends, positive_prob is a binary
+    search for zero, and the percentile selection becomes a near no-op.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    total = values.size
+    # Match pandas semantics: NaNs are skipped but still count towards len()
+    nan_mask = np.isnan(values)
+    if nan_mask.any():
+        values = values[~nan_mask]
+    if values.size == 0:
+        stats = dict.fromkeys(_STAT_KEYS, np.nan)
+        stats['positive_prob'] = 0.0
+        return stats
+    
+    mean = values.mean()
+    std = values.std(ddof=1) if values.size > 1 else np.nan
+    values = np.sort(values)
+    median, p5, p10, p25, p75, p90, p95 = np.percentile(values, _PERCENTILE_POINTS)
+    return {
+        'mean': mean,
+        'median': median,
+        'std': std,
+        'min': values[0],
+        'max': values[-1],
+        'p5': p5,
+        'p10': p10,
+        'p25': p25,
+        'p75': p75,
+        'p90': p90,
+        'p95': p95,
+        'positive_prob': int(values.size - np.searchsorted(values, 0.0, side='right')) / total,
+    }
+
+
+def calculate_npv_statistics(npv: np.ndarray) -> dict:
+    """
+    Summary statistics of the NPV column alone, straight from a NumPy array.
     
-    print(f"[+] Completed {num_simulations:,} simulations")
+    Same values as calculate_statistics(df)['npv'] without building a
+    DataFrame or summarising the other result columns. Intended for callers
+    that run run_monte_carlo_simulation(..., return_dataframe=False) and only
+    need the NPV distribution (e.g. the positive-NPV probability).
     
-    return pd.DataFrame(results)
+    Args:
+        npv: NPV per simulation
+    
+    Returns:
+        Dictionary with mean, median, std, min, max, percentiles and positive_prob
+    """
+    return _array_stats(npv)
+
+
+def _matrix_stats(matrix: np.ndarray) -> List[dict]:
+    """
+    Summary statistics of each row of a (columns x simulations) matrix.
+    
+    NaN-free rows are reduced together: mean/std/positive_prob along axis 1,
+    then one in-place sort gives min/max directly and makes the percentile
+    selection a near no-op. Rows containing NaNs go through _array_stats.
+    Values are identical to calling _array_stats on every row.
+    """
+    matrix = np.array(matrix, dtype=np.float64)  # own copy, sorted in place
+    total = matrix.shape[1]
+    rows: List[dict] = [None] * matrix.shape[0]
+    has_nan = np.isnan(matrix).any(axis=1)
+    for i in np.flatnonzero(has_nan):
+        rows[i] = _array_stats(matrix[i])
+    
+    clean = np.flatnonzero(~has_nan)
+    if clean.size and total:
+        block = matrix[clean]
+        mean = block.mean(axis=1)
+        std = block.std(axis=1, ddof=1) if total > 1 else np.full(clean.size, np.nan)
+        positive = np.count_nonzero(block > 0, axis=1)
+        block.sort(axis=1)
+        median, p5, p10, p25, p75, p90, p95 = np.percentile(block, _PERCENTILE_POINTS, axis=1)
+        for j, i in enumerate(clean):
+            rows[i] = {
+                'mean': mean[j],
+                'median': median[j],
+                'std': std[j],
+                'min': block[j, 0],
+                'max': block[j, -1],
+                'p5': p5[j],
+                'p10': p10[j],
+                'p25': p25[j],
+                'p75': p75[j],
+                'p90': p90[j],
+                'p95': p95[j],
+                'positive_prob': int(positive[j]) / total,
+            }
+    elif clean.size:
+        for i in clean:
+            rows[i] = _array_stats(matrix[i])
+    return rows
 
 
 def calculate_statistics(df: pd.DataFrame) -> dict:
@@ -1287,59 +1760,71 @@ def calculate_statistics(df: pd.DataFrame) -> dict:
     df['monthly_gross_rental_income'] = df['gross_rental_income'] / 12.0
     df['monthly_net_operating_income'] = df['net_operating_income'] / 12.0
     
-    def calc_stats(series: pd.Series) -> dict:
-        """Helper to calculate statistics for a series."""
-        return {
-            'mean': series.mean(),
-            'median': series.median(),
-            'std': series.std(),
-            'min': series.min(),
-            'max': series.max(),
-            'p5': series.quantile(0.05),
-            'p10': series.quantile(0.10),
-            'p25': series.quantile(0.25),
-            'p75': series.quantile(0.75),
-            'p90': series.quantile(0.90),
-            'p95': series.quantile(0.95),
-            'positive_prob': (series > 0).sum() / len(series) if len(series) > 0 else 0.0,
-        }
+    # One (columns x simulations) matrix summarised in a single pass
+    names = (
+        'npv', 'irr_with_sale', 'annual_cash_flow', 'gross_rental_income',
+        'net_operating_income', 'cash_flow_per_owner', 'monthly_cash_flow_total',
+        'monthly_gross_rental_income', 'monthly_net_operating_income',
+        'monthly_cash_flow_per_owner',
+    )
+    column_stats = dict(zip(names, _matrix_stats(
+        np.vstack([df[name].to_numpy(dtype=np.float64) for name in names])
+    )))
+    irr_stats = column_stats['irr_with_sale']
+    annual_cash_flow_stats = column_stats['annual_cash_flow']
     
     return {
-        'npv': calc_stats(df['npv']),
-        'irr_with_sale': {
-            'mean': df['irr_with_sale'].mean(),
-            'median': df['irr_with_sale'].median(),
-            'std': df['irr_with_sale'].std(),
-            'min': df['irr_with_sale'].min(),
-            'max': df['irr_with_sale'].max(),
-            'p5': df['irr_with_sale'].quantile(0.05),
-            'p95': df['irr_with_sale'].quantile(0.95),
-        },
+        'npv': column_stats['npv'],
+        'irr_with_sale': {key: irr_stats[key] for key in ('mean', 'median', 'std', 'min', 'max', 'p5', 'p95')},
         # Annual - Total
-        'annual_cash_flow_total': calc_stats(df['annual_cash_flow']),
-        'annual_gross_rental_income_total': calc_stats(df['gross_rental_income']),
-        'annual_net_operating_income_total': calc_stats(df['net_operating_income']),
+        'annual_cash_flow_total': annual_cash_flow_stats,
+        'annual_gross_rental_income_total': column_stats['gross_rental_income'],
+        'annual_net_operating_income_total': column_stats['net_operating_income'],
         # Annual - Per Person
-        'annual_cash_flow_per_owner': calc_stats(df['cash_flow_per_owner']),
+        'annual_cash_flow_per_owner': column_stats['cash_flow_per_owner'],
         # Monthly - Total
-        'monthly_cash_flow_total': calc_stats(df['monthly_cash_flow_total']),
-        'monthly_gross_rental_income_total': calc_stats(df['monthly_gross_rental_income']),
-        'monthly_net_operating_income_total': calc_stats(df['monthly_net_operating_income']),
+        'monthly_cash_flow_total': column_stats['monthly_cash_flow_total'],
+        'monthly_gross_rental_income_total': column_stats['monthly_gross_rental_income'],
+        'monthly_net_operating_income_total': column_stats['monthly_net_operating_income'],
         # Monthly - Per Person
-        'monthly_cash_flow_per_owner': calc_stats(df['monthly_cash_flow_per_owner']),
+        'monthly_cash_flow_per_owner': column_stats['monthly_cash_flow_per_owner'],
         # Legacy support (for backward compatibility)
-        'annual_cash_flow': calc_stats(df['annual_cash_flow']),
+        'annual_cash_flow': dict(annual_cash_flow_stats),
     }
 
 
+# Maximum number of simulations drawn as individual markers in scatter charts
+_SCATTER_MAX_POINTS = 5000
+
+
 def create_monte_carlo_charts(df: pd.DataFrame, stats: dict) -> list:
     """Create visualization charts for Monte Carlo results."""
+    import plotly.graph_objects as go
+    from plotly.subplots import make_subplots
+    
     charts = []
+    template = get_chart_template()
+    
+    # Scatter charts use a fixed random subsample: beyond a few thousand markers
+    # the point cloud looks the same but the embedded HTML keeps growing.
+    # Histograms, the CDF and the statistics use every simulation.
+    # Plot from plain arrays rather than Series (no index alignment per use)
+    columns = {
+        name: df[name].to_numpy()
+        for name in ('npv', 'irr_with_sale', 'occupancy_rate', 'daily_rate',
+                     'interest_rate', 'management_fee_rate')
+    }
+    if len(df) > _SCATTER_MAX_POINTS:
+        rng = np.random.default_rng(0)
+        scatter_idx = np.sort(rng.choice(len(df), size=_SCATTER_MAX_POINTS, replace=False))
+        scatter = {name: values[scatter_idx] for name, values in columns.items()}
+    else:
+        scatter = columns
     
     # Chart 1: NPV Distribution Histogram
     fig1 = go.Figure()
     fig1.add_trace(go.Histogram(
-        x=df['npv'],
+        x=columns['npv'],
         nbinsx=100,
         name='NPV Distribution',
         marker_color='#667eea',
@@ -1366,7 +1851,7 @@ def create_monte_carlo_charts(df: pd.DataFrame, stats: dict) -> list:
     # Chart 2: IRR Distribution Histogram
     fig2 = go.Figure()
     fig2.add_trace(go.Histogram(
-        x=df['irr_with_sale'],
+        x=columns['irr_with_sale'],
         nbinsx=100,
         name='IRR Distribution',
         marker=dict(
@@ -1396,9 +1881,8 @@ def create_monte_carlo_charts(df: pd.DataFrame, stats: dict) -> list:
         annotation_font_size=11
     )
     
-    template = get_chart_template()
-    layout_updates = template.copy()
-    layout_updates.update({
+    layout_updates = {
+        **template,
         'title': {
             'text': "IRR (with Sale) Distribution - Monte Carlo Simulation",
             'font': template['title_font'],
@@ -1410,12 +1894,12 @@ def create_monte_carlo_charts(df: pd.DataFrame, stats: dict) -> list:
         'yaxis_title': "Frequency",
         'height': 550,
         'showlegend': False
-    })
+    }
     fig2.update_layout(**layout_updates)
     charts.append(("irr_distribution", fig2))
     
     # Chart 3: Cumulative Probability Distribution (NPV)
-    sorted_npv = np.sort(df['npv'])
+    sorted_npv = np.sort(columns['npv'])
     cumulative_prob = np.arange(1, len(sorted_npv) + 1) / len(sorted_npv)
     
     fig3 = go.Figure()
@@ -1438,9 +1922,8 @@ def create_monte_carlo_charts(df: pd.DataFrame, stats: dict) -> list:
         line=dict(color=CHART_COLORS['gradient_start'], width=3),
         hovertemplate='<b>Cumulative Probability</b><br>NPV: %{x:,.0f} CHF<br>Probability: %{y:.1f}%<extra></extra>'
     )
-    template = get_chart_template()
-    layout_updates = template.copy()
-    layout_updates.update({
+    layout_updates = {
+        **template,
         'title': {
             'text': "NPV Cumulative Probability Distribution",
             'font': template['title_font'],
@@ -1451,27 +1934,30 @@ def create_monte_carlo_charts(df: pd.DataFrame, stats: dict) -> list:
         'xaxis_title': "NPV (CHF)",
         'yaxis_title': "Probability (%)",
         'height': 550
-    })
+    }
     fig3.update_layout(**layout_updates)
     charts.append(("npv_cumulative", fig3))
     
+    # Hover values for the scatter charts; Plotly formats them client-side via
+    # hovertemplate, so no per-point strings are built here
+    hover_data = np.column_stack((scatter['npv'], scatter['irr_with_sale']))
+    
     # Chart 4: Scatter Plot - Occupancy vs Daily Rate (colored by NPV)
     fig4 = go.Figure()
     fig4.add_trace(go.Scatter(
-        x=df['occupancy_rate'] * 100,
-        y=df['daily_rate'],
+        x=scatter['occupancy_rate'] * 100,
+        y=scatter['daily_rate'],
         mode='markers',
         marker=dict(
             size=5,
-            color=df['npv'],
+            color=scatter['npv'],
             colorscale='RdYlGn',
             showscale=True,
             colorbar=dict(title="NPV (CHF)"),
             opacity=0.6
         ),
-        text=[f"NPV: {n:,.0f} CHF<br>IRR: {i:.2f}%" 
-              for n, i in zip(df['npv'], df['irr_with_sale'])],
-        hovertemplate='Occupancy: %{x:.1f}%<br>Daily Rate: %{y:.0f} CHF<br>%{text}<extra></extra>',
+        customdata=hover_data,
+        hovertemplate='Occupancy: %{x:.1f}%<br>Daily Rate: %{y:.0f} CHF<br>NPV: %{customdata[0]:,.0f} CHF<br>IRR: %{customdata[1]:.2f}%<extra></extra>',
         name='Simulations'
     ))
     
@@ -1481,10 +1967,10 @@ def create_monte_carlo_charts(df: pd.DataFrame, stats: dict) -> list:
             opacity=0.6,
             line=dict(width=0.5, color='rgba(255, 255, 255, 0.3)')
         ),
-        hovertemplate='<b>Simulation</b><br>Occupancy: %{x:.1f}%<br>Daily Rate: %{y:.0f} CHF<br>%{text}<extra></extra>'
+        hovertemplate='<b>Simulation</b><br>Occupancy: %{x:.1f}%<br>Daily Rate: %{y:.0f} CHF<br>NPV: %{customdata[0]:,.0f} CHF<br>IRR: %{customdata[1]:.2f}%<extra></extra>'
     )
-    layout_updates = template.copy()
-    layout_updates.update({
+    layout_updates = {
+        **template,
         'title': {
             'text': "NPV Sensitivity: Occupancy Rate vs Daily Rate",
             'font': template['title_font'],
@@ -1496,27 +1982,26 @@ def create_monte_carlo_charts(df: pd.DataFrame, stats: dict) -> list:
         'yaxis_title': "Daily Rate (CHF)",
         'height': 550,
         'showlegend': False
-    })
+    }
     fig4.update_layout(**layout_updates)
     charts.append(("occupancy_daily_scatter", fig4))
     
     # Chart 5: Scatter Plot - Interest Rate vs Management Fee (colored by NPV)
     fig5_scatter = go.Figure()
     fig5_scatter.add_trace(go.Scatter(
-        x=df['interest_rate'] * 100,
-        y=df['management_fee_rate'] * 100,
+        x=scatter['interest_rate'] * 100,
+        y=scatter['management_fee_rate'] * 100,
         mode='markers',
         marker=dict(
             size=5,
-            color=df['npv'],
+            color=scatter['npv'],
             colorscale='RdYlGn',
             showscale=True,
             colorbar=dict(title="NPV (CHF)"),
             opacity=0.6
         ),
-        text=[f"NPV: {n:,.0f} CHF<br>IRR: {i:.2f}%" 
-              for n, i in zip(df['npv'], df['irr_with_sale'])],
-        hovertemplate='Interest Rate: %{x:.2f}%<br>Management Fee: %{y:.1f}%<br>%{text}<extra></extra>',
+        customdata=hover_data,
+        hovertemplate='Interest Rate: %{x:.2f}%<br>Management Fee: %{y:.1f}%<br>NPV: %{customdata[0]:,.0f} CHF<br>IRR: %{customdata[1]:.2f}%<extra></extra>',
         name='Simulations'
     ))
     
@@ -1526,10 +2011,10 @@ def create_monte_carlo_charts(df: pd.DataFrame, stats: dict) -> list:
             opacity=0.6,
             line=dict(width=0.5, color='rgba(255, 255, 255, 0.3)')
         ),
-        hovertemplate='<b>Simulation</b><br>Interest Rate: %{x:.2f}%<br>Management Fee: %{y:.1f}%<br>%{text}<extra></extra>'
+        hovertemplate='<b>Simulation</b><br>Interest Rate: %{x:.2f}%<br>Management Fee: %{y:.1f}%<br>NPV: %{customdata[0]:,.0f} CHF<br>IRR: %{customdata[1]:.2f}%<extra></extra>'
     )
-    layout_updates = template.copy()
-    layout_updates.update({
+    layout_updates = {
+        **template,
         'title': {
             'text': "NPV Sensitivity: Interest Rate vs Management Fee Rate",
             'font': template['title_font'],
@@ -1541,7 +2026,7 @@ def create_monte_carlo_charts(df: pd.DataFrame, stats: dict) -> list:
         'yaxis_title': "Management Fee Rate (%)",
         'height': 550,
         'showlegend': False
-    })
+    }
     fig5_scatter.update_layout(**layout_updates)
     charts.append(("interest_management_scatter", fig5_scatter))
     
@@ -1554,33 +2039,20 @@ def create_monte_carlo_charts(df: pd.DataFrame, stats: dict) -> list:
         horizontal_spacing=0.10
     )
     
-    # Occupancy quartiles
-    df['occ_quartile'] = pd.qcut(df['occupancy_rate'], q=4, labels=['Q1 (Low)', 'Q2', 'Q3', 'Q4 (High)'], duplicates='drop')
-    for q in df['occ_quartile'].cat.categories:
-        subset = df[df['occ_quartile'] == q]['npv']
-        if len(subset) > 0:
-            fig6.add_trace(go.Box(y=subset, name=str(q), showlegend=False), row=1, col=1)
-    
-    # Daily rate quartiles
-    df['rate_quartile'] = pd.qcut(df['daily_rate'], q=4, labels=['Q1 (Low)', 'Q2', 'Q3', 'Q4 (High)'], duplicates='drop')
-    for q in df['rate_quartile'].cat.categories:
-        subset = df[df['rate_quartile'] == q]['npv']
-        if len(subset) > 0:
-            fig6.add_trace(go.Box(y=subset, name=str(q), showlegend=False), row=1, col=2)
-    
-    # Interest rate quartiles
-    df['int_quartile'] = pd.qcut(df['interest_rate'], q=4, labels=['Q1 (Low)', 'Q2', 'Q3', 'Q4 (High)'], duplicates='drop')
-    for q in df['int_quartile'].cat.categories:
-        subset = df[df['int_quartile'] == q]['npv']
-        if len(subset) > 0:
-            fig6.add_trace(go.Box(y=subset, name=str(q), showlegend=False), row=2, col=1)
-    
-    # Management fee quartiles
-    df['mgmt_quartile'] = pd.qcut(df['management_fee_rate'], q=4, labels=['Q1 (Low)', 'Q2', 'Q3', 'Q4 (High)'], duplicates='drop')
-    for q in df['mgmt_quartile'].cat.categories:
-        subset = df[df['mgmt_quartile'] == q]['npv']
-        if len(subset) > 0:
-            fig6.add_trace(go.Box(y=subset, name=str(q), showlegend=False), row=2, col=2)
+    # One qcut + groupby per parameter; codes are kept local so the caller's
+    # DataFrame is not modified. A parameter held fixed (e.g. interest rate)
+    # has no quartiles and is shown as a single box.
+    quartile_labels = ['Q1 (Low)', 'Q2', 'Q3', 'Q4 (High)']
+    npv_series = pd.Series(columns['npv'], copy=False)
+    for param_col, row, col in [('occupancy_rate', 1, 1), ('daily_rate', 1, 2),
+                                ('interest_rate', 2, 1), ('management_fee_rate', 2, 2)]:
+        codes = pd.qcut(columns[param_col], q=4, labels=False, duplicates='drop')
+        if np.isnan(codes).all():
+            fig6.add_trace(go.Box(y=columns['npv'], name='Fixed', showlegend=False), row=row, col=col)
+            continue
+        for code, subset in npv_series.groupby(codes, sort=True):
+            fig6.add_trace(go.Box(y=subset.to_numpy(), name=quartile_labels[int(code)], showlegend=False),
+                           row=row, col=col)
     
     fig6.update_layout(
         height=800, 
@@ -1606,8 +2078,8 @@ def create_monte_carlo_charts(df: pd.DataFrame, stats: dict) -> list:
     
     # NPV vs Occupancy Rate
     fig7.add_trace(go.Scatter(
-        x=df['occupancy_rate'] * 100,
-        y=df['npv'],
+        x=scatter['occupancy_rate'] * 100,
+        y=scatter['npv'],
         mode='markers',
         marker=dict(size=3, opacity=0.5, color='#667eea'),
         name='Occupancy',
@@ -1616,8 +2088,8 @@ def create_monte_carlo_charts(df: pd.DataFrame, stats: dict) -> list:
     
     # NPV vs Daily Rate
     fig7.add_trace(go.Scatter(
-        x=df['daily_rate'],
-        y=df['npv'],
+        x=scatter['daily_rate'],
+        y=scatter['npv'],
         mode='markers',
         marker=dict(size=3, opacity=0.5, color='#2ecc71'),
         name='Daily Rate',
@@ -1626,8 +2098,8 @@ def create_monte_carlo_charts(df: pd.DataFrame, stats: dict) -> list:
     
     # NPV vs Interest Rate
     fig7.add_trace(go.Scatter(
-        x=df['interest_rate'] * 100,
-        y=df['npv'],
+        x=scatter['interest_rate'] * 100,
+        y=scatter['npv'],
         mode='markers',
         marker=dict(size=3, opacity=0.5, color='#e74c3c'),
         name='Interest Rate',
@@ -1636,8 +2108,8 @@ def create_monte_carlo_charts(df: pd.DataFrame, stats: dict) -> list:
     
     # NPV vs Management Fee
     fig7.add_trace(go.Scatter(
-        x=df['management_fee_rate'] * 100,
-        y=df['npv'],
+        x=scatter['management_fee_rate'] * 100,
+        y=scatter['npv'],
         mode='markers',
         marker=dict(size=3, opacity=0.5, color='#f39c12'),
         name='Management Fee',
@@ -1664,23 +2136,56 @@ def create_monte_carlo_charts(df: pd.DataFrame, stats: dict) -> list:
     return charts
 
 
-def generate_monte_carlo_html(df: pd.DataFrame, stats: dict, charts: list, 
-                              base_config: BaseCaseConfig, num_simulations: int,
-                              output_path: str = "website/report_monte_carlo.html"):
-    """Generate HTML report for Monte Carlo analysis."""
+def _plotly_cdn_url() -> str:
+    """plotly.js bundle matching the installed plotly (the "plotly-latest" CDN alias is frozen at v1.x)."""
+    from plotly.offline import get_plotlyjs_version
+    return f"https://cdn.plot.ly/plotly-{get_plotlyjs_version()}.min.js"
+
+
+def _plotly_figure_div(fig: 'go.Figure', div_id: str) -> str:
+    """
+    Render a figure as a div plus one Plotly.newPlot call on its JSON spec.
+    
+    Relies on the single plotly.js script tag (_plotly_cdn_url) in the report <head>; skips
+    to_html's per-figure templating and validation.
+    """
+    import plotly.io as pio
+    
+    # Escape "</" so strings in the spec cannot close the script tag
+    fig_json = pio.to_json(fig, validate=False).replace('</', '<\\/')
+    return (f'<div id="{div_id}" class="plotly-graph-div"></div>'
+            f'<script>Plotly.newPlot("{div_id}", {fig_json}, {{"responsive": true}});</script>')
+
+
+# Base-case reference results for the report, keyed by configuration repr
+_BASE_CASE_CACHE: Dict[str, Dict] = {}
+_BASE_CASE_CACHE_SIZE = 4
+
+
+def _base_case_reference(base_config: BaseCaseConfig) -> Dict:
+    """
+    Deterministic base-case NPV and IRRs shown next to the Monte Carlo results.
     
-    def format_currency(value):
-        return f"{value:,.0f} CHF"
+    The projection only depends on the configuration, so results are cached
+    under the dataclass repr (which covers every field); repeated reports for
+    the same case skip the projection and IRR search.
     
-    def format_percent(value):
-        return f"{value:.2f}%"
+    Args:
+        base_config: Base case configuration
+    
+    Returns:
+        Dictionary with 'npv' (3% discount rate) and 'irr' (calculate_irrs_from_projection output)
+    """
+    key = repr(base_config)
+    cached = _BASE_CASE_CACHE.get(key)
+    if cached is not None:
+        return cached
     
-    # Calculate base case for comparison
-    from engelberg.core import compute_annual_cash_flows, compute_15_year_projection, calculate_irrs_from_projection
     base_result = compute_annual_cash_flows(base_config)
-    base_ramp_up = int(base_config.projection.ramp_up_months) if getattr(base_config, 'projection', None) else 0
-    base_renovation_months = int(base_config.projection.renovation_downtime_months) if getattr(base_config, 'projection', None) else 0
-    base_renovation_frequency = int(base_config.projection.renovation_frequency_years) if getattr(base_config, 'projection', None) else 0
+    projection_params = getattr(base_config, 'projection', None)
+    base_ramp_up = int(projection_params.ramp_up_months) if projection_params else 0
+    base_renovation_months = int(projection_params.renovation_downtime_months) if projection_params else 0
+    base_renovation_frequency = int(projection_params.renovation_frequency_years) if projection_params else 0
     base_projection = compute_15_year_projection(
         base_config,
         start_year=2026,
@@ -1688,7 +2193,8 @@ def generate_monte_carlo_html(df: pd.DataFrame, stats: dict, charts: list,
         property_appreciation_rate=0.025,
         ramp_up_months=base_ramp_up,
         renovation_downtime_months=base_renovation_months,
-        renovation_frequency_years=base_renovation_frequency
+        renovation_frequency_years=base_renovation_frequency,
+        include_stress_results=False
     )  # 2.5% property appreciation per year
     base_final_value = base_projection[-1]['property_value']
     base_final_loan = base_projection[-1]['remaining_loan_balance']
@@ -1701,409 +2207,622 @@ def generate_monte_carlo_html(df: pd.DataFrame, stats: dict, charts: list,
         purchase_price=base_config.financing.purchase_price
     )
     
-    # Calculate base NPV using 3% discount rate
-    discount_rate = 0.03  # 3% discount rate (realistic for real estate investments)
+    # Base NPV using 3% discount rate (realistic for real estate investments)
+    discount_rate = 0.03
     base_cash_flows = [y['cash_flow_per_owner'] for y in base_projection]
     base_sale_proceeds = (base_final_value - base_final_loan) / base_config.financing.num_owners
-    base_npv = -base_result['equity_per_owner']
-    for i, cf in enumerate(base_cash_flows):
-        base_npv += cf / ((1 + discount_rate) ** (i + 1))
-    base_npv += base_sale_proceeds / ((1 + discount_rate) ** len(base_cash_flows))
-    
-    # Generate Plotly charts HTML - use to_html() directly for each chart
-    charts_html = ""
-    correlation_chart_html = ""  # Extract correlation chart separately
-    plotly_js_parts = []
-    first_chart = True
-    correlation_fig = None  # Store correlation chart figure
+    base_npv = calculate_npv(base_cash_flows, base_result['equity_per_owner'], discount_rate, base_sale_proceeds)
     
-    for chart_name, fig in charts:
-        # Get chart title
-        chart_title = chart_name.replace('_', ' ').title()
-        if hasattr(fig.layout, 'title') and fig.layout.title:
-            if hasattr(fig.layout.title, 'text'):
-                chart_title = fig.layout.title.text
-            elif isinstance(fig.layout.title, str):
-                chart_title = fig.layout.title
-        
-        # Extract correlation chart separately for dedicated section
-        if chart_name == "correlation_charts":
-            # Store the figure for later use
-            correlation_fig = fig
-            continue  # Skip adding to main charts_html
-        
-        # Use to_html() directly - it handles everything including the script
-        if first_chart:
-            # First chart includes Plotly JS
-            chart_html = fig.to_html(include_plotlyjs="cdn", div_id=chart_name, full_html=False)
-            first_chart = False
+    if len(_BASE_CASE_CACHE) >= _BASE_CASE_CACHE_SIZE:
+        _BASE_CASE_CACHE.pop(next(iter(_BASE_CASE_CACHE)))
+    _BASE_CASE_CACHE[key] = {'npv': base_npv, 'irr': base_irr}
+    return _BASE_CASE_CACHE[key]
+
+
+# Static report assets, kept out of the report f-string so the template only
+# carries the dynamic fields and the CSS/JS need no brace escaping
+_REPORT_CSS = """
+:root {
+    --primary: #1a1a2e;
+    --secondary: #0f3460;
+    --success: #28a745;
+    --danger: #dc3545;
+    --warning: #ffc107;
+    --info: #17a2b8;
+    --gradient-1: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+    --shadow-sm: 0 2px 4px rgba(0,0,0,0.1);
+    --shadow-md: 0 4px 12px rgba(0,0,0,0.15);
+    --shadow-lg: 0 10px 40px rgba(0,0,0,0.2);
+}
+
+* {
+    margin: 0;
+    padding: 0;
+    box-sizing: border-box;
+}
+
+body {
+    font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', 'Roboto', 'Helvetica Neue', Arial, sans-serif;
+    background: #0a0e27;
+    color: #2c3e50;
+    line-height: 1.6;
+    overflow-x: hidden;
+}
+
+.container {
+    max-width: 1920px;
+    margin: 0 auto;
+    background: white;
+    min-height: 100vh;
+}
+
+.header {
+    background: var(--gradient-1);
+    color: white;
+    padding: 40px 60px;
+    position: relative;
+    overflow: hidden;
+}
+
+.header::before {
+    content: '';
+    position: absolute;
+    top: -50%;
+    right: -10%;
+    width: 500px;
+    height: 500px;
+    background: rgba(255,255,255,0.1);
+    border-radius: 50%;
+    animation: float 20s infinite ease-in-out;
+}
+
+@keyframes float {
+    0%, 100% { transform: translate(0, 0) rotate(0deg); }
+    50% { transform: translate(-30px, -30px) rotate(180deg); }
+}
+
+.header h1 {
+    font-size: 2.2em;
+    font-weight: 700;
+    margin-bottom: 15px;
+    letter-spacing: -1px;
+    position: relative;
+    z-index: 1;
+    text-shadow: 2px 2px 4px rgba(0,0,0,0.2);
+}
+
+.header .subtitle {
+    font-size: 1.1em;
+    opacity: 0.95;
+    margin-bottom: 10px;
+    position: relative;
+    z-index: 1;
+}
+
+.header .meta {
+    font-size: 0.95em;
+    opacity: 0.85;
+    margin-top: 20px;
+    position: relative;
+    z-index: 1;
+}
+
+.section {
+    padding: 30px 40px;
+    background: white;
+}
+
+.section:nth-child(even) {
+    background: #f8f9fa;
+}
+
+.section h2 {
+    font-size: 1.8em;
+    font-weight: 700;
+    color: var(--primary);
+    margin-bottom: 30px;
+    padding-bottom: 15px;
+    border-bottom: 3px solid var(--secondary);
+    letter-spacing: -0.5px;
+}
+
+.kpi-grid {
+    display: grid;
+    grid-template-columns: repeat(auto-fit, minmax(280px, 1fr));
+    gap: 25px;
+    margin-bottom: 50px;
+}
+
+.kpi-card {
+    background: white;
+    padding: 30px;
+    border-radius: 16px;
+    box-shadow: var(--shadow-md);
+    transition: all 0.3s cubic-bezier(0.4, 0, 0.2, 1);
+    position: relative;
+    overflow: hidden;
+    border-left: 4px solid var(--primary);
+}
+
+.kpi-card::before {
+    content: '';
+    position: absolute;
+    top: 0;
+    left: 0;
+    right: 0;
+    height: 4px;
+    background: var(--gradient-1);
+    transform: scaleX(0);
+    transform-origin: left;
+    transition: transform 0.3s;
+}
+
+.kpi-card:hover {
+    transform: translateY(-8px);
+    box-shadow: var(--shadow-lg);
+}
+
+.kpi-card:hover::before {
+    transform: scaleX(1);
+}
+
+.kpi-label {
+    font-size: 0.85em;
+    color: #6c757d;
+    text-transform: uppercase;
+    letter-spacing: 1.2px;
+    margin-bottom: 15px;
+    font-weight: 600;
+}
+
+.kpi-value {
+    font-size: 2.5em;
+    font-weight: 700;
+    color: var(--primary);
+    margin-bottom: 8px;
+    letter-spacing: -1px;
+}
+
+.kpi-value.positive {
+    color: var(--success);
+}
+
+.kpi-value.negative {
+    color: var(--danger);
+}
+
+.kpi-description {
+    font-size: 0.9em;
+    color: #868e96;
+    margin-top: 8px;
+}
+
+.chart-container {
+    background: white;
+    padding: 35px;
+    border-radius: 16px;
+    box-shadow: var(--shadow-md);
+    transition: all 0.3s;
+    margin-bottom: 30px;
+}
+
+.chart-container:hover {
+    transform: translateY(-5px);
+    box-shadow: var(--shadow-lg);
+}
+
+.chart-title {
+    font-size: 1.3em;
+    font-weight: 600;
+    color: var(--primary);
+    margin-bottom: 20px;
+    padding-bottom: 15px;
+    border-bottom: 2px solid #e8ecef;
+}
+
+.info-box {
+    background: linear-gradient(135deg, #e8f4f8 0%, #d1ecf1 100%);
+    border-left: 4px solid var(--info);
+    padding: 25px;
+    border-radius: 12px;
+    margin: 25px 0;
+}
+
+.methodology-box {
+    background: #f8f9fa;
+    padding: 30px;
+    border-radius: 12px;
+    border-left: 4px solid var(--primary);
+    margin: 25px 0;
+}
+
+.methodology-box h3 {
+    color: var(--primary);
+    margin-bottom: 15px;
+    font-size: 1.3em;
+}
+
+.methodology-box ul {
+    margin-left: 20px;
+    line-height: 2;
+}
+
+.methodology-box li {
+    margin-bottom: 10px;
+}
+
+.stats-table {
+    width: 100%;
+    border-collapse: collapse;
+    background: white;
+    border-radius: 12px;
+    overflow: hidden;
+    box-shadow: var(--shadow-sm);
+    margin: 20px 0;
+}
+
+.stats-table th {
+    background: var(--gradient-1);
+    color: white;
+    padding: 18px 20px;
+    text-align: left;
+    font-weight: 600;
+}
+
+.stats-table td {
+    padding: 15px 20px;
+    border-bottom: 1px solid #e8ecef;
+}
+
+.stats-table tr:hover td {
+    background: #f8f9fa;
+}
+
+.scroll-reveal {
+    opacity: 0;
+    transform: translateY(30px);
+    transition: all 0.6s ease-out;
+}
+
+.scroll-reveal.revealed {
+    opacity: 1;
+    transform: translateY(0);
+}
+
+.footer {
+    background: var(--primary);
+    color: white;
+    padding: 40px 80px;
+    text-align: center;
+}
+"""
+
+_REPORT_SCROLL_JS = """
+// Scroll reveal animation
+(function() {
+    const observerOptions = {
+        threshold: 0.1,
+        rootMargin: '0px 0px -50px 0px'
+    };
+
+    const observer = new IntersectionObserver(function(entries) {
+        entries.forEach(entry => {
+            if (entry.isIntersecting) {
+                entry.target.classList.add('revealed');
+                observer.unobserve(entry.target);
+            }
+        });
+    }, observerOptions);
+
+    document.querySelectorAll('.scroll-reveal').forEach(el => {
+        observer.observe(el);
+    });
+})();
+"""
+
+
+
+# Report number formatters, bound str.format methods so each call skips a
+# Python-level frame: CHF amounts (1,234,567 CHF) and values already
+# expressed in percent (4.25%)
+_format_currency: Callable[[float], str] = "{:,.0f} CHF".format
+_format_percent: Callable[[float], str] = "{:.2f}%".format
+
+# Statistics the report displays per result column; only these are formatted
+_REPORT_STAT_KEYS = {
+    'npv': ('mean', 'median', 'std', 'min', 'max', 'p10', 'p90'),
+    'irr_with_sale': ('mean', 'median', 'std', 'min', 'max', 'p5', 'p95'),
+    'annual_cash_flow': ('mean', 'median', 'std', 'min', 'max'),
+}
+
+
+def _format_stats(stats: dict, column: str, formatter: Callable[[float], str]) -> dict:
+    """Format the displayed statistics of one result column in a single map() pass."""
+    keys = _REPORT_STAT_KEYS[column]
+    return dict(zip(keys, map(formatter, itemgetter(*keys)(stats[column]))))
+
+# Rows of the report's statistics table: label, stats key and the two
+# percentile columns (None renders '-')
+_STATS_TABLE_ROWS = [
+    ('NPV (CHF)', 'npv', ('p10', 'p90')),
+    ('IRR with Sale (%)', 'irr_with_sale', ('p5', 'p95')),
+    ('Annual Cash Flow (CHF)', 'annual_cash_flow', None),
+]
+_STATS_TABLE_COLUMNS = ('mean', 'median', 'std', 'min', 'max')
+
+
+def _render_stats_table_rows(stats_fmt: dict) -> str:
+    """
+    Body rows of the statistics table, built as a list of cells and joined once.
+    
+    Args:
+        stats_fmt: Formatted statistics per result column
+    
+    Returns:
+        HTML of the table rows
+    """
+    cell = '                        <td>{}</td>'.format
+    rows = []
+    for label, key, percentiles in _STATS_TABLE_ROWS:
+        values = stats_fmt[key]
+        rows.append('                    <tr>')
+        rows.append(f'                        <td><strong>{label}</strong></td>')
+        rows.extend(cell(values[column]) for column in _STATS_TABLE_COLUMNS)
+        if percentiles:
+            rows.extend(cell(values[column]) for column in percentiles)
         else:
-            # Subsequent charts don't include Plotly JS
-            chart_html = fig.to_html(include_plotlyjs=False, div_id=chart_name, full_html=False)
-        
-        # Wrap in container
-        charts_html += f'''
-        <div class="chart-container scroll-reveal">
-            <div class="chart-title">{chart_title}</div>
-            {chart_html}
-        </div>
-        '''
+            rows.extend((cell('-'), cell('-')))
+        rows.append('                    </tr>')
+    return '\n'.join(rows)
+
+
+# Sidebar navigation of the Monte Carlo report
+_REPORT_SECTIONS = [
+    {'id': 'executive-summary', 'title': 'Executive Summary', 'icon': 'fas fa-file-alt'},
+    {'id': 'simulation-results', 'title': 'Simulation Results', 'icon': 'fas fa-chart-line'},
+    {'id': 'distribution-charts', 'title': 'Distribution Charts', 'icon': 'fas fa-chart-bar'},
+    {'id': 'risk-metrics', 'title': 'Risk Metrics', 'icon': 'fas fa-shield-alt'},
+    {'id': 'correlation-analysis', 'title': 'Correlation Analysis', 'icon': 'fas fa-project-diagram'},
+]
+
+
+# Methodology bullets of the report: (name, description) pairs and process steps
+_METHODOLOGY_PARAMETERS = [
+    ('Occupancy Rate', 'Beta distribution (α=2.0, β=1.5) bounded [30%, 75%] - captures realistic occupancy patterns'),
+    ('Average Daily Rate', 'Lognormal distribution (mean=ln(300), σ=0.25) bounded [150, 450] CHF - reflects pricing uncertainty'),
+    ('Seasonal Parameters', 'Independent triangular/normal distributions for each season (Winter, Summer, Off-Peak) - allows season-specific variations'),
+    ('Interest Rate', 'Normal distribution (μ=2%, σ=0.5%) bounded [1.0%, 4.0%] - models interest rate uncertainty'),
+    ('Property Management Fee', 'Triangular distribution (min=18%, mode=20%, max=35%) - reflects fee structure variability'),
+    ('Owner Nights', 'Normal distribution (μ=5, σ=1) bounded [3, 8] nights - accounts for usage variation'),
+    ('Utilities', 'Lognormal distribution (mean=ln(3000), σ=0.20) bounded [2000, 5000] CHF - models expense uncertainty'),
+    ('Maintenance Rate', 'Normal distribution (μ=1%, σ=0.3%) bounded [0.5%, 2.0%] - captures maintenance variability'),
+    ('Inflation Rate', 'Normal distribution (μ=2%, σ=0.5%) bounded [0.5%, 4.0%] - models economic uncertainty'),
+    ('Property Appreciation', 'Normal distribution (μ=2.5%, σ=1.0%) bounded [0%, 5%] - realistic for Swiss real estate market'),
+]
+
+_METHODOLOGY_CORRELATIONS = [
+    ('Revenue Correlations', 'Occupancy and ADR are positively correlated (ρ=0.4-0.5) - higher demand enables higher pricing'),
+    ('Seasonal Correlations', 'Peak seasons (Winter/Summer) show moderate positive correlation (ρ=0.2-0.3)'),
+    ('Financial Correlations', 'Interest rates negatively correlate with property appreciation (ρ=-0.3) - higher rates reduce property values'),
+    ('Expense Correlations', 'Nubbing costs and electricity/internet correlate with inflation (ρ=0.3-0.4) - expenses rise with inflation'),
+]
+
+_METHODOLOGY_PROCESS = [
+    'For each simulation, correlated random values are drawn using Cholesky decomposition of the correlation matrix',
+    'Values are transformed to target distributions using inverse CDF (quantile function)',
+    'A complete 15-year financial projection is calculated for each scenario with variable inflation and appreciation',
+    'NPV and IRR are computed using a 3% discount rate (realistic for real estate investments)',
+    'Results are aggregated to show probability distributions, correlations, and key statistics',
+]
+
+
+@lru_cache(maxsize=1)
+def _report_layout() -> Dict[str, str]:
+    """
+    Static page chrome shared by every Monte Carlo report.
     
-    # Generate correlation chart HTML
-    if correlation_fig is not None:
-        # Use to_html() to generate the chart HTML
-        # Since Plotly JS is already loaded from first chart, we don't need to include it again
-        correlation_chart_html = correlation_fig.to_html(include_plotlyjs=False, div_id="correlation_charts", full_html=False)
-    
-    # No need for separate plotly_js since it's embedded in the HTML
-    plotly_js = ""
-    
-    # Define sections for sidebar navigation
-    sections = [
-        {'id': 'executive-summary', 'title': 'Executive Summary', 'icon': 'fas fa-file-alt'},
-        {'id': 'simulation-results', 'title': 'Simulation Results', 'icon': 'fas fa-chart-line'},
-        {'id': 'distribution-charts', 'title': 'Distribution Charts', 'icon': 'fas fa-chart-bar'},
-        {'id': 'risk-metrics', 'title': 'Risk Metrics', 'icon': 'fas fa-shield-alt'},
-        {'id': 'correlation-analysis', 'title': 'Correlation Analysis', 'icon': 'fas fa-project-diagram'},
-    ]
+    The stylesheet, toolbar, sidebar, layout script, methodology lists and the
+    document preamble up to the main content do not depend on the simulation
+    results, so they are assembled once per process.
+    
+    Returns:
+        Dictionary with 'css', 'toolbar', 'sidebar', 'js', 'page_open',
+        'parameters', 'correlations' and 'process' HTML fragments
+    """
+    def bullets(items):
+        return "\n".join([f"<li>{item}</li>" for item in items])
     
-    # Generate sidebar and toolbar
-    sidebar_html = generate_sidebar_navigation(sections)
-    toolbar_html = generate_top_toolbar(
+    toolbar = generate_top_toolbar(
         report_title="Monte Carlo Analysis",
         back_link="index.html",
         subtitle="Engelberg Property Investment - Probabilistic Risk Analysis"
     )
-    
-    html_content = f"""
+    sidebar = generate_sidebar_navigation(_REPORT_SECTIONS)
+    page_open = f"""
 <!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>Monte Carlo Analysis - Engelberg Property Investment</title>
-    <script src="https://cdn.plot.ly/plotly-latest.min.js"></script>
+    <script src="{_plotly_cdn_url()}"></script>
     <link rel="stylesheet" href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.4.0/css/all.min.css">
-    <style>
-        {generate_shared_layout_css()}
-        
-        :root {{
-            --primary: #1a1a2e;
-            --secondary: #0f3460;
-            --success: #28a745;
-            --danger: #dc3545;
-            --warning: #ffc107;
-            --info: #17a2b8;
-            --gradient-1: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            --shadow-sm: 0 2px 4px rgba(0,0,0,0.1);
-            --shadow-md: 0 4px 12px rgba(0,0,0,0.15);
-            --shadow-lg: 0 10px 40px rgba(0,0,0,0.2);
-        }}
-        
-        * {{
-            margin: 0;
-            padding: 0;
-            box-sizing: border-box;
-        }}
-        
-        body {{
-            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', 'Roboto', 'Helvetica Neue', Arial, sans-serif;
-            background: #0a0e27;
-            color: #2c3e50;
-            line-height: 1.6;
-            overflow-x: hidden;
-        }}
-        
-        .container {{
-            max-width: 1920px;
-            margin: 0 auto;
-            background: white;
-            min-height: 100vh;
-        }}
-        
-        .header {{
-            background: var(--gradient-1);
-            color: white;
-            padding: 40px 60px;
-            position: relative;
-            overflow: hidden;
-        }}
-        
-        .header::before {{
-            content: '';
-            position: absolute;
-            top: -50%;
-            right: -10%;
-            width: 500px;
-            height: 500px;
-            background: rgba(255,255,255,0.1);
-            border-radius: 50%;
-            animation: float 20s infinite ease-in-out;
-        }}
-        
-        @keyframes float {{
-            0%, 100% {{ transform: translate(0, 0) rotate(0deg); }}
-            50% {{ transform: translate(-30px, -30px) rotate(180deg); }}
-        }}
-        
-        .header h1 {{
-            font-size: 2.2em;
-            font-weight: 700;
-            margin-bottom: 15px;
-            letter-spacing: -1px;
-            position: relative;
-            z-index: 1;
-            text-shadow: 2px 2px 4px rgba(0,0,0,0.2);
-        }}
-        
-        .header .subtitle {{
-            font-size: 1.1em;
-            opacity: 0.95;
-            margin-bottom: 10px;
-            position: relative;
-            z-index: 1;
-        }}
-        
-        .header .meta {{
-            font-size: 0.95em;
-            opacity: 0.85;
-            margin-top: 20px;
-            position: relative;
-            z-index: 1;
-        }}
-        
-        .section {{
-            padding: 30px 40px;
-            background: white;
-        }}
-        
-        .section:nth-child(even) {{
-            background: #f8f9fa;
-        }}
-        
-        .section h2 {{
-            font-size: 1.8em;
-            font-weight: 700;
-            color: var(--primary);
-            margin-bottom: 30px;
-            padding-bottom: 15px;
-            border-bottom: 3px solid var(--secondary);
-            letter-spacing: -0.5px;
-        }}
-        
-        .kpi-grid {{
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(280px, 1fr));
-            gap: 25px;
-            margin-bottom: 50px;
-        }}
-        
-        .kpi-card {{
-            background: white;
-            padding: 30px;
-            border-radius: 16px;
-            box-shadow: var(--shadow-md);
-            transition: all 0.3s cubic-bezier(0.4, 0, 0.2, 1);
-            position: relative;
-            overflow: hidden;
-            border-left: 4px solid var(--primary);
-        }}
-        
-        .kpi-card::before {{
-            content: '';
-            position: absolute;
-            top: 0;
-            left: 0;
-            right: 0;
-            height: 4px;
-            background: var(--gradient-1);
-            transform: scaleX(0);
-            transform-origin: left;
-            transition: transform 0.3s;
-        }}
-        
-        .kpi-card:hover {{
-            transform: translateY(-8px);
-            box-shadow: var(--shadow-lg);
-        }}
-        
-        .kpi-card:hover::before {{
-            transform: scaleX(1);
-        }}
-        
-        .kpi-label {{
-            font-size: 0.85em;
-            color: #6c757d;
-            text-transform: uppercase;
-            letter-spacing: 1.2px;
-            margin-bottom: 15px;
-            font-weight: 600;
-        }}
-        
-        .kpi-value {{
-            font-size: 2.5em;
-            font-weight: 700;
-            color: var(--primary);
-            margin-bottom: 8px;
-            letter-spacing: -1px;
-        }}
-        
-        .kpi-value.positive {{
-            color: var(--success);
-        }}
-        
-        .kpi-value.negative {{
-            color: var(--danger);
-        }}
-        
-        .kpi-description {{
-            font-size: 0.9em;
-            color: #868e96;
-            margin-top: 8px;
-        }}
-        
-        .chart-container {{
-            background: white;
-            padding: 35px;
-            border-radius: 16px;
-            box-shadow: var(--shadow-md);
-            transition: all 0.3s;
-            margin-bottom: 30px;
-        }}
-        
-        .chart-container:hover {{
-            transform: translateY(-5px);
-            box-shadow: var(--shadow-lg);
-        }}
-        
-        .chart-title {{
-            font-size: 1.3em;
-            font-weight: 600;
-            color: var(--primary);
-            margin-bottom: 20px;
-            padding-bottom: 15px;
-            border-bottom: 2px solid #e8ecef;
-        }}
-        
-        .info-box {{
-            background: linear-gradient(135deg, #e8f4f8 0%, #d1ecf1 100%);
-            border-left: 4px solid var(--info);
-            padding: 25px;
-            border-radius: 12px;
-            margin: 25px 0;
-        }}
-        
-        .methodology-box {{
-            background: #f8f9fa;
-            padding: 30px;
-            border-radius: 12px;
-            border-left: 4px solid var(--primary);
-            margin: 25px 0;
-        }}
-        
-        .methodology-box h3 {{
-            color: var(--primary);
-            margin-bottom: 15px;
-            font-size: 1.3em;
-        }}
-        
-        .methodology-box ul {{
-            margin-left: 20px;
-            line-height: 2;
-        }}
-        
-        .methodology-box li {{
-            margin-bottom: 10px;
-        }}
-        
-        .stats-table {{
-            width: 100%;
-            border-collapse: collapse;
-            background: white;
-            border-radius: 12px;
-            overflow: hidden;
-            box-shadow: var(--shadow-sm);
-            margin: 20px 0;
-        }}
-        
-        .stats-table th {{
-            background: var(--gradient-1);
-            color: white;
-            padding: 18px 20px;
-            text-align: left;
-            font-weight: 600;
-        }}
-        
-        .stats-table td {{
-            padding: 15px 20px;
-            border-bottom: 1px solid #e8ecef;
-        }}
-        
-        .stats-table tr:hover td {{
-            background: #f8f9fa;
-        }}
-        
-        .scroll-reveal {{
-            opacity: 0;
-            transform: translateY(30px);
-            transition: all 0.6s ease-out;
-        }}
-        
-        .scroll-reveal.revealed {{
-            opacity: 1;
-            transform: translateY(0);
-        }}
-        
-        .footer {{
-            background: var(--primary);
-            color: white;
-            padding: 40px 80px;
-            text-align: center;
-        }}
-    </style>
+    <link rel="stylesheet" href="{_REPORT_STYLESHEET}">
 </head>
 <body>
     <div class="layout-container">
-        {toolbar_html}
-        {sidebar_html}
-        <div class="main-content">
+        {toolbar}
+        {sidebar}
+        <div class="main-content">"""
+    
+    return {
+        'css': generate_shared_layout_css() + "\n" + _REPORT_CSS,
+        'toolbar': toolbar,
+        'sidebar': sidebar,
+        'js': generate_shared_layout_js(),
+        'page_open': page_open,
+        'parameters': bullets(f"<strong>{name}:</strong> {text}" for name, text in _METHODOLOGY_PARAMETERS),
+        'correlations': bullets(f"<strong>{name}:</strong> {text}" for name, text in _METHODOLOGY_CORRELATIONS),
+        'process': bullets(_METHODOLOGY_PROCESS),
+    }
+
+
+# External stylesheet written next to the report; each path is written once per process
+_REPORT_STYLESHEET = "report_monte_carlo.css"
+_STYLESHEETS_WRITTEN = set()
+
+
+def _write_report_stylesheet(report_path: str) -> None:
+    """
+    Write the report stylesheet alongside the HTML report.
+    
+    The CSS is static, so it is served as a separate cacheable file rather
+    than inlined into every report, and is only rewritten once per process.
+    
+    Args:
+        report_path: Path of the HTML report that links the stylesheet
+    """
+    css_path = os.path.join(os.path.dirname(os.path.abspath(report_path)), _REPORT_STYLESHEET)
+    if css_path in _STYLESHEETS_WRITTEN and os.path.exists(css_path):
+        return
+    with open(css_path, 'w', encoding='utf-8') as f:
+        f.write(_report_layout()['css'])
+    _STYLESHEETS_WRITTEN.add(css_path)
+
+
+def base_case_percentile(df: pd.DataFrame, base_config: BaseCaseConfig) -> float:
+    """
+    Share of simulations whose NPV is at or below the deterministic base case.
+    
+    Args:
+        df: DataFrame with simulation results
+        base_config: Base case configuration the simulations were run from
+    
+    Returns:
+        Percentile of the base case NPV within the Monte Carlo distribution (0-100)
+    """
+    base_npv = _base_case_reference(base_config)['npv']
+    # NaN NPVs sort last and are not counted
+    npv_sorted = np.sort(df['npv'].to_numpy())
+    return float(np.searchsorted(npv_sorted, base_npv, side='right') / len(npv_sorted) * 100)
+
+
+def generate_monte_carlo_html(stats: dict, charts: list, base_config: BaseCaseConfig,
+                              num_simulations: int, base_percentile: float,
+                              output_path: str = "website/report_monte_carlo.html",
+                              write_gzip: bool = False):
+    """
+    Generate HTML report for Monte Carlo analysis.
+    
+    Only summary values are needed, so the simulation DataFrame can be released
+    before the report is rendered.
+    
+    Args:
+        stats: Statistics dictionary from calculate_statistics
+        charts: (name, figure) pairs from create_monte_carlo_charts
+        base_config: Base case configuration
+        num_simulations: Number of simulations run
+        base_percentile: Base case position in the NPV distribution (see base_case_percentile)
+        output_path: Path of the HTML file to write
+        write_gzip: Also write a gzip copy (output_path + '.gz') for compression-aware servers
+                    (default: False)
+    """
+    # Base case for comparison (cached per configuration)
+    base_case = _base_case_reference(base_config)
+    base_npv = base_case['npv']
+    base_irr = base_case['irr']
+    
+    # Format the summary statistics once; KPI cards, insights and the stats table share them
+    stats_fmt = {
+        'npv': _format_stats(stats, 'npv', _format_currency),
+        'irr_with_sale': _format_stats(stats, 'irr_with_sale', _format_percent),
+        'annual_cash_flow': _format_stats(stats, 'annual_cash_flow', _format_currency),
+    }
+    # Bound once; the templates below read them many times
+    npv_stats = stats['npv']
+    npv_fmt = stats_fmt['npv']
+    irr_fmt = stats_fmt['irr_with_sale']
+    financing = base_config.financing
+    
+    # Strings repeated in the text and footer
+    num_simulations_str = f"{num_simulations:,}"
+    generated_at = datetime.now().strftime('%B %d, %Y at %H:%M:%S')
+    npv_positive_pct = f"{npv_stats['positive_prob'] * 100:.1f}%"
+    
+    # Sign-based styling of the NPV KPI cards
+    npv_class = {key: 'positive' if npv_stats[key] >= 0 else 'negative' for key in ('mean', 'median', 'p10', 'p90')}
+    
+    # Correlation chart goes into its dedicated section
+    correlation_chart_html = ""
+    for chart_name, fig in charts:
+        if chart_name == "correlation_charts":
+            correlation_chart_html = _plotly_figure_div(fig, "correlation_charts")
+    
+    def chart_blocks():
+        """Yield one container per distribution chart, serialized as it is written."""
+        for chart_name, fig in charts:
+            if chart_name == "correlation_charts":
+                continue
+            
+            # Get chart title
+            chart_title = chart_name.replace('_', ' ').title()
+            if hasattr(fig.layout, 'title') and fig.layout.title:
+                if hasattr(fig.layout.title, 'text'):
+                    chart_title = fig.layout.title.text
+                elif isinstance(fig.layout.title, str):
+                    chart_title = fig.layout.title
+            
+            # Wrap in container
+            yield f'''
+        <div class="chart-container scroll-reveal">
+            <div class="chart-title">{chart_title}</div>
+            {_plotly_figure_div(fig, chart_name)}
+        </div>
+        '''
+    
+    layout = _report_layout()
+    stats_table_rows = _render_stats_table_rows(stats_fmt)
+    
+    # The report is written in pieces (head, one block per chart, tail) so the
+    # chart JSON never has to be concatenated into a single string
+    report_head = f"""{layout['page_open']}
         <!-- Executive Summary -->
         <div class="section" id="executive-summary">
             <h2><i class="fas fa-chart-line"></i> Executive Summary</h2>
             <div class="kpi-grid">
                 <div class="kpi-card scroll-reveal">
                     <div class="kpi-label"><i class="fas fa-calculator"></i> Mean NPV</div>
-                    <div class="kpi-value {'positive' if stats['npv']['mean'] >= 0 else 'negative'}">{format_currency(stats['npv']['mean'])}</div>
+                    <div class="kpi-value {npv_class['mean']}">{npv_fmt['mean']}</div>
                     <div class="kpi-description">Average across all simulations</div>
                 </div>
                 
                 <div class="kpi-card scroll-reveal">
                     <div class="kpi-label"><i class="fas fa-chart-bar"></i> Median NPV</div>
-                    <div class="kpi-value {'positive' if stats['npv']['median'] >= 0 else 'negative'}">{format_currency(stats['npv']['median'])}</div>
+                    <div class="kpi-value {npv_class['median']}">{npv_fmt['median']}</div>
                     <div class="kpi-description">50th percentile</div>
                 </div>
                 
                 <div class="kpi-card scroll-reveal">
                     <div class="kpi-label"><i class="fas fa-percent"></i> Probability NPV > 0</div>
-                    <div class="kpi-value">{stats['npv']['positive_prob']*100:.1f}%</div>
+                    <div class="kpi-value">{npv_positive_pct}</div>
                     <div class="kpi-description">Chance of positive returns</div>
                 </div>
                 
                 <div class="kpi-card scroll-reveal">
                     <div class="kpi-label"><i class="fas fa-trending-up"></i> Mean IRR</div>
-                    <div class="kpi-value positive">{stats['irr_with_sale']['mean']:.2f}%</div>
+                    <div class="kpi-value positive">{irr_fmt['mean']}</div>
                     <div class="kpi-description">Average IRR (with sale)</div>
                 </div>
                 
                 <div class="kpi-card scroll-reveal">
                     <div class="kpi-label"><i class="fas fa-arrow-down"></i> 10th Percentile NPV</div>
-                    <div class="kpi-value {'positive' if stats['npv']['p10'] >= 0 else 'negative'}">{format_currency(stats['npv']['p10'])}</div>
+                    <div class="kpi-value {npv_class['p10']}">{npv_fmt['p10']}</div>
                     <div class="kpi-description">Worst case (90% better)</div>
                 </div>
                 
                 <div class="kpi-card scroll-reveal">
                     <div class="kpi-label"><i class="fas fa-arrow-up"></i> 90th Percentile NPV</div>
-                    <div class="kpi-value positive">{format_currency(stats['npv']['p90'])}</div>
+                    <div class="kpi-value {npv_class['p90']}">{npv_fmt['p90']}</div>
                     <div class="kpi-description">Best case (10% better)</div>
                 </div>
             </div>
@@ -2113,12 +2832,12 @@ def generate_monte_carlo_html(df: pd.DataFrame, stats: dict, charts: list,
                     <i class="fas fa-info-circle"></i> Key Insights
                 </h3>
                 <p style="font-size: 1.05em; line-height: 1.8;">
-                    Based on {num_simulations:,} Monte Carlo simulations, the investment shows a 
-                    <strong>{stats['npv']['positive_prob']*100:.1f}% probability</strong> of generating positive NPV. 
-                    The mean NPV of <strong>{format_currency(stats['npv']['mean'])}</strong> indicates a favorable expected return, 
-                    with a median of <strong>{format_currency(stats['npv']['median'])}</strong>. 
-                    The 10th percentile (worst case) shows <strong>{format_currency(stats['npv']['p10'])}</strong>, 
-                    while the 90th percentile (best case) reaches <strong>{format_currency(stats['npv']['p90'])}</strong>.
+                    Based on {num_simulations_str} Monte Carlo simulations, the investment shows a 
+                    <strong>{npv_positive_pct} probability</strong> of generating positive NPV. 
+                    The mean NPV of <strong>{npv_fmt['mean']}</strong> indicates a favorable expected return, 
+                    with a median of <strong>{npv_fmt['median']}</strong>. 
+                    The 10th percentile (worst case) shows <strong>{npv_fmt['p10']}</strong>, 
+                    while the 90th percentile (best case) reaches <strong>{npv_fmt['p90']}</strong>.
                 </p>
             </div>
         </div>
@@ -2130,7 +2849,7 @@ def generate_monte_carlo_html(df: pd.DataFrame, stats: dict, charts: list,
                 <h3>Monte Carlo Simulation Approach</h3>
                 <p style="margin-bottom: 20px; font-size: 1.05em; line-height: 1.8;">
                     This analysis uses Monte Carlo simulation to assess the uncertainty and risk associated with the Engelberg property investment. 
-                    The simulation randomly varies four critical parameters across their plausible ranges to generate {num_simulations:,} different scenarios.
+                    The simulation randomly varies four critical parameters across their plausible ranges to generate {num_simulations_str} different scenarios.
                 </p>
                 
                 <h3 style="margin-top: 25px; margin-bottom: 15px;">Parameters Varied</h3>
@@ -2138,16 +2857,7 @@ def generate_monte_carlo_html(df: pd.DataFrame, stats: dict, charts: list,
                     This enhanced Monte Carlo simulation varies multiple parameters using advanced probability distributions:
                 </p>
                 <ul style="font-size: 1.05em; line-height: 2;">
-                    <li><strong>Occupancy Rate:</strong> Beta distribution (α=2.0, β=1.5) bounded [30%, 75%] - captures realistic occupancy patterns</li>
-                    <li><strong>Average Daily Rate:</strong> Lognormal distribution (mean=ln(300), σ=0.25) bounded [150, 450] CHF - reflects pricing uncertainty</li>
-                    <li><strong>Seasonal Parameters:</strong> Independent triangular/normal distributions for each season (Winter, Summer, Off-Peak) - allows season-specific variations</li>
-                    <li><strong>Interest Rate:</strong> Normal distribution (μ=2%, σ=0.5%) bounded [1.0%, 4.0%] - models interest rate uncertainty</li>
-                    <li><strong>Property Management Fee:</strong> Triangular distribution (min=18%, mode=20%, max=35%) - reflects fee structure variability</li>
-                    <li><strong>Owner Nights:</strong> Normal distribution (μ=5, σ=1) bounded [3, 8] nights - accounts for usage variation</li>
-                    <li><strong>Utilities:</strong> Lognormal distribution (mean=ln(3000), σ=0.20) bounded [2000, 5000] CHF - models expense uncertainty</li>
-                    <li><strong>Maintenance Rate:</strong> Normal distribution (μ=1%, σ=0.3%) bounded [0.5%, 2.0%] - captures maintenance variability</li>
-                    <li><strong>Inflation Rate:</strong> Normal distribution (μ=2%, σ=0.5%) bounded [0.5%, 4.0%] - models economic uncertainty</li>
-                    <li><strong>Property Appreciation:</strong> Normal distribution (μ=2.5%, σ=1.0%) bounded [0%, 5%] - realistic for Swiss real estate market</li>
+                    {layout['parameters']}
                 </ul>
                 
                 <h3 style="margin-top: 25px; margin-bottom: 15px;">Correlation Structure</h3>
@@ -2155,26 +2865,19 @@ def generate_monte_carlo_html(df: pd.DataFrame, stats: dict, charts: list,
                     Parameters are sampled with realistic correlations using a Gaussian copula approach:
                 </p>
                 <ul style="font-size: 1.05em; line-height: 2;">
-                    <li><strong>Revenue Correlations:</strong> Occupancy and ADR are positively correlated (ρ=0.4-0.5) - higher demand enables higher pricing</li>
-                    <li><strong>Seasonal Correlations:</strong> Peak seasons (Winter/Summer) show moderate positive correlation (ρ=0.2-0.3)</li>
-                    <li><strong>Financial Correlations:</strong> Interest rates negatively correlate with property appreciation (ρ=-0.3) - higher rates reduce property values</li>
-                    <li><strong>Expense Correlations:</strong> Nubbing costs and electricity/internet correlate with inflation (ρ=0.3-0.4) - expenses rise with inflation</li>
+                    {layout['correlations']}
                 </ul>
                 
                 <h3 style="margin-top: 25px; margin-bottom: 15px;">Simulation Process</h3>
                 <ul style="font-size: 1.05em; line-height: 2;">
-                    <li>For each simulation, correlated random values are drawn using Cholesky decomposition of the correlation matrix</li>
-                    <li>Values are transformed to target distributions using inverse CDF (quantile function)</li>
-                    <li>A complete 15-year financial projection is calculated for each scenario with variable inflation and appreciation</li>
-                    <li>NPV and IRR are computed using a 3% discount rate (realistic for real estate investments)</li>
-                    <li>Results are aggregated to show probability distributions, correlations, and key statistics</li>
+                    {layout['process']}
                 </ul>
                 
                 <h3 style="margin-top: 25px; margin-bottom: 15px;">Assumptions Held Constant</h3>
                 <ul style="font-size: 1.05em; line-height: 2;">
-                    <li>Property purchase price: {format_currency(base_config.financing.purchase_price)}</li>
-                    <li>Loan-to-value ratio: {base_config.financing.ltv*100:.0f}%</li>
-                    <li>Amortization rate: {base_config.financing.amortization_rate*100:.1f}%</li>
+                    <li>Property purchase price: {_format_currency(financing.purchase_price)}</li>
+                    <li>Loan-to-value ratio: {financing.ltv*100:.0f}%</li>
+                    <li>Amortization rate: {financing.amortization_rate*100:.1f}%</li>
                     <li>Inflation rate: 2% per year</li>
                     <li>Property appreciation: 2.5% per year (base case)</li>
                     <li>Other operating expenses (insurance, utilities, maintenance reserve)</li>
@@ -2199,36 +2902,7 @@ def generate_monte_carlo_html(df: pd.DataFrame, stats: dict, charts: list,
                     </tr>
                 </thead>
                 <tbody>
-                    <tr>
-                        <td><strong>NPV (CHF)</strong></td>
-                        <td>{format_currency(stats['npv']['mean'])}</td>
-                        <td>{format_currency(stats['npv']['median'])}</td>
-                        <td>{format_currency(stats['npv']['std'])}</td>
-                        <td>{format_currency(stats['npv']['min'])}</td>
-                        <td>{format_currency(stats['npv']['max'])}</td>
-                        <td>{format_currency(stats['npv']['p10'])}</td>
-                        <td>{format_currency(stats['npv']['p90'])}</td>
-                    </tr>
-                    <tr>
-                        <td><strong>IRR with Sale (%)</strong></td>
-                        <td>{stats['irr_with_sale']['mean']:.2f}%</td>
-                        <td>{stats['irr_with_sale']['median']:.2f}%</td>
-                        <td>{stats['irr_with_sale']['std']:.2f}%</td>
-                        <td>{stats['irr_with_sale']['min']:.2f}%</td>
-                        <td>{stats['irr_with_sale']['max']:.2f}%</td>
-                        <td>{stats['irr_with_sale']['p5']:.2f}%</td>
-                        <td>{stats['irr_with_sale']['p95']:.2f}%</td>
-                    </tr>
-                    <tr>
-                        <td><strong>Annual Cash Flow (CHF)</strong></td>
-                        <td>{format_currency(stats['annual_cash_flow']['mean'])}</td>
-                        <td>{format_currency(stats['annual_cash_flow']['median'])}</td>
-                        <td>{format_currency(stats['annual_cash_flow']['std'])}</td>
-                        <td>{format_currency(stats['annual_cash_flow']['min'])}</td>
-                        <td>{format_currency(stats['annual_cash_flow']['max'])}</td>
-                        <td>-</td>
-                        <td>-</td>
-                    </tr>
+{stats_table_rows}
                 </tbody>
             </table>
             
@@ -2237,10 +2911,10 @@ def generate_monte_carlo_html(df: pd.DataFrame, stats: dict, charts: list,
                     <i class="fas fa-chart-pie"></i> Base Case Comparison
                 </h3>
                 <p style="font-size: 1.05em; line-height: 1.8;">
-                    <strong>Base Case NPV:</strong> {format_currency(base_npv)} | 
+                    <strong>Base Case NPV:</strong> {_format_currency(base_npv)} | 
                     <strong>Base Case IRR:</strong> {base_irr['irr_with_sale_pct']:.2f}%<br>
-                    The base case falls at the <strong>{(df['npv'] <= base_npv).sum() / len(df) * 100:.1f}th percentile</strong> of the Monte Carlo distribution, 
-                    meaning {(df['npv'] <= base_npv).sum() / len(df) * 100:.1f}% of simulations show worse results than the base case.
+                    The base case falls at the <strong>{base_percentile:.1f}th percentile</strong> of the Monte Carlo distribution, 
+                    meaning {base_percentile:.1f}% of simulations show worse results than the base case.
                 </p>
             </div>
         </div>
@@ -2249,11 +2923,12 @@ def generate_monte_carlo_html(df: pd.DataFrame, stats: dict, charts: list,
         <div class="section" id="distribution-charts">
             <h2><i class="fas fa-chart-bar"></i> Results Visualization</h2>
             <p style="font-size: 1.1em; color: #555; margin-bottom: 30px;">
-                The following charts show the distribution of outcomes from {num_simulations:,} Monte Carlo simulations.
+                The following charts show the distribution of outcomes from {num_simulations_str} Monte Carlo simulations.
                 Each simulation randomly varies four key parameters (Occupancy Rate, Daily Rate, Interest Rate, Management Fee)
                 to assess the range of possible investment outcomes.
             </p>
-            {charts_html}
+"""
+    report_tail = f"""
         </div>
         
         <!-- Additional Analysis: Key Sensitivity Correlations -->
@@ -2271,117 +2946,117 @@ def generate_monte_carlo_html(df: pd.DataFrame, stats: dict, charts: list,
         <!-- Footer -->
         <div class="footer" style="margin-top: 40px; padding: 30px; background: #f8f9fa; text-align: center; border-top: 1px solid #dee2e6;">
             <p style="margin: 0; font-size: 0.9em; color: #6c757d;">Engelberg Property Investment - Monte Carlo Analysis</p>
-            <p style="margin: 5px 0 0 0; font-size: 0.85em; color: #6c757d;">Generated on {datetime.now().strftime('%B %d, %Y at %H:%M:%S')} | {num_simulations:,} Simulations</p>
+            <p style="margin: 5px 0 0 0; font-size: 0.85em; color: #6c757d;">Generated on {generated_at} | {num_simulations_str} Simulations</p>
         </div>
         </div>
     </div>
     
-    {generate_shared_layout_js()}
+    {layout['js']}
     <script>
-        // Scroll reveal animation
-        (function() {{
-            const observerOptions = {{
-                threshold: 0.1,
-                rootMargin: '0px 0px -50px 0px'
-            }};
-            
-            const observer = new IntersectionObserver(function(entries) {{
-                entries.forEach(entry => {{
-                    if (entry.isIntersecting) {{
-                        entry.target.classList.add('revealed');
-                        observer.unobserve(entry.target);
-                    }}
-                }});
-            }}, observerOptions);
-            
-            document.querySelectorAll('.scroll-reveal').forEach(el => {{
-                observer.observe(el);
-            }});
-        }})();
-        
-        // Initialize Plotly charts
-        {plotly_js}
-        
+        {_REPORT_SCROLL_JS}
     </script>
 </body>
 </html>
     """
     
-    with open(output_path, 'w', encoding='utf-8') as f:
-        f.write(html_content)
+    _write_report_stylesheet(output_path)
+    # Binary mode: each piece is encoded once and handed to the buffer directly,
+    # without the text layer's chunking or (on Windows) newline translation.
+    # The gzip copy is compressed from the same pieces as they are written
+    # (wbits=31: gzip container, no file name or timestamp, so it is reproducible).
+    pieces = (piece.encode('utf-8') for piece in chain((report_head,), chart_blocks(), (report_tail,)))
+    with open(output_path, 'wb', buffering=1 << 20) as f:
+        if not write_gzip:
+            f.writelines(pieces)
+        else:
+            compressor = zlib.compressobj(6, zlib.DEFLATED, 31)
+            with open(output_path + '.gz', 'wb') as gz:
+                for piece in pieces:
+                    f.write(piece)
+                    gz.write(compressor.compress(piece))
+                gz.write(compressor.flush())
     
     print(f"[+] HTML report generated: {output_path}")
 
 
 def export_to_excel(df: pd.DataFrame, stats: dict, output_path: str = "monte_carlo_results.xlsx"):
-    """Export Monte Carlo results to Excel."""
-    with pd.ExcelWriter(output_path, engine='openpyxl') as writer:
-        # Summary statistics
-        summary_data = {
-            'Metric': [
-                'Mean NPV (CHF)',
-                'Median NPV (CHF)',
-                'Std Dev NPV (CHF)',
-                'Min NPV (CHF)',
-                'Max NPV (CHF)',
-                '10th Percentile NPV (CHF)',
-                '90th Percentile NPV (CHF)',
-                'Probability NPV > 0 (%)',
-                'Mean IRR with Sale (%)',
-                'Median IRR with Sale (%)',
-                'Mean Annual Cash Flow (CHF)',
-                'Probability Positive Cash Flow (%)',
-            ],
-            'Value': [
-                stats['npv']['mean'],
-                stats['npv']['median'],
-                stats['npv']['std'],
-                stats['npv']['min'],
-                stats['npv']['max'],
-                stats['npv']['p10'],
-                stats['npv']['p90'],
-                stats['npv']['positive_prob'] * 100,
-                stats['irr_with_sale']['mean'],
-                stats['irr_with_sale']['median'],
-                stats['annual_cash_flow']['mean'],
-                stats['annual_cash_flow']['positive_prob'] * 100,
-            ]
-        }
-        pd.DataFrame(summary_data).to_excel(writer, sheet_name="Summary Statistics", index=False)
-        
-        # All simulation results (sample of 1000 for performance)
-        sample_df = df.sample(min(1000, len(df))) if len(df) > 1000 else df
-        sample_df.to_excel(writer, sheet_name="Simulation Results", index=False)
-        
-        # Parameter distributions
-        param_stats = {
-            'Parameter': ['Occupancy Rate', 'Daily Rate (CHF)', 'Interest Rate (%)', 'Management Fee Rate (%)'],
-            'Min': [
-                df['occupancy_rate'].min() * 100,
-                df['daily_rate'].min(),
-                df['interest_rate'].min() * 100,
-                df['management_fee_rate'].min() * 100
-            ],
-            'Max': [
-                df['occupancy_rate'].max() * 100,
-                df['daily_rate'].max(),
-                df['interest_rate'].max() * 100,
-                df['management_fee_rate'].max() * 100
-            ],
-            'Mean': [
-                df['occupancy_rate'].mean() * 100,
-                df['daily_rate'].mean(),
-                df['interest_rate'].mean() * 100,
-                df['management_fee_rate'].mean() * 100
-            ],
-            'Std Dev': [
-                df['occupancy_rate'].std() * 100,
-                df['daily_rate'].std(),
-                df['interest_rate'].std() * 100,
-                df['management_fee_rate'].std() * 100
-            ]
-        }
-        pd.DataFrame(param_stats).to_excel(writer, sheet_name="Parameter Distributions", index=False)
+    """
+    Export Monte Carlo results to Excel.
+    
+    Rows are streamed into a write-only openpyxl workbook instead of going
+    through DataFrame.to_excel, so no in-memory cell grid is built per sheet.
+    
+    Args:
+        df: DataFrame with simulation results
+        stats: Statistics dictionary from calculate_statistics
+        output_path: Path of the .xlsx file to write
+    """
+    from openpyxl import Workbook
+    
+    def clean(row):
+        # Excel has no NaN; leave missing values (e.g. undefined IRRs) as empty cells
+        return [None if value != value else value for value in row]
+    
+    workbook = Workbook(write_only=True)
+    
+    def write_sheet(title, columns, rows):
+        sheet = workbook.create_sheet(title)
+        sheet.append(columns)
+        for row in rows:
+            sheet.append(clean(row))
+    
+    # Summary statistics
+    npv_stats = stats['npv']
+    summary_data = {
+        'Metric': [
+            'Mean NPV (CHF)',
+            'Median NPV (CHF)',
+            'Std Dev NPV (CHF)',
+            'Min NPV (CHF)',
+            'Max NPV (CHF)',
+            '10th Percentile NPV (CHF)',
+            '90th Percentile NPV (CHF)',
+            'Probability NPV > 0 (%)',
+            'Mean IRR with Sale (%)',
+            'Median IRR with Sale (%)',
+            'Mean Annual Cash Flow (CHF)',
+            'Probability Positive Cash Flow (%)',
+        ],
+        'Value': [
+            npv_stats['mean'],
+            npv_stats['median'],
+            npv_stats['std'],
+            npv_stats['min'],
+            npv_stats['max'],
+            npv_stats['p10'],
+            npv_stats['p90'],
+            npv_stats['positive_prob'] * 100,
+            stats['irr_with_sale']['mean'],
+            stats['irr_with_sale']['median'],
+            stats['annual_cash_flow']['mean'],
+            stats['annual_cash_flow']['positive_prob'] * 100,
+        ]
+    }
+    write_sheet("Summary Statistics", list(summary_data), zip(*summary_data.values()))
+    
+    # Simulation results (first 1000 rows for performance; simulations are i.i.d.,
+    # so a leading slice is as representative as a random sample and needs no copy)
+    sample_df = df.iloc[:1000]
+    write_sheet("Simulation Results", list(sample_df.columns), sample_df.itertuples(index=False, name=None))
+    
+    # Parameter distributions (NumPy reductions over one (n, 4) block; rates shown in percent)
+    param_values = df[['occupancy_rate', 'daily_rate', 'interest_rate', 'management_fee_rate']].to_numpy()
+    param_scale = np.array([100, 1, 100, 100])
+    param_stats = {
+        'Parameter': ['Occupancy Rate', 'Daily Rate (CHF)', 'Interest Rate (%)', 'Management Fee Rate (%)'],
+        'Min': (param_values.min(axis=0) * param_scale).tolist(),
+        'Max': (param_values.max(axis=0) * param_scale).tolist(),
+        'Mean': (param_values.mean(axis=0) * param_scale).tolist(),
+        'Std Dev': (param_values.std(axis=0, ddof=1) * param_scale).tolist(),
+    }
+    write_sheet("Parameter Distributions", list(param_stats), zip(*param_stats.values()))
+    
+    workbook.save(output_path)
     
     print(f"[+] Excel file exported: {output_path}")
 
@@ -2422,17 +3097,20 @@ def main():
     print("[*] Generating charts...")
     charts = create_monte_carlo_charts(df, stats)
     
+    # The report only needs summary values; release the simulation data first
+    base_percentile = base_case_percentile(df, base_config)
+    del df
+    
     # Excel export disabled - user only uses HTML reports
     # print("[*] Exporting results to Excel...")
     # export_to_excel(df, stats)
     
     # Ensure output directory exists
-    import os
     os.makedirs("website", exist_ok=True)
     
     # Generate HTML report
     print("[*] Generating HTML report...")
-    generate_monte_carlo_html(df, stats, charts, base_config, num_simulations)
+    generate_monte_carlo_html(stats, charts, base_config, num_simulations, base_percentile)
     
     print()
     print("=" * 70)
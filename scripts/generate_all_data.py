@@ -8,9 +8,12 @@ import os
 import sys
 import json
 import glob
+import hashlib
 import argparse
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
-from typing import Dict, List
+from multiprocessing import cpu_count
+from typing import Dict, List, Optional
 
 # Add project root to path so we can import engelberg package
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -32,6 +35,61 @@ from engelberg.core import (
     get_project_root
 )
 
+# Minimum Monte Carlo simulations per case before analyses run in parallel processes
+PARALLEL_MIN_SIMULATIONS = 1000
+
+# Manifest of input digests per generated JSON file (relative to project root)
+GENERATION_CACHE_PATH = os.path.join(".cache", "generate_all_data.json")
+
+
+def case_input_digest(assumptions_path: str) -> str:
+    """
+    Content hash of everything a case's outputs depend on.
+    
+    Covers the case assumptions file, the base assumptions it may be merged
+    with and the engelberg package sources, so editing any of them
+    invalidates the cached outputs.
+    
+    Args:
+        assumptions_path: Path to the case assumptions JSON file
+    
+    Returns:
+        Hex digest of the inputs
+    """
+    project_root = get_project_root()
+    paths = [
+        resolve_path(assumptions_path),
+        os.path.join(project_root, "assumptions.json"),
+        os.path.join(project_root, "assumptions", "assumptions.json"),
+    ]
+    paths += sorted(glob.glob(os.path.join(project_root, "engelberg", "*.py")))
+    digest = hashlib.blake2b(digest_size=16)
+    for path in paths:
+        if not os.path.exists(path):
+            continue
+        digest.update(os.path.relpath(path, project_root).encode('utf-8'))
+        with open(path, 'rb') as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+
+def load_generation_cache() -> Dict[str, str]:
+    """Load the output-file -> input-digest manifest (empty if missing or unreadable)."""
+    cache_path = resolve_path(GENERATION_CACHE_PATH)
+    try:
+        with open(cache_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_generation_cache(cache: Dict[str, str]) -> None:
+    """Write the output-file -> input-digest manifest."""
+    cache_path = resolve_path(GENERATION_CACHE_PATH)
+    os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+    with open(cache_path, 'w', encoding='utf-8') as f:
+        f.write(json.dumps(cache, indent=2, sort_keys=True))
+
 
 def get_case_metadata(assumptions_path: str) -> Dict:
     """
@@ -83,12 +141,26 @@ def generate_case_data(
     case_metadata: Dict,
     monte_carlo_simulations: int = 1000,
     include_mc_sensitivity: bool = False,
-    mc_sensitivity_simulations: int = 1000
+    mc_sensitivity_simulations: int = 1000,
+    num_workers: Optional[int] = None,
+    generation_cache: Optional[Dict[str, str]] = None,
+    force: bool = False
 ) -> Dict:
     """
     Generate all JSON data for a specific case.
     Runs base case, sensitivity, and Monte Carlo analyses.
     
+    The analyses are independent, so with more than one worker (default:
+    CPU count - 1) and at least PARALLEL_MIN_SIMULATIONS Monte Carlo
+    simulations they run in separate processes; otherwise one after another.
+    MC sensitivity starts its own process pool, so it always runs in this
+    process, after the other analyses have finished.
+    
+    With a generation_cache (output file -> input digest, see
+    case_input_digest), an analysis whose JSON exists and was produced from
+    identical inputs and settings is reused instead of recomputed, unless
+    force is set. The cache is updated in place for every analysis written.
+    
     Returns:
         Dictionary with status and paths to generated JSON files
     """
@@ -118,78 +190,100 @@ def generate_case_data(
         data_dir = resolve_path("website/data")
         os.makedirs(data_dir, exist_ok=True)
         
-        # Run all analyses using unified script
-        print(f"\n[*] Running all analyses...")
-        try:
-            # Run base case
-            run_base_case_analysis(assumptions_path, case_name, verbose=False)
-            json_path = resolve_path(f"website/data/{case_name}_base_case_analysis.json")
-            if os.path.exists(json_path):
-                result['base_case_analysis'] = os.path.basename(json_path)
-                print(f"  [+] Base case JSON: website/data/{case_name}_base_case_analysis.json")
-            
-            # Run sensitivity (Equity IRR)
-            run_sensitivity_analysis(assumptions_path, case_name, verbose=False)
-            json_path = resolve_path(f"website/data/{case_name}_sensitivity.json")
-            if os.path.exists(json_path):
-                result['sensitivity'] = os.path.basename(json_path)
-                print(f"  [+] Sensitivity JSON: website/data/{case_name}_sensitivity.json")
-            
-            # Run Cash-on-Cash sensitivity
-            run_cash_on_cash_sensitivity_analysis(assumptions_path, case_name, verbose=False)
-            json_path_coc = resolve_path(f"website/data/{case_name}_sensitivity_coc.json")
-            if os.path.exists(json_path_coc):
-                result['sensitivity_coc'] = os.path.basename(json_path_coc)
-                print(f"  [+] CoC Sensitivity JSON: website/data/{case_name}_sensitivity_coc.json")
-            
-            # Run Monthly NCF sensitivity
-            run_monthly_ncf_sensitivity_analysis(assumptions_path, case_name, verbose=False)
-            json_path_ncf = resolve_path(f"website/data/{case_name}_sensitivity_ncf.json")
-            if os.path.exists(json_path_ncf):
-                result['sensitivity_ncf'] = os.path.basename(json_path_ncf)
-                print(f"  [+] NCF Sensitivity JSON: website/data/{case_name}_sensitivity_ncf.json")
-            
-            # Run Monte Carlo
-            run_monte_carlo_analysis(
-                assumptions_path,
-                case_name,
-                n_simulations=monte_carlo_simulations,
-                verbose=False
-            )
-            json_path = resolve_path(f"website/data/{case_name}_monte_carlo.json")
+        # Every analysis reads the same assumptions file and writes its own
+        # JSON, so they are independent and can run side by side
+        analyses = [
+            ('base_case_analysis', 'Base case', run_base_case_analysis, {}),
+            ('sensitivity', 'Sensitivity', run_sensitivity_analysis, {}),
+            ('sensitivity_coc', 'CoC Sensitivity', run_cash_on_cash_sensitivity_analysis, {}),
+            ('sensitivity_ncf', 'NCF Sensitivity', run_monthly_ncf_sensitivity_analysis, {}),
+            ('monte_carlo', 'Monte Carlo', run_monte_carlo_analysis,
+             {'n_simulations': monte_carlo_simulations}),
+            ('loan_structure_sensitivity', 'Loan Structure Sensitivity',
+             run_loan_structure_sensitivity_analysis, {}),
+        ]
+        if include_mc_sensitivity:
+            analyses.append(('monte_carlo_sensitivity', 'MC Sensitivity', run_monte_carlo_sensitivity_analysis,
+                             {'num_simulations': mc_sensitivity_simulations}))
+        
+        # Reuse outputs whose inputs and settings are unchanged since they were written
+        digests = {}
+        reused = set()
+        if generation_cache is not None:
+            input_digest = case_input_digest(assumptions_path)
+            for key, _, _, kwargs in analyses:
+                digests[key] = hashlib.blake2b(
+                    repr((input_digest, key, sorted(kwargs.items()))).encode('utf-8'),
+                    digest_size=16
+                ).hexdigest()
+                output_file = f"{case_name}_{key}.json"
+                if (not force and generation_cache.get(output_file) == digests[key]
+                        and os.path.exists(resolve_path(f"website/data/{output_file}"))):
+                    reused.add(key)
+        pending = [analysis for analysis in analyses if analysis[0] not in reused]
+        
+        if num_workers is None:
+            num_workers = max(1, cpu_count() - 1)  # Leave one core free
+        num_workers = max(1, min(num_workers, len(pending)))
+        
+        # Run all analyses; process start-up only pays off once the Monte Carlo run is large enough
+        errors = {}
+        if not pending:
+            print("\n[*] All analyses up to date")
+        elif num_workers > 1 and monte_carlo_simulations >= PARALLEL_MIN_SIMULATIONS:
+            # MC sensitivity shards its runs over its own process pool, so it runs
+            # here once the executor is done instead of nesting pools in a worker
+            in_parent = [analysis for analysis in pending if analysis[0] == 'monte_carlo_sensitivity']
+            pooled = [analysis for analysis in pending if analysis[0] != 'monte_carlo_sensitivity']
+            print(f"\n[*] Running all analyses ({num_workers} workers)...")
+            with ProcessPoolExecutor(max_workers=num_workers) as executor:
+                futures = {
+                    key: executor.submit(runner, assumptions_path, case_name, verbose=False, **kwargs)
+                    for key, _, runner, kwargs in pooled
+                }
+                for key, future in futures.items():
+                    try:
+                        future.result()
+                    except Exception as e:
+                        errors[key] = e
+            for key, _, runner, kwargs in in_parent:
+                try:
+                    runner(assumptions_path, case_name, verbose=False, **kwargs)
+                except Exception as e:
+                    errors[key] = e
+        else:
+            print(f"\n[*] Running all analyses...")
+            for key, _, runner, kwargs in pending:
+                try:
+                    runner(assumptions_path, case_name, verbose=False, **kwargs)
+                except Exception as e:
+                    errors[key] = e
+        
+        # Report in a fixed order regardless of completion order
+        for key, label, _, _ in analyses:
+            if key in errors:
+                error_msg = f"Analysis failed ({label}): {str(errors[key])}"
+                print(f"  [!] {error_msg}")
+                result['errors'].append(error_msg)
+                result['status'] = 'partial'
+                continue
+            json_path = resolve_path(f"website/data/{case_name}_{key}.json")
             if os.path.exists(json_path):
-                result['monte_carlo'] = os.path.basename(json_path)
-                print(f"  [+] Monte Carlo JSON: website/data/{case_name}_monte_carlo.json")
-
-            # Run loan structure sensitivity
-            run_loan_structure_sensitivity_analysis(assumptions_path, case_name, verbose=False)
-            json_path_loan = resolve_path(f"website/data/{case_name}_loan_structure_sensitivity.json")
-            if os.path.exists(json_path_loan):
-                result['loan_structure_sensitivity'] = os.path.basename(json_path_loan)
-                print(f"  [+] Loan Structure Sensitivity JSON: website/data/{case_name}_loan_structure_sensitivity.json")
-            
+                result[key] = os.path.basename(json_path)
+                if key in reused:
+                    print(f"  [=] {label} JSON reused (inputs unchanged)")
+                    continue
+                print(f"  [+] {label} JSON: website/data/{case_name}_{key}.json")
+                if generation_cache is not None:
+                    generation_cache[result[key]] = digests[key]
+        
+        if not include_mc_sensitivity:
             json_path_mc_sens = resolve_path(f"website/data/{case_name}_monte_carlo_sensitivity.json")
-            if include_mc_sensitivity:
-                run_monte_carlo_sensitivity_analysis(
-                    assumptions_path,
-                    case_name,
-                    num_simulations=mc_sensitivity_simulations,
-                    verbose=False
-                )
-                if os.path.exists(json_path_mc_sens):
-                    result['monte_carlo_sensitivity'] = os.path.basename(json_path_mc_sens)
-                    print(f"  [+] MC Sensitivity JSON: website/data/{case_name}_monte_carlo_sensitivity.json")
-            elif os.path.exists(json_path_mc_sens):
+            if os.path.exists(json_path_mc_sens):
                 result['monte_carlo_sensitivity'] = os.path.basename(json_path_mc_sens)
                 print("  [=] MC Sensitivity JSON reused (generation skipped)")
             else:
                 print("  [~] MC Sensitivity skipped (run scripts/analyze_monte_carlo_sensitivity.py)")
-        
-        except Exception as e:
-            error_msg = f"Analysis failed: {str(e)}"
-            print(f"  [!] {error_msg}")
-            result['errors'].append(error_msg)
-            result['status'] = 'partial'
     
     except Exception as e:
         error_msg = f"Case generation failed: {str(e)}"
@@ -222,6 +316,17 @@ def main():
         default=1000,
         help="Simulations per parameter value for MC sensitivity output (default: 1000)."
     )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Recompute every analysis even if its inputs are unchanged since the last run."
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Processes used to run a case's analyses in parallel (default: CPU count - 1; 1 = sequential)."
+    )
     args = parser.parse_args()
 
     print("="*80)
@@ -294,6 +399,7 @@ def main():
     print(f"\n[*] Processing {len(cases)} case(s)...")
     
     # Generate data for each case
+    generation_cache = load_generation_cache()
     case_results = []
     for case_info in cases:
         result = generate_case_data(
@@ -302,9 +408,13 @@ def main():
             case_info['metadata'],
             monte_carlo_simulations=args.monte_carlo_simulations,
             include_mc_sensitivity=args.include_mc_sensitivity,
-            mc_sensitivity_simulations=args.mc_sensitivity_simulations
+            mc_sensitivity_simulations=args.mc_sensitivity_simulations,
+            num_workers=args.workers,
+            generation_cache=generation_cache,
+            force=args.force
         )
         case_results.append(result)
+    save_generation_cache(generation_cache)
     
     # Create cases index
     print(f"\n{'='*80}")
@@ -341,7 +451,7 @@ def main():
     os.makedirs(data_dir, exist_ok=True)
     index_path = os.path.join(data_dir, "cases_index.json")
     with open(index_path, 'w', encoding='utf-8') as f:
-        json.dump(cases_index, f, indent=2, ensure_ascii=False)
+        f.write(json.dumps(cases_index, indent=2, ensure_ascii=False))
     
     print(f"[+] Cases index created: website/data/cases_index.json")
     
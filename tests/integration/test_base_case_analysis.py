@@ -37,6 +37,24 @@ class TestBaseCaseAnalysisWorkflow:
         assert config.financing.interest_rate > 0
         assert config.financing.num_owners > 0
     
+    def test_projection_defaults_cached_until_file_changes(self, sample_assumptions_path, tmp_path):
+        """Test that projection defaults are reused per file and re-read when it changes."""
+        with open(sample_assumptions_path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        path = tmp_path / "assumptions_cached.json"
+        path.write_text(json.dumps(data), encoding='utf-8')
+        
+        first = get_projection_defaults(str(path))
+        first['inflation_rate'] = -1.0
+        first['saron_shocks_bps'].append(999)
+        second = get_projection_defaults(str(path))
+        assert second['inflation_rate'] == float(data['projection']['inflation_rate'])
+        assert 999 not in second['saron_shocks_bps']
+        
+        data['projection']['inflation_rate'] = 0.0375
+        path.write_text(json.dumps(data, indent=2), encoding='utf-8')
+        assert get_projection_defaults(str(path))['inflation_rate'] == 0.0375
+    
     def test_calculate_annual_cash_flows(self, sample_assumptions_path):
         """Test annual cash flows calculation."""
         from engelberg.core import compute_annual_cash_flows
@@ -192,6 +210,27 @@ class TestBaseCaseAnalysisWorkflow:
         for h in ['5', '15', '40']:
             assert len(json_data['by_horizon'][h]['projection']) == int(h)
     
+    def test_horizon_projections_match_direct_projections(self, sample_assumptions_path):
+        """Test that horizons sliced from the longest projection equal per-horizon projections."""
+        from engelberg.core import compute_15_year_projection
+        
+        json_data = run_base_case_analysis(sample_assumptions_path, 'test_case', verbose=False)
+        config = create_base_case_config(sample_assumptions_path)
+        proj_defaults = get_projection_defaults(sample_assumptions_path)
+        
+        for horizon in (5, 20):
+            direct = compute_15_year_projection(
+                config,
+                start_year=proj_defaults['start_year'],
+                inflation_rate=proj_defaults['inflation_rate'],
+                property_appreciation_rate=proj_defaults['property_appreciation_rate'],
+                projection_years=horizon,
+                ramp_up_months=proj_defaults.get('ramp_up_months', 0),
+                renovation_downtime_months=proj_defaults.get('renovation_downtime_months', 0),
+                renovation_frequency_years=proj_defaults.get('renovation_frequency_years', 0)
+            )
+            assert json_data['by_horizon'][str(horizon)]['projection'] == direct
+    
     def test_all_required_kpis_present(self, sample_assumptions_path):
         """Test that all required KPIs are present in results."""
         json_data = run_base_case_analysis(sample_assumptions_path, 'test_case', verbose=False)
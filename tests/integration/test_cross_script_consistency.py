@@ -11,6 +11,7 @@ import json
 import os
 import shutil
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import numpy as np
@@ -351,3 +352,134 @@ class TestScriptEntryPointConsistency:
         batch_irr_std = float(batch_mc["statistics"]["irr_with_sale"]["std"])
         irr_tolerance = max(main_irr_std, batch_irr_std)
         assert abs(main_irr_mean - batch_irr_mean) <= irr_tolerance
+
+    def test_generate_case_data_reuses_outputs_with_unchanged_inputs(
+        self,
+        monkeypatch,
+        tmp_path,
+        sample_assumptions_path,
+        redirected_output_root,
+    ):
+        assumptions_path = tmp_path / "assumptions_cached.json"
+        shutil.copyfile(sample_assumptions_path, assumptions_path)
+        case_name = analysis_module.extract_case_name(str(assumptions_path))
+        metadata = generate_all_data_module.get_case_metadata(str(assumptions_path))
+        data_dir = redirected_output_root / "website" / "data"
+        calls = []
+
+        def make_runner(key):
+            def runner(assumptions, case, verbose=False, **kwargs):
+                calls.append(key)
+                (data_dir / f"{case}_{key}.json").write_text("{}", encoding="utf-8")
+            return runner
+
+        for key, name in [
+            ("base_case_analysis", "run_base_case_analysis"),
+            ("sensitivity", "run_sensitivity_analysis"),
+            ("sensitivity_coc", "run_cash_on_cash_sensitivity_analysis"),
+            ("sensitivity_ncf", "run_monthly_ncf_sensitivity_analysis"),
+            ("monte_carlo", "run_monte_carlo_analysis"),
+            ("loan_structure_sensitivity", "run_loan_structure_sensitivity_analysis"),
+        ]:
+            monkeypatch.setattr(generate_all_data_module, name, make_runner(key))
+
+        def generate(**kwargs):
+            return generate_all_data_module.generate_case_data(
+                case_name=case_name,
+                assumptions_path=str(assumptions_path),
+                case_metadata=metadata,
+                monte_carlo_simulations=120,
+                include_mc_sensitivity=False,
+                num_workers=1,
+                generation_cache=cache,
+                **kwargs,
+            )
+
+        cache = {}
+        generate()
+        assert sorted(calls) == sorted(REQUIRED_DATA_FILE_KEYS)
+
+        # Same inputs: every output is reused and still reported
+        calls.clear()
+        result = generate()
+        assert calls == []
+        for key in REQUIRED_DATA_FILE_KEYS:
+            assert result[key] == f"{case_name}_{key}.json"
+
+        # Changed settings only invalidate the affected analysis
+        generate_all_data_module.generate_case_data(
+            case_name=case_name,
+            assumptions_path=str(assumptions_path),
+            case_metadata=metadata,
+            monte_carlo_simulations=200,
+            include_mc_sensitivity=False,
+            num_workers=1,
+            generation_cache=cache,
+        )
+        assert calls == ["monte_carlo"]
+
+        # force recomputes everything
+        calls.clear()
+        generate(force=True)
+        assert sorted(calls) == sorted(REQUIRED_DATA_FILE_KEYS)
+
+    def test_generate_case_data_runs_mc_sensitivity_outside_the_worker_pool(
+        self,
+        monkeypatch,
+        tmp_path,
+        sample_assumptions_path,
+        redirected_output_root,
+    ):
+        assumptions_path = tmp_path / "assumptions_pooled.json"
+        shutil.copyfile(sample_assumptions_path, assumptions_path)
+        case_name = analysis_module.extract_case_name(str(assumptions_path))
+        metadata = generate_all_data_module.get_case_metadata(str(assumptions_path))
+        data_dir = redirected_output_root / "website" / "data"
+        pooled = []
+        in_parent = []
+
+        def make_runner(key):
+            def runner(assumptions, case, verbose=False, **kwargs):
+                (data_dir / f"{case}_{key}.json").write_text("{}", encoding="utf-8")
+            runner.key = key
+            return runner
+
+        for key, name in [
+            ("base_case_analysis", "run_base_case_analysis"),
+            ("sensitivity", "run_sensitivity_analysis"),
+            ("sensitivity_coc", "run_cash_on_cash_sensitivity_analysis"),
+            ("sensitivity_ncf", "run_monthly_ncf_sensitivity_analysis"),
+            ("monte_carlo", "run_monte_carlo_analysis"),
+            ("loan_structure_sensitivity", "run_loan_structure_sensitivity_analysis"),
+        ]:
+            monkeypatch.setattr(generate_all_data_module, name, make_runner(key))
+
+        def mc_sensitivity_runner(assumptions, case, verbose=False, **kwargs):
+            in_parent.append("monte_carlo_sensitivity")
+            (data_dir / f"{case}_monte_carlo_sensitivity.json").write_text("{}", encoding="utf-8")
+
+        monkeypatch.setattr(
+            generate_all_data_module, "run_monte_carlo_sensitivity_analysis", mc_sensitivity_runner
+        )
+
+        # In-process stand-in for the worker pool that records what it is given
+        class RecordingExecutor(ThreadPoolExecutor):
+            def submit(self, fn, *args, **kwargs):
+                pooled.append(fn.key)
+                return super().submit(fn, *args, **kwargs)
+
+        monkeypatch.setattr(generate_all_data_module, "ProcessPoolExecutor", RecordingExecutor)
+        monkeypatch.setattr(generate_all_data_module, "PARALLEL_MIN_SIMULATIONS", 0)
+        result = generate_all_data_module.generate_case_data(
+            case_name=case_name,
+            assumptions_path=str(assumptions_path),
+            case_metadata=metadata,
+            monte_carlo_simulations=120,
+            include_mc_sensitivity=True,
+            num_workers=2,
+        )
+
+        assert sorted(pooled) == sorted(REQUIRED_DATA_FILE_KEYS)
+        assert in_parent == ["monte_carlo_sensitivity"]
+        assert result["status"] == "success"
+        assert result["monte_carlo_sensitivity"] == f"{case_name}_monte_carlo_sensitivity.json"
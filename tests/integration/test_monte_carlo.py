@@ -2,13 +2,20 @@
 Integration tests for Monte Carlo simulation workflows
 """
 
+import gzip
+import inspect
 import pytest
 import numpy as np
-from engelberg.core import create_base_case_config
+import pandas as pd
+import engelberg.monte_carlo as monte_carlo
+from engelberg.core import calculate_irrs_from_projection, create_base_case_config
 from engelberg.monte_carlo import (
     run_monte_carlo_simulation,
     calculate_statistics,
+    calculate_npv_statistics,
+    create_monte_carlo_charts,
     DistributionConfig,
+    latin_hypercube_sample,
     sample_correlated_variables
 )
 from engelberg.analysis import run_monte_carlo_analysis
@@ -36,6 +43,76 @@ class TestMonteCarloSimulation:
         assert df is not None
         assert len(df) == 500
     
+    def test_quiet_run_prints_nothing(self, sample_assumptions_path, capsys):
+        """Test that verbose=False suppresses all status output for library use."""
+        config = create_base_case_config(sample_assumptions_path)
+        df = run_monte_carlo_simulation(config, num_simulations=100, verbose=False)
+        
+        assert len(df) == 100
+        assert capsys.readouterr().out == ''
+    
+    def test_parallel_chunks_concatenated_in_order(self, sample_assumptions_path, monkeypatch):
+        """Test that sharded runs return every path once with contiguous numbering."""
+        monkeypatch.setattr(monte_carlo, '_PARALLEL_MIN_SIMULATIONS', 0)
+        config = create_base_case_config(sample_assumptions_path)
+        np.random.seed(7)
+        df = run_monte_carlo_simulation(config, num_simulations=300, use_parallel=True, num_workers=2)
+        
+        assert len(df) == 300
+        assert df['simulation'].tolist() == list(range(1, 301))
+        assert np.isfinite(df['npv']).all()
+    
+    def test_parallel_run_reproducible_with_seed(self, sample_assumptions_path, monkeypatch):
+        """Test that spawned per-chunk streams make a seeded sharded run repeatable."""
+        monkeypatch.setattr(monte_carlo, '_PARALLEL_MIN_SIMULATIONS', 0)
+        config = create_base_case_config(sample_assumptions_path)
+        runs = []
+        for _ in range(2):
+            np.random.seed(3)
+            runs.append(run_monte_carlo_simulation(config, num_simulations=200, use_parallel=True,
+                                                   num_workers=2, verbose=False))
+        
+        pd.testing.assert_frame_equal(runs[0], runs[1])
+    
+    def test_batch_uses_sampled_ramp_up_months(self, sample_assumptions_path):
+        """Test that the batch engine honors a sampled ramp-up period per path, like run_single_simulation."""
+        config = create_base_case_config(sample_assumptions_path)
+        distributions = monte_carlo.get_default_distributions()
+        np.random.seed(11)
+        samples = {name: dist.sample(6) for name, dist in distributions.items()}
+        samples['ramp_up_months'] = np.array([0.0, 2.6, 3.0, 6.4, 12.0, 24.0])
+        
+        np.random.seed(12)
+        columns = monte_carlo._simulate_batch(samples, config, use_seasonality=True, use_expense_variation=True)
+        del samples['ramp_up_months']
+        np.random.seed(12)
+        fixed = monte_carlo._simulate_batch(samples, config, use_seasonality=True, use_expense_variation=True)
+        
+        assert columns['ramp_up_months'].tolist() == [0, 3, 3, 6, 12, 24]
+        assert fixed['ramp_up_months'].tolist() == [config.projection.ramp_up_months] * 6
+        # Later ramp-ups leave fewer operating months, so the cash flows differ from the fixed run
+        assert columns['npv'][5] < fixed['npv'][5]
+    
+    def test_batch_sale_costs_follow_scalar_defaults(self, sample_assumptions_path, monkeypatch):
+        """Test that the batch IRR with sale uses the same exit-cost rates as calculate_irrs_from_projection."""
+        defaults = inspect.signature(calculate_irrs_from_projection).parameters
+        assert defaults['selling_costs_rate'].default == monte_carlo.SELLING_COSTS_RATE
+        assert defaults['capital_gains_tax_rate'].default == monte_carlo.CAPITAL_GAINS_TAX_RATE
+        assert defaults['property_transfer_tax_sale_rate'].default == monte_carlo.PROPERTY_TRANSFER_TAX_SALE_RATE
+        
+        config = create_base_case_config(sample_assumptions_path)
+        distributions = monte_carlo.get_default_distributions()
+        np.random.seed(21)
+        samples = {name: dist.sample(4) for name, dist in distributions.items() if name != 'ramp_up_months'}
+        np.random.seed(22)
+        base = monte_carlo._simulate_batch(samples, config, use_seasonality=True, use_expense_variation=True)
+        monkeypatch.setattr(monte_carlo, 'SELLING_COSTS_RATE', monte_carlo.SELLING_COSTS_RATE + 0.05)
+        np.random.seed(22)
+        costlier = monte_carlo._simulate_batch(samples, config, use_seasonality=True, use_expense_variation=True)
+        
+        assert (costlier['irr_with_sale'] < base['irr_with_sale']).all()
+        np.testing.assert_array_equal(costlier['irr_without_sale'], base['irr_without_sale'])
+    
     def test_distribution_sampling_uniform(self):
         """Test uniform distribution sampling."""
         dist = DistributionConfig(
@@ -149,6 +226,61 @@ class TestMonteCarloSimulation:
                 assert not np.isnan(value)
                 assert not np.isinf(value)
     
+    def test_raw_arrays_match_dataframe(self, sample_assumptions_path):
+        """Test that return_dataframe=False yields the same columns and NPV statistics."""
+        config = create_base_case_config(sample_assumptions_path)
+        np.random.seed(11)
+        df = run_monte_carlo_simulation(config, num_simulations=200, verbose=False)
+        np.random.seed(11)
+        columns = run_monte_carlo_simulation(config, num_simulations=200, verbose=False,
+                                             return_dataframe=False)
+        
+        assert isinstance(columns, dict)
+        assert list(columns) == list(df.columns)
+        np.testing.assert_array_equal(columns['npv'], df['npv'].to_numpy())
+        assert calculate_npv_statistics(columns['npv']) == calculate_statistics(df)['npv']
+    
+    def test_convergence_check_leaves_results_unchanged(self, sample_assumptions_path):
+        """Test that the convergence check only reports and does not alter the simulations."""
+        config = create_base_case_config(sample_assumptions_path)
+        np.random.seed(17)
+        plain = run_monte_carlo_simulation(config, num_simulations=2000, verbose=False,
+                                           use_parallel=False, return_dataframe=False)
+        np.random.seed(17)
+        checked = run_monte_carlo_simulation(config, num_simulations=2000, verbose=True,
+                                             use_parallel=False, check_convergence=True,
+                                             return_dataframe=False)
+        
+        np.testing.assert_array_equal(plain['npv'], checked['npv'])
+    
+    def test_matrix_stats_match_per_column_stats(self):
+        """Test that the stacked-matrix statistics equal per-column statistics, NaN rows included."""
+        rng = np.random.default_rng(3)
+        matrix = rng.normal(size=(3, 500))
+        matrix[1, ::9] = np.nan
+        
+        rows = monte_carlo._matrix_stats(matrix)
+        
+        for row, values in zip(rows, matrix):
+            expected = monte_carlo._array_stats(values)
+            assert row.keys() == expected.keys()
+            for key, value in expected.items():
+                assert row[key] == value, key
+    
+    def test_array_stats_match_direct_reductions(self):
+        """Test that the sort-once column statistics equal the direct numpy reductions."""
+        rng = np.random.default_rng(5)
+        values = rng.normal(size=1001)
+        values[::7] = 0.0  # zeros must not count as positive
+        
+        stats = monte_carlo._array_stats(values)
+        
+        assert stats['min'] == values.min()
+        assert stats['max'] == values.max()
+        assert stats['positive_prob'] == np.count_nonzero(values > 0) / values.size
+        assert stats['p10'] == np.percentile(values, 10)
+        assert stats['median'] == np.median(values)
+
     def test_results_within_expected_ranges(self, sample_assumptions_path):
         """Test that results are within expected ranges."""
         config = create_base_case_config(sample_assumptions_path)
@@ -226,6 +358,63 @@ class TestSampleCorrelatedVariables:
         
         assert 'var1' in samples
         assert 'var2' in samples
+    
+    def test_singular_correlation_matrix_regularized(self):
+        """Test that a singular (PSD, not PD) matrix is regularized instead of failing."""
+        distributions = {
+            'var1': DistributionConfig(
+                dist_type='normal',
+                params={'mean': 0.0, 'std': 1.0}
+            ),
+            'var2': DistributionConfig(
+                dist_type='normal',
+                params={'mean': 0.0, 'std': 1.0}
+            )
+        }
+        
+        # Perfect correlation: Cholesky fails without diagonal jitter
+        correlation_matrix = np.array([[1.0, 1.0], [1.0, 1.0]])
+        
+        samples = sample_correlated_variables(
+            distributions,
+            correlation_matrix,
+            size=500
+        )
+        
+        correlation = np.corrcoef(samples['var1'], samples['var2'])[0, 1]
+        assert correlation > 0.99
+        # Caller's matrix must not be modified by the regularization
+        assert correlation_matrix[0, 0] == 1.0
+
+
+class TestLatinHypercubeSample:
+    """Tests for latin_hypercube_sample() function."""
+    
+    def test_one_draw_per_stratum(self):
+        """Test that each variable has exactly one draw in each of the N equal strata."""
+        distributions = {
+            'a': DistributionConfig(dist_type='uniform', params={'min': 0.0, 'max': 1.0}),
+            'b': DistributionConfig(dist_type='uniform', params={'min': 10.0, 'max': 20.0}),
+        }
+        
+        samples = latin_hypercube_sample(distributions, None, size=500)
+        
+        assert np.array_equal(np.sort(np.floor(samples['a'] * 500)), np.arange(500))
+        assert np.array_equal(np.sort(np.floor((samples['b'] - 10.0) / 10.0 * 500)), np.arange(500))
+        # Strata are visited in independent random orders
+        assert not np.array_equal(np.argsort(samples['a']), np.argsort(samples['b']))
+    
+    def test_correlated_lhs_preserves_correlation(self):
+        """Test that correlated LHS produces the requested rank correlation."""
+        distributions = {
+            'x': DistributionConfig(dist_type='normal', params={'mean': 0.0, 'std': 1.0}),
+            'y': DistributionConfig(dist_type='normal', params={'mean': 0.0, 'std': 1.0}),
+        }
+        correlation_matrix = np.array([[1.0, 0.7], [0.7, 1.0]])
+        
+        samples = latin_hypercube_sample(distributions, correlation_matrix, size=2000)
+        
+        assert np.corrcoef(samples['x'], samples['y'])[0, 1] == pytest.approx(0.7, abs=0.05)
 
 
 class TestMonteCarloOutput:
@@ -247,3 +436,134 @@ class TestMonteCarloOutput:
         assert 'timestamp' in results
         assert isinstance(results['timestamp'], str)
         assert len(results['timestamp']) > 0
+    
+    def test_excel_export_sheets(self, sample_assumptions_path, tmp_path):
+        """Test that the Excel export writes the summary, sample and parameter sheets."""
+        config = create_base_case_config(sample_assumptions_path)
+        df = run_monte_carlo_simulation(config, num_simulations=100, verbose=False)
+        stats = calculate_statistics(df)
+        output_path = tmp_path / "results.xlsx"
+        
+        monte_carlo.export_to_excel(df, stats, output_path=str(output_path))
+        
+        sheets = pd.read_excel(output_path, sheet_name=None)
+        assert list(sheets) == ["Summary Statistics", "Simulation Results", "Parameter Distributions"]
+        assert sheets["Summary Statistics"]['Value'].iloc[0] == pytest.approx(stats['npv']['mean'])
+        assert list(sheets["Simulation Results"].columns) == list(df.columns)
+        assert len(sheets["Simulation Results"]) == 100
+        params = sheets["Parameter Distributions"].set_index('Parameter')
+        assert params.loc['Daily Rate (CHF)', 'Mean'] == pytest.approx(df['daily_rate'].mean())
+        assert params.loc['Occupancy Rate', 'Max'] == pytest.approx(df['occupancy_rate'].max() * 100)
+        assert params.loc['Interest Rate (%)', 'Std Dev'] == pytest.approx(df['interest_rate'].std() * 100)
+
+
+class TestMonteCarloCharts:
+    """Tests for create_monte_carlo_charts()."""
+    
+    def test_scatter_charts_subsampled(self, sample_assumptions_path, monkeypatch):
+        """Test that scatter charts are capped while histograms keep every simulation."""
+        monkeypatch.setattr(monte_carlo, '_SCATTER_MAX_POINTS', 50)
+        config = create_base_case_config(sample_assumptions_path)
+        df = run_monte_carlo_simulation(config, num_simulations=200)
+        stats = calculate_statistics(df)
+        
+        charts = dict(create_monte_carlo_charts(df, stats))
+        
+        assert len(charts['npv_distribution'].data[0].x) == 200
+        assert len(charts['npv_cumulative'].data[0].x) == 200
+        assert len(charts['occupancy_daily_scatter'].data[0].x) == 50
+        assert len(charts['interest_management_scatter'].data[0].x) == 50
+        # Hover values are passed as customdata and formatted by Plotly
+        hover = np.asarray(charts['occupancy_daily_scatter'].data[0].customdata)
+        assert hover.shape == (50, 2)
+        assert charts['occupancy_daily_scatter'].data[0].text is None
+        assert all(len(trace.x) == 50 for trace in charts['correlation_charts'].data)
+    
+    def test_quartile_boxes_leave_dataframe_unchanged(self, sample_assumptions_path):
+        """Test quartile box plots: fixed parameters get one box and df is not mutated."""
+        config = create_base_case_config(sample_assumptions_path)
+        df = run_monte_carlo_simulation(config, num_simulations=200)
+        stats = calculate_statistics(df)
+        columns_before = list(df.columns)
+        
+        charts = dict(create_monte_carlo_charts(df, stats))
+        
+        assert list(df.columns) == columns_before
+        names = [trace.name for trace in charts['npv_by_quartiles'].data]
+        # Occupancy and daily rate are sampled (4 quartiles); interest and management fee are fixed
+        assert names == ['Q1 (Low)', 'Q2', 'Q3', 'Q4 (High)'] * 2 + ['Fixed', 'Fixed']
+        assert sum(len(trace.y) for trace in charts['npv_by_quartiles'].data[:4]) == 200
+    
+    def test_base_case_reference_cached_per_config(self, sample_assumptions_path):
+        """Test that the report's base-case reference is computed once per configuration."""
+        config = create_base_case_config(sample_assumptions_path)
+        
+        first = monte_carlo._base_case_reference(config)
+        second = monte_carlo._base_case_reference(create_base_case_config(sample_assumptions_path))
+        
+        assert second is first
+        assert np.isfinite(first['npv'])
+        assert 'irr_with_sale_pct' in first['irr']
+        
+        config.financing.interest_rate += 0.01
+        assert monte_carlo._base_case_reference(config) is not first
+
+
+class TestMonteCarloReport:
+    """Tests for generate_monte_carlo_html()."""
+    
+    def test_base_case_percentile_in_report(self, sample_assumptions_path, tmp_path):
+        """Test that the report states the share of simulations at or below the base case NPV."""
+        config = create_base_case_config(sample_assumptions_path)
+        df = run_monte_carlo_simulation(config, num_simulations=200, verbose=False)
+        stats = calculate_statistics(df)
+        charts = create_monte_carlo_charts(df, stats)
+        output_path = tmp_path / "report.html"
+        
+        base_percentile = monte_carlo.base_case_percentile(df, config)
+        monte_carlo.generate_monte_carlo_html(stats, charts, config, 200, base_percentile,
+                                              output_path=str(output_path))
+        
+        base_npv = monte_carlo._base_case_reference(config)['npv']
+        expected = (df['npv'] <= base_npv).sum() / len(df) * 100
+        assert base_percentile == pytest.approx(expected)
+        html = output_path.read_text(encoding='utf-8')
+        assert f"falls at the <strong>{expected:.1f}th percentile</strong>" in html
+        assert f"meaning {expected:.1f}% of simulations" in html
+    
+    def test_stylesheet_written_next_to_report(self, sample_assumptions_path, tmp_path):
+        """Test that the report links an external stylesheet written alongside it."""
+        config = create_base_case_config(sample_assumptions_path)
+        df = run_monte_carlo_simulation(config, num_simulations=50, verbose=False)
+        stats = calculate_statistics(df)
+        charts = create_monte_carlo_charts(df, stats)
+        output_path = tmp_path / "report.html"
+        
+        monte_carlo.generate_monte_carlo_html(stats, charts, config, 50, monte_carlo.base_case_percentile(df, config),
+                                              output_path=str(output_path))
+        
+        html = output_path.read_text(encoding='utf-8')
+        css = (tmp_path / monte_carlo._REPORT_STYLESHEET).read_text(encoding='utf-8')
+        assert f'<link rel="stylesheet" href="{monte_carlo._REPORT_STYLESHEET}">' in html
+        assert '<style>' not in html
+        assert '.kpi-card' in css and '.sidebar' in css
+        # plotly.js is loaded once, from the CDN build matching the installed plotly
+        assert html.count('<script src="https://cdn.plot.ly/') == 1
+        assert f'<script src="{monte_carlo._plotly_cdn_url()}">' in html
+        assert 'plotly-latest' not in html
+        assert not (tmp_path / "report.html.gz").exists()
+    
+    def test_gzip_copy_matches_report(self, sample_assumptions_path, tmp_path):
+        """Test that the opt-in gzip copy of the report decompresses to the same bytes."""
+        config = create_base_case_config(sample_assumptions_path)
+        df = run_monte_carlo_simulation(config, num_simulations=50, verbose=False)
+        stats = calculate_statistics(df)
+        charts = create_monte_carlo_charts(df, stats)
+        output_path = tmp_path / "report.html"
+        
+        monte_carlo.generate_monte_carlo_html(stats, charts, config, 50, monte_carlo.base_case_percentile(df, config),
+                                              output_path=str(output_path), write_gzip=True)
+        
+        compressed = (tmp_path / "report.html.gz").read_bytes()
+        assert gzip.decompress(compressed) == output_path.read_bytes()
+        assert len(compressed) < output_path.stat().st_size
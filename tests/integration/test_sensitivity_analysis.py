@@ -120,6 +120,57 @@ class TestSensitivityAnalysis:
             # Impact might be calculated differently, so check it's reasonable
             assert sens['impact'] >= 0  # Impact should be non-negative
             assert abs(sens['impact'] - expected_impact) < 0.1 or sens['impact'] > 0  # Allow small differences
+    
+    def test_shared_atcf_cache_matches_uncached_run(self, sample_assumptions_path):
+        """Test that reusing Year 1 cash flows across horizons leaves the results unchanged."""
+        from engelberg.model_sensitivity import calculate_equity_irr, run_unified_sensitivity_analysis
+        
+        def run(horizon, cache):
+            return run_unified_sensitivity_analysis(
+                sample_assumptions_path, 'test_case', calculate_equity_irr, 'Equity IRR',
+                verbose=False, include_atcf=True, projection_years=horizon, atcf_cache=cache
+            )
+        
+        cache = {}
+        run(10, cache)
+        cached = run(20, cache)
+        
+        assert 'base' in cache and len(cache) > 1
+        assert cached == run(20, None)
+    
+    def test_projection_prefixes_match_per_horizon_projections(self, sample_assumptions_path):
+        """Test that horizons sliced from one long projection give the per-horizon results."""
+        from engelberg.core import HORIZONS
+        from engelberg.model_sensitivity import calculate_equity_irr, run_unified_sensitivity_analysis
+        
+        def run(horizon, cache):
+            return run_unified_sensitivity_analysis(
+                sample_assumptions_path, 'test_case', calculate_equity_irr, 'Equity IRR',
+                verbose=False, projection_years=horizon, projection_cache=cache
+            )
+        
+        cache = {}
+        for horizon in (15, 5):
+            assert run(horizon, cache) == run(horizon, None)
+        assert all(len(projection) == max(HORIZONS) for projection in cache.values())
+    
+    def test_shared_config_cache_reuses_scenario_configs(self, sample_assumptions_path):
+        """Test that low/high configurations built once are reused by later horizons."""
+        from engelberg.model_sensitivity import calculate_equity_irr, run_unified_sensitivity_analysis
+        
+        def run(horizon, cache):
+            return run_unified_sensitivity_analysis(
+                sample_assumptions_path, 'test_case', calculate_equity_irr, 'Equity IRR',
+                verbose=False, projection_years=horizon, config_cache=cache
+            )
+        
+        cache = {}
+        run(10, cache)
+        configs = dict(cache)
+        assert ('maintenance_rate', 'low') in configs and ('maintenance_rate', 'high') in configs
+        
+        assert run(20, cache) == run(20, None)
+        assert all(cache[key] is config for key, config in configs.items())
 
 
 class TestCashOnCashSensitivityAnalysis:
@@ -217,6 +268,22 @@ class TestMonthlyNCFSensitivityAnalysis:
         assert isinstance(base_result, (int, float))
         # Monthly NCF is typically negative for this investment
         assert -1000.0 < base_result < 1000.0
+    
+    def test_shared_year1_cache_matches_uncached_runs(self, sample_assumptions_path):
+        """Test that CoC and NCF runs sharing Year 1 cash flows give the uncached results."""
+        year1_cache = {}
+        coc = run_cash_on_cash_sensitivity_analysis(sample_assumptions_path, 'test_case', verbose=False,
+                                                    year1_cache=year1_cache)
+        assert 'base' in year1_cache and len(year1_cache) > 1
+        
+        # The NCF run is served entirely from the cache filled by the CoC run
+        cached_keys = set(year1_cache)
+        ncf = run_monthly_ncf_sensitivity_analysis(sample_assumptions_path, 'test_case', verbose=False,
+                                                   year1_cache=year1_cache)
+        assert set(year1_cache) == cached_keys
+        
+        assert coc == run_cash_on_cash_sensitivity_analysis(sample_assumptions_path, 'test_case', verbose=False)
+        assert ncf == run_monthly_ncf_sensitivity_analysis(sample_assumptions_path, 'test_case', verbose=False)
 
 
 class TestSensitivityAnalysisCommon:
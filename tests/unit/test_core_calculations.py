@@ -7,6 +7,7 @@ import pytest
 from engelberg.core import (
     compute_annual_cash_flows,
     compute_15_year_projection,
+    apply_sensitivity,
     BaseCaseConfig,
     FinancingParams,
     LoanTranche,
@@ -647,6 +648,18 @@ class TestLoanTrancheAndStressModeling:
         assert stress["saron_150bps"]["debt_service"] > stress["base"]["debt_service"]
         assert stress["saron_250bps"]["debt_service"] > stress["saron_150bps"]["debt_service"]
 
+    def test_projection_without_stress_results_keeps_cash_flows(self):
+        config = self._build_tranche_config()
+        full = compute_15_year_projection(config, projection_years=5)
+        lean = compute_15_year_projection(config, projection_years=5, include_stress_results=False)
+
+        assert all(year["stress_results"] is None for year in lean)
+        assert all(year["stress_results"]["overall_pass"] in (True, False) for year in full)
+        for full_year, lean_year in zip(full, lean):
+            full_year.pop("stress_results")
+            lean_year.pop("stress_results")
+            assert lean_year == full_year
+
     def test_single_rate_backward_compatibility_still_works(self):
         config = create_test_base_config(interest_rate=0.012)
         config.financing.loan_tranches = None
@@ -679,3 +692,19 @@ class TestLoanTrancheAndStressModeling:
 
         with pytest.raises(ValueError, match="saron tranche requires saron_margin"):
             load_assumptions_from_json(str(invalid_path))
+
+    def test_apply_sensitivity_copies_untouched_fields_and_tranches(self):
+        config = self._build_tranche_config()
+        modified = apply_sensitivity(config, management_fee=0.25, saron_margin=0.012)
+
+        assert modified.expenses.property_management_fee_rate == 0.25
+        assert modified.expenses.nubbing_costs_annual == config.expenses.nubbing_costs_annual
+        assert modified.expenses.vat_rate_on_gross_rental == config.expenses.vat_rate_on_gross_rental
+        assert modified.financing.furniture_chf == config.financing.furniture_chf
+        assert modified.rental.days_per_year == config.rental.days_per_year
+        assert modified.projection is config.projection
+
+        # Tranches are copied, so overrides never leak back into the base config
+        assert modified.financing.loan_tranches[0].saron_margin == 0.012
+        assert config.financing.loan_tranches[0].saron_margin == 0.009
+        assert modified.financing.loan_tranches[0] is not config.financing.loan_tranches[0]
@@ -2,10 +2,14 @@
 Unit tests for IRR, NPV, MOIC, and payback period calculations
 """
 
+import numpy as np
 import pytest
 from engelberg.core import (
     calculate_irr,
+    calculate_irr_vec,
+    calculate_npv,
     calculate_irrs_from_projection,
+    calculate_equity_irr_with_sale,
     BaseCaseConfig
 )
 from tests.fixtures.test_configs import create_test_base_config
@@ -94,6 +98,118 @@ class TestCalculateIRR:
         # Note: calculate_irr returns decimal, not percentage
         assert irr == pytest.approx(0.10, abs=0.01)
 
+    
+    def test_newton_root_zeroes_npv(self):
+        """Test that a conventional series is solved to NPV = 0 at full precision."""
+        cash_flows = [-20000.0, 5000.0, 8000.0, 12000.0] + [9000.0] * 11
+        initial_investment = 150000.0
+        sale_proceeds = 90000.0
+        
+        irr = calculate_irr(cash_flows, initial_investment, sale_proceeds)
+        
+        flows = [-initial_investment] + cash_flows
+        flows[-1] += sale_proceeds
+        npv = sum(cf / (1 + irr) ** t for t, cf in enumerate(flows))
+        assert abs(npv) < 1e-6
+    
+    def test_non_conventional_series_uses_bisection(self):
+        """Test that a series with several sign changes still finds a root in range."""
+        # Out, in, out again, in: not eligible for the Newton path
+        cash_flows = [600.0, -300.0, 900.0]
+        initial_investment = 1000.0
+        
+        irr = calculate_irr(cash_flows, initial_investment)
+        
+        flows = [-initial_investment] + cash_flows
+        npv = sum(cf / (1 + irr) ** t for t, cf in enumerate(flows))
+        assert abs(npv) < 1e-3
+
+
+class TestCalculateIRRVec:
+    """Tests for calculate_irr_vec() batch function."""
+    
+    def test_batch_matches_scalar_irr(self):
+        """Test batch IRR against calculate_irr, including no-IRR fallback paths."""
+        rng = np.random.default_rng(1)
+        cash_flows = rng.normal(-2000.0, 8000.0, size=(60, 15))
+        cash_flows[:10] = -np.abs(cash_flows[:10])  # No sign change -> fallback
+        investment = rng.uniform(1e5, 3e5, size=60)
+        sale = rng.uniform(-1e5, 6e5, size=60)
+        
+        batch = calculate_irr_vec(cash_flows, investment, sale)
+        
+        for i in range(60):
+            expected = calculate_irr(cash_flows[i].tolist(), investment[i], sale[i])
+            assert batch[i] == pytest.approx(expected, abs=1e-9)
+    
+    def test_batch_scalar_investment_without_sale(self):
+        """Test that scalar investment and zero sale broadcast across paths."""
+        cash_flows = np.array([[1100.0], [1050.0]])
+        
+        batch = calculate_irr_vec(cash_flows, 1000.0)
+        
+        assert batch.shape == (2,)
+        assert batch[0] == pytest.approx(0.10, abs=1e-6)
+        assert batch[1] == pytest.approx(0.05, abs=1e-6)
+    
+    def test_batch_outflow_only_paths_have_zero_irr(self):
+        """Test that paths without any inflow skip the test rates and match calculate_irr."""
+        rng = np.random.default_rng(4)
+        cash_flows = -rng.uniform(0.0, 5000.0, size=(20, 15))
+        
+        batch = calculate_irr_vec(cash_flows, 2e5)
+        
+        for i in range(20):
+            assert batch[i] == calculate_irr(cash_flows[i].tolist(), 2e5) == 0.0
+
+
+class TestCalculateNPV:
+    """Tests for calculate_npv() function."""
+    
+    def test_npv_matches_discount_loop(self):
+        """Test NPV against an explicit year-by-year discount loop."""
+        cash_flows = [120.0, -40.0, 300.0, 85.0]
+        initial_investment = 1000.0
+        sale_proceeds = 900.0
+        rate = 0.04
+        
+        expected = -initial_investment
+        for t, cf in enumerate(cash_flows, 1):
+            expected += cf / (1 + rate) ** t
+        expected += sale_proceeds / (1 + rate) ** len(cash_flows)
+        
+        npv = calculate_npv(cash_flows, initial_investment, rate, sale_proceeds)
+        
+        assert isinstance(npv, float)
+        assert npv == pytest.approx(expected, rel=1e-12)
+    
+    def test_npv_batch_matches_single_paths(self):
+        """Test that batched NPV with per-path rates matches single-path NPV."""
+        rng = np.random.default_rng(0)
+        cash_flows = rng.normal(5000.0, 3000.0, size=(6, 15))
+        rates = rng.uniform(0.02, 0.05, size=6)
+        sale = rng.uniform(2e5, 4e5, size=6)
+        
+        batch = calculate_npv(cash_flows, 150000.0, rates, sale)
+        
+        assert batch.shape == (6,)
+        for i in range(6):
+            single = calculate_npv(cash_flows[i], 150000.0, rates[i], sale[i])
+            assert batch[i] == pytest.approx(single, rel=1e-12)
+    
+    def test_npv_broadcasts_rate_by_scenario_grid(self):
+        """Test that (R, 1) rates against (S, years) cash flows give an (R, S) NPV grid."""
+        rng = np.random.default_rng(1)
+        cash_flows = rng.normal(5000.0, 3000.0, size=(4, 15))
+        rates = np.array([0.02, 0.03, 0.05])
+        
+        grid = calculate_npv(cash_flows, 150000.0, rates[:, None], 3e5)
+        
+        assert grid.shape == (3, 4)
+        for r, rate in enumerate(rates):
+            for s in range(4):
+                assert grid[r, s] == pytest.approx(calculate_npv(cash_flows[s], 150000.0, rate, 3e5), rel=1e-12)
+
 
 class TestCalculateIRRsFromProjection:
     """Tests for calculate_irrs_from_projection() function."""
@@ -132,6 +248,29 @@ class TestCalculateIRRsFromProjection:
         # Should be a reasonable percentage
         assert -50.0 < irr_results['equity_irr_with_sale_pct'] < 50.0
     
+    def test_single_equity_irr_matches_full_results(self, minimal_config):
+        """Test that calculate_equity_irr_with_sale returns the full function's equity IRR with sale."""
+        from engelberg.core import compute_15_year_projection
+        
+        projection = compute_15_year_projection(
+            minimal_config,
+            start_year=2026,
+            inflation_rate=0.01,
+            property_appreciation_rate=0.025
+        )
+        args = (
+            projection,
+            minimal_config.financing.total_initial_investment_per_owner,
+            projection[-1]['property_value'],
+            projection[-1]['remaining_loan_balance'],
+            minimal_config.financing.num_owners,
+            minimal_config.financing.purchase_price,
+            0.078,  # selling_costs_rate
+        )
+        
+        irr_results = calculate_irrs_from_projection(*args, 0.05, 0.03, 0.01)
+        assert calculate_equity_irr_with_sale(*args, 0.03, 0.01) == irr_results['equity_irr_with_sale_pct']
+    
     def test_equity_irr_without_sale(self, minimal_config):
         """Test Equity IRR calculation without sale."""
         from engelberg.core import compute_annual_cash_flows, compute_15_year_projection
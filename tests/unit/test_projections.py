@@ -2,11 +2,16 @@
 Unit tests for 15-year projection calculations: inflation, appreciation, loan balance reduction
 """
 
+import numpy as np
 import pytest
 from engelberg.core import (
     compute_15_year_projection,
-    compute_annual_cash_flows
+    compute_15_year_projection_vec,
+    compute_annual_cash_flows,
+    compute_annual_cash_flows_vec,
+    create_base_case_config
 )
+from engelberg.monte_carlo import _generate_maintenance_costs_batch, _resolve_market_shocks, generate_maintenance_events
 from tests.fixtures.test_configs import create_test_base_config
 from tests.conftest import assert_approximately_equal
 
@@ -393,3 +398,152 @@ class TestCompute15YearProjection:
         for year_data in projection:
             assert 'rented_nights' in year_data
             assert year_data['rented_nights'] >= 0
+
+
+class TestVectorizedProjection:
+    """Tests for the batch kernels against their scalar counterparts."""
+    
+    def test_annual_cash_flows_vec_matches_scalar(self, minimal_config):
+        """Each draw of compute_annual_cash_flows_vec equals the scalar result."""
+        ota_pct = np.array([0.3, 0.5, 0.7])
+        tax_rate = np.array([0.2, 0.3, 0.4])
+        cleaning = np.array([0.0, 80.0, 120.0])
+        batch = compute_annual_cash_flows_vec(
+            minimal_config,
+            operational_months=9,
+            ota_booking_percentage=ota_pct,
+            marginal_tax_rate=tax_rate,
+            cleaning_cost_per_stay=cleaning
+        )
+        
+        for i in range(3):
+            scalar = compute_annual_cash_flows(
+                minimal_config,
+                operational_months=9,
+                ota_booking_percentage=ota_pct[i],
+                marginal_tax_rate=tax_rate[i],
+                cleaning_cost_per_stay=cleaning[i]
+            )
+            for key in ('gross_rental_income', 'cleaning_cost', 'net_operating_income',
+                        'cash_flow_per_owner', 'tax_liability', 'after_tax_cash_flow_per_owner'):
+                assert batch[key][i] == pytest.approx(scalar[key], rel=1e-12, abs=1e-9)
+    
+    def test_projection_vec_matches_scalar(self, sample_assumptions_path):
+        """Time-varying rates, events and refinancing reproduce the scalar projection."""
+        config = create_base_case_config(sample_assumptions_path)
+        rng = np.random.default_rng(7)
+        n, years = 4, 15
+        inflation = rng.uniform(0.0, 0.03, (n, years))
+        appreciation = rng.uniform(-0.02, 0.09, (n, years))
+        inflation_factors = np.ones((n, years))
+        appreciation_factors = np.ones((n, years))
+        inflation_factors[:, 1:] = np.cumprod(1 + inflation[:, :-1], axis=1)
+        appreciation_factors[:, 1:] = np.cumprod(1 + appreciation[:, :-1], axis=1)
+        maintenance_costs = np.zeros((n, years))
+        maintenance_costs[1, 4] = 20000.0
+        rate_paths = np.full((n, years), config.financing.effective_saron_base_rate)
+        refinancing_costs = np.zeros((n, years))
+        rate_paths[2, 5:] = 0.001
+        refinancing_costs[2, 5] = 5000.0
+        
+        batch = compute_15_year_projection_vec(
+            config,
+            inflation_factors=inflation_factors,
+            appreciation_factors=appreciation_factors,
+            ramp_up_months=3,
+            renovation_downtime_months=3,
+            renovation_frequency_years=5,
+            maintenance_costs=maintenance_costs,
+            interest_rate_paths=rate_paths,
+            refinancing_costs=refinancing_costs
+        )
+        
+        for i in range(n):
+            projection = compute_15_year_projection(
+                config,
+                ramp_up_months=3,
+                renovation_downtime_months=3,
+                renovation_frequency_years=5,
+                inflation_series=list(inflation[i]),
+                appreciation_series=list(appreciation[i]),
+                maintenance_events=[(5, 20000.0)] if i == 1 else None,
+                refinancing_events={6: {'refinance': True, 'new_rate': 0.001, 'refinancing_cost': 5000.0}} if i == 2 else None
+            )
+            for key in ('property_value', 'net_operating_income', 'interest_payment', 'cash_flow_per_owner'):
+                expected = [year[key] for year in projection]
+                assert batch[key][i] == pytest.approx(expected, rel=1e-12)
+            assert batch['remaining_loan_balance'] == pytest.approx(
+                [year['remaining_loan_balance'] for year in projection], rel=1e-12
+            )
+    
+    def test_projection_vec_per_draw_ramp_up_matches_scalar(self, sample_assumptions_path):
+        """A per-draw ramp-up array gives each draw the scalar projection with its own ramp-up."""
+        config = create_base_case_config(sample_assumptions_path)
+        ramp_ups = np.array([0, 3, 14, 3])
+        n, years = len(ramp_ups), 15
+        
+        batch = compute_15_year_projection_vec(
+            config,
+            inflation_factors=np.ones((n, years)),
+            appreciation_factors=np.ones((n, years)),
+            ramp_up_months=ramp_ups,
+            renovation_downtime_months=3,
+            renovation_frequency_years=5
+        )
+        
+        assert batch['operational_months'].shape == (n, years)
+        for i, ramp_up in enumerate(ramp_ups):
+            projection = compute_15_year_projection(
+                config,
+                ramp_up_months=int(ramp_up),
+                renovation_downtime_months=3,
+                renovation_frequency_years=5,
+                inflation_rate=0.0,
+                property_appreciation_rate=0.0
+            )
+            assert batch['operational_months'][i].tolist() == [year['operational_months'] for year in projection]
+            assert batch['cash_flow_per_owner'][i] == pytest.approx(
+                [year['cash_flow_per_owner'] for year in projection], rel=1e-12
+            )
+    
+    def test_market_shock_replay_matches_scalar(self, minimal_config):
+        """Resolved shock multipliers follow the scalar shock/recovery schedule."""
+        years = 15
+        occurred = np.zeros((1, years), dtype=bool)
+        occurred[0, [2, 4, 11]] = True
+        occupancy_mult = np.full((1, years), 0.6)
+        rate_mult = np.full((1, years), 0.75)
+        value_mult = np.full((1, years), 0.85)
+        recovery = np.array([[3] * years])
+        occ, rate, value = _resolve_market_shocks(occurred, occupancy_mult, rate_mult, value_mult, recovery)
+        
+        batch = compute_15_year_projection_vec(
+            minimal_config,
+            inflation_factors=np.ones((1, years)),
+            appreciation_factors=np.ones((1, years)),
+            occupancy_multipliers=occ,
+            rate_multipliers=rate,
+            value_multipliers=value
+        )
+        shocks = {
+            year: {'shock_occurred': True, 'occupancy_multiplier': 0.6, 'rate_multiplier': 0.75,
+                   'value_multiplier': 0.85, 'recovery_years': 3}
+            for year in (3, 5, 12)
+        }
+        projection = compute_15_year_projection(
+            minimal_config, inflation_rate=0.0, property_appreciation_rate=0.0, market_shocks=shocks
+        )
+        
+        assert batch['gross_rental_income'][0] == pytest.approx([y['gross_rental_income'] for y in projection], rel=1e-12)
+        assert batch['property_value'][0] == pytest.approx([y['property_value'] for y in projection], rel=1e-12)
+    
+    def test_maintenance_events_match_batch_sampler(self):
+        """Scalar maintenance events are one path of the batch sampler under the same seed."""
+        np.random.seed(8)
+        events = generate_maintenance_events(num_years=40, lambda_rate=0.3)
+        np.random.seed(8)
+        costs = _generate_maintenance_costs_batch(1, 40, 0.3)[0]
+        
+        assert events == [(year, cost) for year, cost in enumerate(costs.tolist(), start=1) if cost > 0]
+        assert events
+        assert all(5000 <= cost <= 50000 for _, cost in events)